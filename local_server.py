@@ -0,0 +1,224 @@
+"""Local HTTP listeners: the OAuth callback page and the webhook receiver endpoint.
+
+Imported by the server only when one of them starts, so a server with a
+cached token never loads ``http.server`` or ``webbrowser``.
+"""
+import logging
+import secrets
+import threading
+import webbrowser
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from typing import Callable, Optional
+from urllib.parse import urlparse, parse_qs
+
+logger = logging.getLogger("trello-mcp-server")
+
+# Global variable to store token from callback
+_callback_token = None
+_callback_event = None
+_oauth_state = None
+
+
+class ReuseAddrHTTPServer(HTTPServer):
+    """HTTPServer that allows address reuse."""
+    allow_reuse_address = True
+
+
+class OAuthCallbackHandler(BaseHTTPRequestHandler):
+    """Handle OAuth callback from Trello."""
+
+    def log_message(self, format, *args):
+        """Suppress default logging."""
+        pass
+
+    def do_GET(self):
+        """Handle both initial request and callback with token."""
+        global _callback_token, _callback_event, _oauth_state
+
+        parsed = urlparse(self.path)
+
+        # Check if token is in query params (from JavaScript callback)
+        params = parse_qs(parsed.query)
+        if 'token' in params:
+            # Validate state parameter for CSRF protection
+            received_state = params.get('state', [None])[0]
+            if received_state != _oauth_state:
+                logger.error("OAuth state mismatch - possible CSRF attack")
+                self.send_response(400)
+                self.send_header('Content-type', 'text/html')
+                self.end_headers()
+                html = """
+                <html>
+                <head><title>Trello Authorization - Error</title></head>
+                <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px;">
+                    <h2 style="color: #c9372c;">✗ Authorization Failed</h2>
+                    <p>Invalid authorization request. This may be a CSRF attack attempt.</p>
+                    <p>Please close this window and try authenticating again.</p>
+                </body>
+                </html>
+                """
+                self.wfile.write(html.encode())
+                return
+            
+            _callback_token = params['token'][0]
+            if _callback_event:
+                _callback_event.set()
+
+            self.send_response(200)
+            self.send_header('Content-type', 'text/html')
+            self.end_headers()
+            html = """
+            <html>
+            <head><title>Trello Authorization - Success</title></head>
+            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px;">
+                <h2 style="color: #0079bf;">✓ Authorization Successful!</h2>
+                <p>Your Trello token has been received and saved.</p>
+                <p>You can close this window and return to Kiro.</p>
+                <p style="color: #666; font-size: 14px; margin-top: 30px;">The Trello MCP server is now ready to use.</p>
+            </body>
+            </html>
+            """
+            self.wfile.write(html.encode())
+            return
+
+        # Initial request - send HTML to extract token from URL fragment
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.end_headers()
+        html = f"""
+        <html>
+        <head><title>Trello Authorization</title></head>
+        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px;">
+            <h2 style="color: #0079bf;">Processing authorization...</h2>
+            <p>Please wait while we capture your token...</p>
+            <script>
+                // Extract token from URL fragment (Trello redirects with #token=...)
+                const hash = window.location.hash.substring(1);
+                const params = new URLSearchParams(hash);
+                const token = params.get('token');
+
+                if (token) {{
+                    // Send token to server via query param with state for CSRF protection
+                    fetch('/?token=' + encodeURIComponent(token) + '&state=' + encodeURIComponent('{_oauth_state}'))
+                        .then(response => response.text())
+                        .then(html => {{
+                            document.open();
+                            document.write(html);
+                            document.close();
+                        }})
+                        .catch(err => {{
+                            document.body.innerHTML = '<h2 style="color: #c9372c;">✗ Error</h2><p>Failed to send token to server: ' + err.message + '</p>';
+                        }});
+                }} else {{
+                    document.body.innerHTML = '<h2 style="color: #c9372c;">✗ No Token Found</h2><p>No token was found in the URL. Please try the authorization process again.</p>';
+                }}
+            </script>
+        </body>
+        </html>
+        """
+        self.wfile.write(html.encode())
+
+
+def capture_token(auth_url_for: Callable[[str], str], port: int = 8765, timeout: float = 120) -> Optional[str]:
+    """Run the browser OAuth flow and return the token Trello redirects back with.
+
+    Starts the callback server on ``port``, opens ``auth_url_for(return_url)``
+    in the browser and waits up to ``timeout`` seconds for the callback.
+    """
+    global _callback_token, _callback_event, _oauth_state
+
+    _callback_token = None
+    _callback_event = threading.Event()
+    # Generate CSRF protection state parameter
+    _oauth_state = secrets.token_urlsafe(32)
+
+    server = None
+    try:
+        # Start local server
+        logger.info(f"Starting local OAuth callback server on port {port}...")
+        server = ReuseAddrHTTPServer(('localhost', port), OAuthCallbackHandler)
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
+        logger.info("OAuth callback server started successfully")
+
+        # Generate auth URL with callback
+        return_url = f"http://localhost:{port}"
+        auth_url = auth_url_for(return_url)
+
+        # Open browser
+        logger.info(f"Authorization URL: {auth_url}")
+        logger.info("Attempting to open browser...")
+
+        try:
+            webbrowser.open(auth_url)
+            logger.info("Browser open command sent")
+        except Exception as e:
+            logger.error(f"Failed to open browser: {e}")
+            logger.error(f"Please manually visit: {auth_url}")
+
+        # Wait for callback (with timeout)
+        logger.info(f"Waiting for authorization (timeout: {timeout:.0f} seconds)...")
+        if _callback_event.wait(timeout=timeout):
+            logger.info("Received authorization callback")
+            token = _callback_token
+            if token:
+                logger.info(f"Token received: {token[:8]}...")
+                return token
+            else:
+                logger.error("Callback received but no token found")
+        else:
+            logger.error(f"Authorization timeout - no response received within {timeout:.0f} seconds")
+
+    except Exception as e:
+        logger.error(f"Error during interactive authorization: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+
+    finally:
+        # Always clean up the server
+        if server:
+            try:
+                server.shutdown()
+                server.server_close()
+                logger.info("OAuth callback server shut down")
+            except Exception as e:
+                logger.warning(f"Error shutting down OAuth server: {e}")
+
+    return None
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """Handle Trello webhook deliveries."""
+
+    def log_message(self, format, *args):
+        """Suppress default logging."""
+        pass
+
+    def do_HEAD(self):
+        """Answer the check Trello makes when a webhook is created."""
+        self.send_response(200)
+        self.end_headers()
+
+    def do_POST(self):
+        """Accept one action delivery."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.server.max_body:
+            self.send_response(413)
+            self.end_headers()
+            return
+        body = self.rfile.read(length)
+        status = self.server.receiver.receive(self.path, body, self.headers.get("X-Trello-Webhook"))
+        self.send_response(status)
+        self.end_headers()
+
+
+def start_webhook_server(receiver, host: str, port: int, max_body: int) -> HTTPServer:
+    """Serve webhook deliveries to ``receiver.receive`` on a daemon thread."""
+    server = ReuseAddrHTTPServer((host, port), WebhookHandler)
+    server.receiver = receiver
+    server.max_body = max_body
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
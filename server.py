@@ -1,144 +1,194 @@
 """Trello MCP Server implementation."""
 import os
 import json
+import sqlite3
+import asyncio
+import functools
+import hashlib
+import hmac
+import base64
+import weakref
+import bisect
+import codecs
+import contextlib
+import contextvars
+import itertools
+from collections import OrderedDict
 import logging
-import socket
-import webbrowser
-import secrets
+import importlib
 import re
+import time
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Optional
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, urlencode
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server import Server
 from mcp.types import Tool, TextContent
-import mcp.server.stdio
-import requests
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("trello-mcp-server")
 
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Keeps modules the server may never need (the HTTP client stack before
+    the first API call) out of its startup time.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+requests = _LazyModule("requests")
+
 # Trello API configuration
 TRELLO_API_BASE = "https://api.trello.com/1"
 TOKEN_CACHE_FILE = Path.home() / ".trello_mcp_token.json"
 
-app = Server("trello-mcp-server")
 
-# Global variable to store token from callback
-_callback_token = None
-_callback_event = None
-_oauth_state = None
-
-
-class ReuseAddrHTTPServer(HTTPServer):
-    """HTTPServer that allows address reuse."""
-    allow_reuse_address = True
-
-
-class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """Handle OAuth callback from Trello."""
-
-    def log_message(self, format, *args):
-        """Suppress default logging."""
-        pass
-
-    def do_GET(self):
-        """Handle both initial request and callback with token."""
-        global _callback_token, _callback_event, _oauth_state
-
-        parsed = urlparse(self.path)
-
-        # Check if token is in query params (from JavaScript callback)
-        params = parse_qs(parsed.query)
-        if 'token' in params:
-            # Validate state parameter for CSRF protection
-            received_state = params.get('state', [None])[0]
-            if received_state != _oauth_state:
-                logger.error("OAuth state mismatch - possible CSRF attack")
-                self.send_response(400)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                html = """
-                <html>
-                <head><title>Trello Authorization - Error</title></head>
-                <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px;">
-                    <h2 style="color: #c9372c;">✗ Authorization Failed</h2>
-                    <p>Invalid authorization request. This may be a CSRF attack attempt.</p>
-                    <p>Please close this window and try authenticating again.</p>
-                </body>
-                </html>
-                """
-                self.wfile.write(html.encode())
-                return
-            
-            _callback_token = params['token'][0]
-            if _callback_event:
-                _callback_event.set()
-
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            html = """
-            <html>
-            <head><title>Trello Authorization - Success</title></head>
-            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px;">
-                <h2 style="color: #0079bf;">✓ Authorization Successful!</h2>
-                <p>Your Trello token has been received and saved.</p>
-                <p>You can close this window and return to Kiro.</p>
-                <p style="color: #666; font-size: 14px; margin-top: 30px;">The Trello MCP server is now ready to use.</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode())
-            return
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid value for {name}: {value!r}")
+        return default
 
-        # Initial request - send HTML to extract token from URL fragment
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        html = f"""
-        <html>
-        <head><title>Trello Authorization</title></head>
-        <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 50px auto; padding: 20px;">
-            <h2 style="color: #0079bf;">Processing authorization...</h2>
-            <p>Please wait while we capture your token...</p>
-            <script>
-                // Extract token from URL fragment (Trello redirects with #token=...)
-                const hash = window.location.hash.substring(1);
-                const params = new URLSearchParams(hash);
-                const token = params.get('token');
-
-                if (token) {{
-                    // Send token to server via query param with state for CSRF protection
-                    fetch('/?token=' + encodeURIComponent(token) + '&state=' + encodeURIComponent('{_oauth_state}'))
-                        .then(response => response.text())
-                        .then(html => {{
-                            document.open();
-                            document.write(html);
-                            document.close();
-                        }})
-                        .catch(err => {{
-                            document.body.innerHTML = '<h2 style="color: #c9372c;">✗ Error</h2><p>Failed to send token to server: ' + err.message + '</p>';
-                        }});
-                }} else {{
-                    document.body.innerHTML = '<h2 style="color: #c9372c;">✗ No Token Found</h2><p>No token was found in the URL. Please try the authorization process again.</p>';
-                }}
-            </script>
-        </body>
-        </html>
-        """
-        self.wfile.write(html.encode())
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid value for {name}: {value!r}")
+        return default
 
 
+# HTTP connection pool configuration
+POOL_MAXSIZE = _env_int("TRELLO_POOL_MAXSIZE", 10)
+POOL_IDLE_TIMEOUT = _env_float("TRELLO_POOL_IDLE_TIMEOUT", 30.0)
+REQUEST_TIMEOUT = 30
 
+# Listings longer than this many characters are split into pages (0 disables)
+MAX_RESPONSE_CHARS = _env_int("TRELLO_MAX_RESPONSE_CHARS", 50000)
+
+# Decode large card listings element by element as they arrive instead of
+# holding the whole response (opt-in; streamed listings are not cached)
+STREAM_JSON = os.getenv("TRELLO_STREAM_JSON", "").lower() in ("1", "true", "yes")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bulk tools run this many requests at once (the rate limiter still paces
+# them) and accept at most this many items per call
+BULK_CONCURRENCY = _env_int("TRELLO_BULK_CONCURRENCY", 10)
+BULK_MAX_ITEMS = 500
+
+# While the browser authorization runs in the background, tool calls wait
+# this many seconds for it before answering with an "authorizing" status
+AUTH_WAIT_TIMEOUT = _env_float("TRELLO_AUTH_WAIT_TIMEOUT", 15.0)
+
+# Trello rate limits: requests allowed per interval, per token and per API key
+RATE_LIMIT_PER_TOKEN = _env_int("TRELLO_RATE_LIMIT_PER_TOKEN", 100)
+RATE_LIMIT_PER_KEY = _env_int("TRELLO_RATE_LIMIT_PER_KEY", 300)
+RATE_LIMIT_INTERVAL = 10.0
+
+# Retry policy for transient failures
+RETRY_MAX_ATTEMPTS = _env_int("TRELLO_RETRY_MAX_ATTEMPTS", 4)
+RETRY_BASE_DELAY = _env_float("TRELLO_RETRY_BASE_DELAY", 0.5)
+RETRY_MAX_DELAY = _env_float("TRELLO_RETRY_MAX_DELAY", 8.0)
+REQUEST_DEADLINE = _env_float("TRELLO_REQUEST_DEADLINE", 60.0)
+
+# Concurrent GETs are combined into /1/batch calls within this window
+BATCH_WINDOW = _env_float("TRELLO_BATCH_WINDOW_MS", 5.0) / 1000
+BATCH_MAX_SIZE = 10  # Trello's limit on routes per batch call
+
+# In-process response cache for GET requests
+CACHE_MAX_BYTES = _env_int("TRELLO_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+CACHE_DEFAULT_TTL = _env_float("TRELLO_CACHE_TTL", 30.0)
+
+# Per-endpoint cache lifetimes in seconds; the first matching pattern wins.
+# Structure (lists, labels, members, organizations) changes rarely; cards
+# change often and fall back to the default.
+CACHE_TTLS = [
+    (re.compile(r"^/boards/[^/]+/(labels|members)$"), 300.0),
+    (re.compile(r"^/boards/[^/]+/lists$"), 120.0),
+    (re.compile(r"^/boards/[^/]+$"), 120.0),
+    (re.compile(r"^/members/me/(boards|organizations)$"), 120.0),
+    (re.compile(r"^/organizations/[^/]+(/boards|/members)?$"), 300.0),
+    (re.compile(r"^/members/[^/]+$"), 600.0),
+    (re.compile(r"^/labels/[^/]+$"), 300.0),
+    (re.compile(r"^/boards/[^/]+/actions$"), 0.0),  # Read once by the board sync
+]
+
+# Optional on-disk cache so a restarted server can answer right away
+PERSISTENT_CACHE_ENABLED = os.getenv("TRELLO_PERSISTENT_CACHE", "").lower() in ("1", "true", "yes")
+PERSISTENT_CACHE_FILE = TOKEN_CACHE_FILE.with_name(".trello_mcp_cache.sqlite3")
+PERSISTENT_CACHE_MAX_BYTES = _env_int("TRELLO_PERSISTENT_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+
+# Endpoints kept on disk: boards, lists, labels and members
+PERSISTENT_CACHE_PATTERNS = [
+    re.compile(r"^/members/me/boards$"),
+    re.compile(r"^/boards/[^/]+(/lists|/labels|/members)?$"),
+    re.compile(r"^/members/[^/]+$"),
+]
+
+# Board sync: read tools answer from a local copy of each board that is
+# refreshed from the board's action log instead of re-downloaded
+BOARD_SYNC_ENABLED = os.getenv("TRELLO_BOARD_SYNC", "1").lower() not in ("0", "false", "no")
+SYNC_INTERVAL = _env_float("TRELLO_SYNC_INTERVAL", 5.0)
+SYNC_ACTIONS_LIMIT = 1000  # Trello's page size limit for actions
+SYNC_CARD_FIELDS = "name,idList,idLabels,idMembers,due,dueComplete,closed"
+
+# Optional webhook receiver: Trello pushes board actions to a local
+# listener (exposed through a tunnel at TRELLO_WEBHOOK_URL)
+WEBHOOK_PORT = _env_int("TRELLO_WEBHOOK_PORT", 0)
+WEBHOOK_HOST = os.getenv("TRELLO_WEBHOOK_HOST", "localhost")
+WEBHOOK_URL = os.getenv("TRELLO_WEBHOOK_URL", "")
+WEBHOOK_SECRET = os.getenv("TRELLO_API_SECRET", "")
+WEBHOOK_SYNC_INTERVAL = _env_float("TRELLO_WEBHOOK_SYNC_INTERVAL", 300.0)
+WEBHOOK_MAX_BODY = 1024 * 1024
+
+# MCP transport: "stdio" (one client per process) or "http" (streamable
+# HTTP; many concurrent sessions share this process's pools and caches)
+MCP_TRANSPORT = os.getenv("TRELLO_MCP_TRANSPORT", "stdio").lower()
+MCP_HOST = os.getenv("TRELLO_MCP_HOST", "127.0.0.1")
+MCP_PORT = _env_int("TRELLO_MCP_PORT", 8000)
+MCP_PATH = "/mcp"
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+# Multi-tenant HTTP mode: clients may send their own Trello identity in
+# these headers; each token gets its own connection pool, cache namespace
+# and rate budget. Without them calls use the server's own credentials,
+# unless TRELLO_MCP_REQUIRE_TOKEN is set.
+TOKEN_HEADER = "x-trello-token"
+API_KEY_HEADER = "x-trello-api-key"
+MCP_REQUIRE_TOKEN = os.getenv("TRELLO_MCP_REQUIRE_TOKEN", "").lower() in ("1", "true", "yes")
+TENANT_POOLS_MAX = _env_int("TRELLO_TENANT_POOLS_MAX", 64)
+
+app = Server("trello-mcp-server")
 
 class TrelloAuth:
     """Manage Trello authentication."""
     
-    def __init__(self):
-        self.api_key = os.getenv("TRELLO_API_KEY")
-        self.token = os.getenv("TRELLO_TOKEN")
+    def __init__(self, api_key: Optional[str] = None, token: Optional[str] = None):
+        self.api_key = api_key or os.getenv("TRELLO_API_KEY")
+        self.token = token or os.getenv("TRELLO_TOKEN")
         # Only use env token if it's not empty
         if not self.token:
             self._load_cached_token()
@@ -205,68 +255,12 @@ class TrelloAuth:
     
     def authorize_interactive(self, api_key: str, app_name: str = "Trello MCP Server", port: int = 8765) -> Optional[str]:
         """Start OAuth flow with automatic browser opening and token capture."""
-        global _callback_token, _callback_event, _oauth_state
-        
-        _callback_token = None
-        _callback_event = threading.Event()
-        # Generate CSRF protection state parameter
-        _oauth_state = secrets.token_urlsafe(32)
-        
-        server = None
-        try:
-            # Start local server
-            logger.info(f"Starting local OAuth callback server on port {port}...")
-            server = ReuseAddrHTTPServer(('localhost', port), OAuthCallbackHandler)
-            server_thread = threading.Thread(target=server.serve_forever)
-            server_thread.daemon = True
-            server_thread.start()
-            logger.info("OAuth callback server started successfully")
-            
-            # Generate auth URL with callback
-            return_url = f"http://localhost:{port}"
-            auth_url = self.get_auth_url(api_key, app_name, return_url)
-            
-            # Open browser
-            logger.info(f"Authorization URL: {auth_url}")
-            logger.info("Attempting to open browser...")
-            
-            try:
-                webbrowser.open(auth_url)
-                logger.info("Browser open command sent")
-            except Exception as e:
-                logger.error(f"Failed to open browser: {e}")
-                logger.error(f"Please manually visit: {auth_url}")
-            
-            # Wait for callback (with timeout)
-            logger.info("Waiting for authorization (timeout: 120 seconds)...")
-            if _callback_event.wait(timeout=120):  # 2 minute timeout
-                logger.info("Received authorization callback")
-                token = _callback_token
-                if token:
-                    logger.info(f"Token received: {token[:8]}...")
-                    self.set_credentials(api_key, token)
-                    return token
-                else:
-                    logger.error("Callback received but no token found")
-            else:
-                logger.error("Authorization timeout - no response received within 120 seconds")
-            
-        except Exception as e:
-            logger.error(f"Error during interactive authorization: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-        
-        finally:
-            # Always clean up the server
-            if server:
-                try:
-                    server.shutdown()
-                    server.server_close()
-                    logger.info("OAuth callback server shut down")
-                except Exception as e:
-                    logger.warning(f"Error shutting down OAuth server: {e}")
-        
-        return None
+        # The callback server and browser code load only for this flow
+        from local_server import capture_token
+        token = capture_token(lambda return_url: self.get_auth_url(api_key, app_name, return_url), port)
+        if token:
+            self.set_credentials(api_key, token)
+        return token
     
     def is_authenticated(self) -> bool:
         """Check if we have valid credentials."""
@@ -276,7 +270,138 @@ class TrelloAuth:
         """Get current credentials."""
         return self.api_key, self.token
 
-auth = TrelloAuth()
+_lazy_lock = threading.Lock()
+
+# Credentials of the MCP session a tool call belongs to (set by call_tool)
+_session_auth: contextvars.ContextVar = contextvars.ContextVar("trello_session_auth", default=None)
+
+
+def get_auth() -> TrelloAuth:
+    """Return the credentials for the current tool call.
+
+    That is the calling session's own identity in multi-tenant HTTP mode,
+    otherwise the process-wide ``TrelloAuth``.
+    """
+    return _session_auth.get() or _process_auth()
+
+
+def _process_auth() -> TrelloAuth:
+    """Return the process-wide ``TrelloAuth``, loading credentials on first use."""
+    instance = globals().get("auth")
+    if instance is None:
+        with _lazy_lock:
+            instance = globals().get("auth")
+            if instance is None:
+                instance = globals()["auth"] = TrelloAuth()
+    return instance
+
+
+class BackgroundAuthorization:
+    """Browser authorization running alongside the MCP session.
+
+    When no token is cached ``main()`` starts the OAuth flow on a daemon
+    thread instead of blocking before the stdio session, so the client's
+    initialize handshake and ``list_tools`` are answered right away. Tool
+    calls wait for the flow through ``ready()``.
+    """
+
+    def __init__(self):
+        self.future: Optional[asyncio.Future] = None
+
+    def start(self, api_key: str):
+        """Run ``authorize_interactive`` without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        self.future = loop.create_future()
+
+        def authorize():
+            token = None
+            try:
+                token = get_auth().authorize_interactive(api_key)
+            except Exception as e:
+                logger.error(f"Error during background authorization: {e}")
+            try:
+                loop.call_soon_threadsafe(self._finish, token)
+            except RuntimeError:
+                pass  # The server shut down first
+
+        threading.Thread(target=authorize, name="trello-oauth", daemon=True).start()
+
+    def _finish(self, token: Optional[str]):
+        if not self.future.done():
+            self.future.set_result(token)
+        if token:
+            logger.info("")
+            logger.info("=" * 70)
+            logger.info("✓ AUTHENTICATION SUCCESSFUL!")
+            logger.info("=" * 70)
+            logger.info(f"Credentials saved to: {TOKEN_CACHE_FILE}")
+            logger.info("")
+            return
+        logger.error("")
+        logger.error("=" * 70)
+        logger.error("AUTHENTICATION FAILED")
+        logger.error("=" * 70)
+        logger.error("Authorization timed out or was cancelled.")
+        logger.error("")
+        logger.error("The browser should have opened. If not, you can:")
+        logger.error("1. Check if a browser window opened in the background")
+        logger.error("2. Use manual authentication:")
+        logger.error("   python auth.py --interactive")
+        logger.error("=" * 70)
+
+    async def ready(self, timeout: float) -> Optional[str]:
+        """Wait up to ``timeout`` seconds for a running authorization.
+
+        Returns None when the tool call can go ahead, otherwise the status
+        message to answer it with.
+        """
+        if get_auth().is_authenticated() or self.future is None:
+            return None
+        try:
+            await asyncio.wait_for(asyncio.shield(self.future), timeout)
+        except asyncio.TimeoutError:
+            return ("Authorizing: waiting for you to allow access to Trello in the browser window "
+                    "this server opened. Retry this request once you have approved it.")
+        if get_auth().is_authenticated():
+            return None
+        return ("Error: Trello authorization failed or timed out. Restart the server to try again, "
+                "or run: python auth.py --interactive")
+
+
+authorization = BackgroundAuthorization()
+
+# Identity each HTTP session presented, so requests that omit the headers keep it
+_session_credentials = weakref.WeakKeyDictionary()
+
+
+def session_credentials() -> Optional[TrelloAuth]:
+    """Return the Trello identity the calling HTTP session presented.
+
+    Read from the ``X-Trello-Token`` (and optional ``X-Trello-Api-Key``)
+    headers of the current request and remembered for the session. Returns
+    None over stdio and for sessions without a token of their own, which
+    then use the server's credentials. Raises ValueError for the latter
+    when TRELLO_MCP_REQUIRE_TOKEN is set, and for a token that comes with
+    no API key when the server has none either.
+    """
+    try:
+        context = app.request_context
+    except LookupError:
+        return None
+    headers = getattr(getattr(context, "request", None), "headers", None)
+    if headers is None:
+        return None  # stdio carries no request headers
+    token = headers.get(TOKEN_HEADER)
+    known = _session_credentials.get(context.session)
+    if token:
+        api_key = headers.get(API_KEY_HEADER) or _process_auth().api_key
+        if not api_key:
+            raise ValueError("This server has no Trello API key; send yours in the X-Trello-Api-Key header.")
+        if known is None or known.get_credentials() != (api_key, token):
+            known = _session_credentials[context.session] = TrelloAuth(api_key, token)
+    elif known is None and MCP_REQUIRE_TOKEN:
+        raise ValueError("This server requires your own Trello token in the X-Trello-Token header.")
+    return known
 
 def validate_trello_id(id_value: str, id_type: str = "ID") -> str:
     """Validate Trello ID format for security.
@@ -301,879 +426,4381 @@ def validate_trello_id(id_value: str, id_type: str = "ID") -> str:
     
     return id_value
 
-def make_trello_request(method: str, endpoint: str, params: dict = None, data: dict = None) -> dict:
-    """Make a request to the Trello API."""
-    if not auth.is_authenticated():
-        raise ValueError(
-            "Not authenticated. Use 'authorize_interactive' for automatic authentication "
-            "or 'get_auth_url' + 'set_token' for manual setup."
+
+def validate_fields(fields: str) -> str:
+    """Validate a comma-separated list of Trello field names.
+
+    Raises:
+        ValueError: If the list contains anything but field names
+    """
+    if not re.match(r'^[a-zA-Z0-9_]+(,[a-zA-Z0-9_]+)*$', fields or ""):
+        raise ValueError("Invalid fields format. Must be comma-separated field names")
+    return fields
+
+
+def validate_limit(limit: Any) -> int:
+    """Validate a page size argument.
+
+    Raises:
+        ValueError: If the limit is not a positive integer
+    """
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError("Invalid limit. Must be a positive integer")
+    return limit
+
+
+def _make_cursor(offset: int, anchor_id: str) -> str:
+    """Encode the position of the next page: its offset and first item id."""
+    return base64.urlsafe_b64encode(f"{offset}:{anchor_id}".encode()).decode().rstrip("=")
+
+
+def validate_cursor(cursor: str) -> tuple:
+    """Decode a pagination cursor into ``(offset, anchor_id)``.
+
+    Raises:
+        ValueError: If the cursor was not produced by this server
+    """
+    try:
+        offset, anchor_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":", 1)
+        return int(offset), validate_trello_id(anchor_id)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor. Pass the cursor from a previous page unchanged")
+
+
+def _checked_cursor(cursor: str) -> str:
+    """Validate a cursor argument, keeping it encoded for the handler."""
+    validate_cursor(cursor)
+    return cursor
+
+
+# Validators for the arguments tools share, each returning the checked
+# value; call_tool applies those a tool's schema declares, in this order
+ARGUMENT_VALIDATORS = {
+    "board_id": functools.partial(validate_trello_id, id_type="Board ID"),
+    "list_id": functools.partial(validate_trello_id, id_type="List ID"),
+    "card_id": functools.partial(validate_trello_id, id_type="Card ID"),
+    "member_id": functools.partial(validate_trello_id, id_type="Member ID"),
+    "organization_id": functools.partial(validate_trello_id, id_type="Organization ID"),
+    "label_id": functools.partial(validate_trello_id, id_type="Label ID"),
+    "fields": validate_fields,
+    "limit": validate_limit,
+    "cursor": _checked_cursor,
+}
+
+
+class _PageBuffer:
+    """Rendered lines of one listing page, filled item by item."""
+
+    def __init__(self, start: int, header: str, arguments: dict, render_item):
+        self.start = self.end = start
+        self.header = header
+        self.limit = arguments.get("limit")
+        self.render_item = render_item
+        self.lines = []
+        self.size = len(header)
+        self.next_id = None  # First item that did not fit
+
+    def offer(self, item: dict) -> bool:
+        """Add the next item; returns False once the page is full."""
+        if self.next_id is not None:
+            return False
+        if not self.limit or len(self.lines) < self.limit:
+            line = self.render_item(item)
+            if not (self.lines and MAX_RESPONSE_CHARS and self.size + len(line) + 1 > MAX_RESPONSE_CHARS):
+                self.lines.append(line)
+                self.size += len(line) + 1
+                self.end += 1
+                return True
+        self.next_id = item["id"]
+        return False
+
+    def text(self, total: int) -> str:
+        text = self.header + "\n" + "\n".join(self.lines)
+        if self.next_id is not None:
+            text += (f"\n(Showing {self.start + 1}-{self.end} of {total}. "
+                     f"For more, call again with cursor: {_make_cursor(self.end, self.next_id)})")
+        return text
+
+
+def _render_page(header: str, items: list, arguments: dict, render_item) -> str:
+    """Render one page of a listing within ``limit`` and the response size budget.
+
+    Pages are cut from the full listing (usually cached or synced, so later
+    pages cost no requests). When items remain, a footer carries the cursor
+    for the next page; cursors find their place again by item id if the
+    listing changed in between.
+    """
+    start = 0
+    if arguments.get("cursor"):
+        offset, anchor_id = validate_cursor(arguments["cursor"])
+        start = offset if offset < len(items) and items[offset]["id"] == anchor_id else next(
+            (index for index, item in enumerate(items) if item["id"] == anchor_id), min(offset, len(items)))
+    page = _PageBuffer(start, header, arguments, render_item)
+    for item in itertools.islice(items, start, None):
+        if not page.offer(item):
+            break
+    return page.text(len(items))
+
+
+def _render_streamed_page(header: str, items, arguments: dict, render_item) -> str:
+    """Render a page like ``_render_page`` in one pass over an item iterator.
+
+    Only the page's lines are kept. The cursor's item is looked for as the
+    items go by; until it shows up, the page starting at the cursor's offset
+    is collected as the fallback.
+    """
+    offset, anchor_id = validate_cursor(arguments["cursor"]) if arguments.get("cursor") else (0, None)
+    by_offset = by_anchor = None
+    total = 0
+    for index, item in enumerate(items):
+        total += 1
+        if index == offset:
+            by_offset = _PageBuffer(index, header, arguments, render_item)
+        elif item["id"] == anchor_id and by_anchor is None:
+            by_anchor = _PageBuffer(index, header, arguments, render_item)
+        for page in (by_offset, by_anchor):
+            if page is not None:
+                page.offer(item)
+    page = by_anchor or by_offset or _PageBuffer(total, header, arguments, render_item)
+    return page.text(total)
+
+
+# Trello fields each read tool renders (declared with the tool's
+# registration). Only these are requested from the API, so responses carry
+# just what the tool prints; callers can ask for more through the optional
+# "fields" argument.
+TOOL_FIELDS = {}
+
+# Schema for the optional "fields" argument shared by the read tools
+FIELDS_PROPERTY = {
+    "type": "string",
+    "description": "Extra comma-separated Trello fields to include, e.g. 'due,closed' (optional)"
+}
+
+# Schemas for the pagination arguments of the large listings
+LIMIT_PROPERTY = {
+    "type": "integer",
+    "minimum": 1,
+    "description": "Maximum number of items to return (optional)"
+}
+CURSOR_PROPERTY = {
+    "type": "string",
+    "description": "Cursor from a previous page to continue from (optional)"
+}
+
+# Schema for the card selection shared by the bulk assignment tools
+CARD_SELECTION_PROPERTIES = {
+    "card_ids": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "IDs of the cards to change (optional if board_id is given)"
+    },
+    "board_id": {
+        "type": "string",
+        "description": "Select the board's cards, narrowed by the filters below (optional if card_ids is given)"
+    },
+    "filter_label_id": {
+        "type": "string",
+        "description": "Only cards on board_id carrying this label (optional)"
+    },
+    "filter_list_id": {
+        "type": "string",
+        "description": "Only cards on board_id in this list (optional)"
+    }
+}
+
+
+def _requested_fields(arguments: dict) -> list:
+    """Return the extra fields a caller asked for."""
+    return [field for field in arguments.get("fields", "").split(",") if field]
+
+
+def _tool_fields(tool_name: str, arguments: dict) -> str:
+    """Return the ``fields`` parameter for a read tool's main request."""
+    fields = TOOL_FIELDS[tool_name].split(",")
+    fields += [field for field in _requested_fields(arguments) if field not in fields]
+    return ",".join(fields)
+
+
+def _format_extra_fields(item: dict, arguments: dict, inline: bool = True) -> str:
+    """Render the caller-requested extra fields of an item."""
+    parts = []
+    for field in _requested_fields(arguments):
+        value = item.get(field, "N/A")
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        parts.append(f"{field}: {value}")
+    if not parts:
+        return ""
+    return " | " + ", ".join(parts) if inline else "\n" + "\n".join(parts)
+
+
+class TrelloTransport:
+    """Shared keep-alive HTTP transport for Trello API calls.
+
+    Wraps a ``requests.Session`` so TCP connections and TLS sessions to
+    api.trello.com are reused across calls instead of being set up for every
+    request. urllib3 checks each pooled socket for a dropped connection before
+    reusing it; on top of that the whole pool is recycled after
+    ``idle_timeout`` seconds without traffic, since Trello closes idle
+    keep-alive connections on its side.
+    """
+
+    def __init__(self, pool_maxsize: int = POOL_MAXSIZE, idle_timeout: float = POOL_IDLE_TIMEOUT):
+        self.pool_maxsize = max(1, pool_maxsize)
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._last_used: Optional[float] = None
+        # Counters carried over from pools that were recycled
+        self._retired_requests = 0
+        self._retired_connections = 0
+        self.idle_recycles = 0
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=1,  # All traffic goes to a single host
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
         )
-    
-    api_key, token = auth.get_credentials()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def _pools(self) -> list:
+        """Return the urllib3 connection pools currently held by the adapter."""
+        manager = self.adapter.poolmanager
+        return [manager.pools[key] for key in manager.pools.keys()]
+
+    def _recycle_if_idle(self):
+        """Drop pooled connections that have been idle longer than idle_timeout."""
+        now = time.monotonic()
+        with self._lock:
+            idle_for = None if self._last_used is None else now - self._last_used
+            self._last_used = now
+            if idle_for is None or idle_for <= self.idle_timeout:
+                return
+            for pool in self._pools():
+                self._retired_requests += pool.num_requests
+                self._retired_connections += pool.num_connections
+            self.adapter.poolmanager.clear()
+            self.idle_recycles += 1
+        logger.debug(f"Recycled Trello connection pool after {idle_for:.1f}s idle")
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """Send a request over the pooled session."""
+        self._recycle_if_idle()
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        kwargs.setdefault("verify", True)  # Explicit SSL certificate verification
+        return self.session.request(method, url, **kwargs)
+
+    def stats(self) -> dict:
+        """Return connection reuse counters for this transport."""
+        with self._lock:
+            pools = self._pools()
+            total_requests = self._retired_requests + sum(p.num_requests for p in pools)
+            new_connections = self._retired_connections + sum(p.num_connections for p in pools)
+            return {
+                "requests": total_requests,
+                "new_connections": new_connections,
+                "reused_connections": max(0, total_requests - new_connections),
+                "idle_recycles": self.idle_recycles,
+                "pool_maxsize": self.pool_maxsize,
+            }
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_tenant_transports: OrderedDict = OrderedDict()
+
+
+def get_transport(token: Optional[str] = None) -> TrelloTransport:
+    """Return the connection pool for requests made with ``token``.
+
+    The server's own token shares one ``TrelloTransport``, created on the
+    first request. Every other token (a tenant in HTTP mode) gets a pool
+    of its own; the least recently used ones are dropped beyond
+    ``TENANT_POOLS_MAX``. Dropped pools are not closed, since a request
+    in flight may still be using one; their connections are released
+    once the last reference goes away.
+    """
+    if token is None or token == _process_auth().token:
+        instance = globals().get("transport")
+        if instance is None:
+            with _lazy_lock:
+                instance = globals().get("transport")
+                if instance is None:
+                    instance = globals()["transport"] = TrelloTransport()
+        return instance
+    namespace = _credential_namespace(token)
+    with _lazy_lock:
+        instance = _tenant_transports.pop(namespace, None) or TrelloTransport()
+        _tenant_transports[namespace] = instance
+        while len(_tenant_transports) > max(1, TENANT_POOLS_MAX):
+            _tenant_transports.popitem(last=False)
+    return instance
+
+
+def __getattr__(name: str):
+    # ``server.auth`` and ``server.transport`` are built on first access
+    if name == "auth":
+        return _process_auth()
+    if name == "transport":
+        return get_transport()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class TokenBucket:
+    """Token bucket that hands out request slots in arrival order.
+
+    ``reserve()`` always takes a slot, letting the balance go negative, and
+    returns how long the caller has to wait for that slot. Later callers
+    therefore queue up behind earlier ones instead of racing for a refill.
+    """
+
+    def __init__(self, capacity: int, interval: float):
+        self.capacity = max(1, capacity)
+        self.interval = interval
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.interval
+
+    def _refill(self, now: float):
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(float(self.capacity), self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take one slot and return the seconds to wait before using it."""
+        self._refill(now)
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def observe(self, now: float, remaining: int, capacity: int = None, interval: float = None):
+        """Align the bucket with the budget Trello reports in response headers."""
+        self._refill(now)
+        if capacity:
+            self.capacity = capacity
+        if interval:
+            self.interval = interval
+        self.tokens = min(self.tokens, float(remaining))
+
+    def drain(self, now: float):
+        """Empty the bucket after Trello rejected a request with 429."""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimiter:
+    """Pace requests to stay inside Trello's per-token and per-key budgets.
+
+    Each request first waits for a slot in the bucket for its token, and
+    only then takes a slot from the bucket for its API key, which several
+    tokens may share. A burst from one token thus reaches the shared key
+    bucket no faster than that token's own budget allows, instead of
+    queueing a backlog there that every other token would wait behind.
+    The buckets are corrected from the ``X-Rate-Limit-Api-*`` headers on
+    every response, so requests made by other processes with the same
+    credentials are accounted for as well. Buckets of the least recently
+    seen credentials are dropped beyond ``max_buckets``.
+    """
+
+    HEADER_PREFIXES = {
+        "token": "x-rate-limit-api-token-",
+        "key": "x-rate-limit-api-key-",
+    }
+
+    def __init__(self, per_token: int = RATE_LIMIT_PER_TOKEN, per_key: int = RATE_LIMIT_PER_KEY,
+                 interval: float = RATE_LIMIT_INTERVAL, max_buckets: int = 2 * (TENANT_POOLS_MAX + 1)):
+        self.limits = {"token": per_token, "key": per_key}
+        self.interval = interval
+        self.max_buckets = max(2, max_buckets)
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.throttled = 0
+
+    def _bucket(self, scope: str, ident: str) -> TokenBucket:
+        bucket = self._buckets.get((scope, ident))
+        if bucket is None:
+            bucket = TokenBucket(self.limits[scope], self.interval)
+            self._buckets[(scope, ident)] = bucket
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end((scope, ident))
+        return bucket
+
+    def _identities(self, api_key: str, token: str) -> dict:
+        return {"token": token or "", "key": api_key or ""}
+
+    async def acquire(self, api_key: str, token: str):
+        """Wait until a request with these credentials fits in the budget."""
+        identities = self._identities(api_key, token)
+        total = 0.0
+        for scope in ("token", "key"):
+            with self._lock:
+                wait = self._bucket(scope, identities[scope]).reserve(time.monotonic())
+            if wait > 0:
+                logger.debug(f"Rate limiter delaying Trello request by {wait:.2f}s ({scope} budget)")
+                await asyncio.sleep(wait)
+                total += wait
+        with self._lock:
+            self.requests += 1
+            if total > 0:
+                self.delayed += 1
+                self.total_wait += total
+
+    def observe(self, api_key: str, token: str, headers):
+        """Update budgets from the rate limit headers of a response."""
+        with self._lock:
+            now = time.monotonic()
+            for scope, ident in self._identities(api_key, token).items():
+                prefix = self.HEADER_PREFIXES[scope]
+                remaining = headers.get(prefix + "remaining")
+                if remaining is None:
+                    continue
+                try:
+                    capacity = int(headers.get(prefix + "max") or 0)
+                    interval_ms = int(headers.get(prefix + "interval-ms") or 0)
+                    self._bucket(scope, ident).observe(
+                        now, int(remaining), capacity or None, interval_ms / 1000 or None
+                    )
+                except ValueError:
+                    logger.debug(f"Ignoring malformed rate limit headers for {scope}")
+
+    def throttle(self, api_key: str, token: str):
+        """Record a 429 response so queued requests back off."""
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            for scope, ident in self._identities(api_key, token).items():
+                self._bucket(scope, ident).drain(now)
+
+    def stats(self, api_key: Optional[str] = None, token: Optional[str] = None) -> dict:
+        """Return pacing counters and the current token budget.
+
+        With credentials, the budget is the one left for them; otherwise it
+        is the lowest across all buckets.
+        """
+        identities = None if token is None else self._identities(api_key, token)
+        with self._lock:
+            now = time.monotonic()
+            budgets = {}
+            for (scope, ident), bucket in self._buckets.items():
+                if identities is not None and identities[scope] != ident:
+                    continue
+                bucket._refill(now)
+                budgets[scope] = min(budgets.get(scope, bucket.capacity), max(0, int(bucket.tokens)))
+            return {
+                "requests": self.requests,
+                "delayed": self.delayed,
+                "total_wait": self.total_wait,
+                "throttled": self.throttled,
+                "token_remaining": budgets.get("token", self.limits["token"]),
+                "key_remaining": budgets.get("key", self.limits["key"]),
+            }
+
+
+rate_limiter = RateLimiter()
+
+
+class RetryPolicy:
+    """Decide whether and when a failed Trello request is retried.
+
+    Timeouts, connection errors, 429 and 5xx responses are retried with
+    exponential backoff and full jitter, or after ``Retry-After`` when Trello
+    sends one. Idempotent methods are retried for any of these failures.
+    POST and DELETE are only retried when Trello cannot have acted on the
+    request: the connection was never established, or Trello answered 429.
+    """
+
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT"}
+
+    def __init__(self, max_attempts: int = RETRY_MAX_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY, deadline: float = REQUEST_DEADLINE):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.retry_wait = 0.0
+        self.recovered = 0
+        self.exhausted = 0
+        self.reasons: dict = {}
+
+    @staticmethod
+    def _not_sent(error: Exception) -> bool:
+        """Return True if the request never reached Trello."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        cause = error.args[0] if error.args else None
+        from urllib3.exceptions import MaxRetryError, NewConnectionError
+        return isinstance(cause, MaxRetryError) and isinstance(cause.reason, NewConnectionError)
+
+    @staticmethod
+    def _retry_after(response: "requests.Response") -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def next_delay(self, method: str, attempt: int, deadline: float,
+                   response: "requests.Response" = None, error: Exception = None) -> Optional[float]:
+        """Return the delay before the next attempt, or None to give up."""
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        retry_after = None
+        if response is not None:
+            if response.status_code not in self.RETRYABLE_STATUS:
+                return None
+            if response.status_code != 429 and not idempotent:
+                return None
+            reason = f"status {response.status_code}"
+            retry_after = self._retry_after(response)
+        elif isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            if not idempotent and not self._not_sent(error):
+                return None
+            reason = "timeout" if isinstance(error, requests.exceptions.Timeout) else "connection error"
+        else:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+        with self._lock:
+            if attempt >= self.max_attempts or time.monotonic() + delay >= deadline:
+                self.exhausted += 1
+                return None
+            self.retries += 1
+            self.retry_wait += delay
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        logger.info(f"Retrying {method} request after {reason} in {delay:.2f}s (attempt {attempt + 1})")
+        return delay
+
+    def record_recovery(self):
+        """Count a call that succeeded after at least one retry."""
+        with self._lock:
+            self.recovered += 1
+
+    def stats(self) -> dict:
+        """Return retry counters."""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retry_wait": self.retry_wait,
+                "recovered": self.recovered,
+                "exhausted": self.exhausted,
+                "reasons": dict(self.reasons),
+            }
+
+
+retry_policy = RetryPolicy()
+
+
+# Blocking HTTP work runs on a dedicated pool sized to the connection pool, so
+# every in-flight request can hold a keep-alive connection.
+_request_executor = ThreadPoolExecutor(max_workers=POOL_MAXSIZE, thread_name_prefix="trello-http")
+_tenant_executors: OrderedDict = OrderedDict()
+
+
+def get_executor(token: Optional[str] = None) -> ThreadPoolExecutor:
+    """Return the worker threads that run requests made with ``token``.
+
+    Each tenant gets workers of its own next to its connection pool, so a
+    tenant with ``POOL_MAXSIZE`` slow requests in flight only delays its
+    own next request. Like pools, the least recently used executors are
+    dropped beyond ``TENANT_POOLS_MAX`` without being shut down; their
+    threads exit once running work is done and the last reference goes.
+    """
+    if token is None or token == _process_auth().token:
+        return _request_executor
+    namespace = _credential_namespace(token)
+    with _lazy_lock:
+        executor = _tenant_executors.pop(namespace, None) or ThreadPoolExecutor(
+            max_workers=POOL_MAXSIZE, thread_name_prefix="trello-http-tenant")
+        _tenant_executors[namespace] = executor
+        while len(_tenant_executors) > max(1, TENANT_POOLS_MAX):
+            _tenant_executors.popitem(last=False)
+    return executor
+
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_NUMBER = re.compile(r"[-+0-9.eE]*")
+
+
+def iter_json_array(chunks):
+    """Yield the elements of a JSON array as its bytes arrive.
+
+    ``chunks`` is an iterable of bytes such as ``response.iter_content()``.
+    Only the undecoded tail of the stream is buffered, so memory stays at
+    about one chunk plus the element being decoded. Raises ValueError if
+    the stream is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer, pos, done = "", 0, False
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, done
+        if done:
+            return False
+        chunk = next(chunks, None)
+        done = chunk is None
+        buffer = buffer[pos:] + utf8.decode(chunk or b"", final=done)
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    if next_char() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        if _JSON_NUMBER.match(buffer, pos).end() == len(buffer) and read_more():
+            continue  # A number may go on in the next chunk
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The element continues in the next chunk
+            if not read_more():
+                raise
+            continue
+        pos = end
+        yield item
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError("Malformed JSON array")
+        pos += 1
+        next_char()
+
+
+def _perform_request(method: str, endpoint: str, params: Optional[dict], data: Optional[dict],
+                     api_key: str, token: str, timeout: float = REQUEST_TIMEOUT, consume=None) -> tuple:
+    """Send one request and decode its JSON body.
+
+    Runs on a worker thread. Returns ``(response, payload)``; the payload is
+    ``None`` for error responses, which are raised by the caller. With
+    ``consume``, the body is streamed: the payload is ``consume`` applied to
+    an iterator over the elements of the JSON array, and the body itself is
+    never held in full.
+    """
     url = f"{TRELLO_API_BASE}{endpoint}"
     auth_params = {
         "key": api_key,
         "token": token
     }
-    
+
     if params:
         auth_params.update(params)
-    
-    # Add timeout and explicit certificate verification for security
-    response = requests.request(
-        method, 
-        url, 
-        params=auth_params, 
+
+    # Reuse pooled keep-alive connections; certificate verification is
+    # applied by the transport
+    if consume is not None:
+        response = get_transport(token).request(method, url, params=auth_params, json=data, timeout=timeout,
+                                                stream=True)
+        with response:
+            if not response.ok:
+                response.content  # Read the error body so the connection can be reused
+                return response, None
+            return response, consume(iter_json_array(response.iter_content(STREAM_CHUNK_SIZE)))
+
+    response = get_transport(token).request(
+        method,
+        url,
+        params=auth_params,
         json=data,
-        timeout=30,  # 30 second timeout
-        verify=True  # Explicit SSL certificate verification
+        timeout=timeout,
     )
-    response.raise_for_status()
-    return response.json()
+    if not response.ok:
+        return response, None
+    return response, response.json()
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Trello tools."""
-    return [
-        Tool(
-            name="list_boards",
-            description="List all boards accessible to the authenticated user",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            }
-        ),
-        Tool(
-            name="get_board",
-            description="Get details about a specific board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    }
-                },
-                "required": ["board_id"]
-            }
-        ),
-        Tool(
-            name="list_board_lists",
-            description="Get all lists on a board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    }
-                },
-                "required": ["board_id"]
-            }
-        ),
-        Tool(
-            name="list_board_cards",
-            description="Get all cards on a board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    }
-                },
-                "required": ["board_id"]
-            }
-        ),
-        Tool(
-            name="create_card",
-            description="Create a new card on a list",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "list_id": {
-                        "type": "string",
-                        "description": "The ID of the list to create the card in"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "The name/title of the card"
-                    },
-                    "desc": {
-                        "type": "string",
-                        "description": "The description of the card (optional)"
-                    }
-                },
-                "required": ["list_id", "name"]
-            }
-        ),
-        Tool(
-            name="update_card",
-            description="Update a card's properties",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card to update"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "New name for the card (optional)"
-                    },
-                    "desc": {
-                        "type": "string",
-                        "description": "New description for the card (optional)"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "Move card to this list ID (optional)"
-                    }
-                },
-                "required": ["card_id"]
-            }
-        ),
-        Tool(
-            name="get_card",
-            description="Get details about a specific card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    }
-                },
-                "required": ["card_id"]
-            }
-        ),
-        Tool(
-            name="create_list",
-            description="Create a new list on a board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board to create the list on"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "The name of the list"
-                    },
-                    "pos": {
-                        "type": "string",
-                        "description": "Position of the list: 'top', 'bottom', or a positive number (optional, defaults to 'bottom')"
-                    }
-                },
-                "required": ["board_id", "name"]
+
+async def _request_with_retries(method: str, endpoint: str, params: Optional[dict], data: Optional[dict],
+                                api_key: str, token: str, consume=None) -> tuple:
+    """Send a request through the rate limiter, retrying transient failures.
+
+    Returns ``(payload, body)`` where body is the raw response bytes, or
+    ``None`` for responses streamed into ``consume``.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + retry_policy.deadline
+    attempt = 0
+
+    while True:
+        attempt += 1
+        await rate_limiter.acquire(api_key, token)
+        timeout = min(REQUEST_TIMEOUT, max(1.0, deadline - time.monotonic()))
+        try:
+            response, payload = await loop.run_in_executor(
+                get_executor(token),
+                functools.partial(_perform_request, method, endpoint, params, data, api_key, token, timeout, consume)
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            delay = retry_policy.next_delay(method, attempt, deadline, error=e)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            continue
+
+        rate_limiter.observe(api_key, token, response.headers)
+        if response.status_code == 429:
+            rate_limiter.throttle(api_key, token)
+        if not response.ok:
+            delay = retry_policy.next_delay(method, attempt, deadline, response=response)
+            if delay is not None:
+                await asyncio.sleep(delay)
+                continue
+        response.raise_for_status()
+        if attempt > 1:
+            retry_policy.record_recovery()
+        return payload, None if consume is not None else response.content
+
+
+def _batch_error(endpoint: str, status: int, detail: Any) -> "requests.exceptions.HTTPError":
+    """Build the HTTPError a direct request for a batched route would have raised."""
+    response = requests.Response()
+    response.status_code = status
+    response.url = f"{TRELLO_API_BASE}{endpoint}"
+    response._content = (detail if isinstance(detail, str) else json.dumps(detail)).encode()
+    return requests.exceptions.HTTPError(f"{status} Error for batched route {endpoint}", response=response)
+
+
+class RequestBatcher:
+    """Combine concurrent GET requests into Trello ``/1/batch`` calls.
+
+    The first GET starts a short collection window. Every GET with the same
+    credentials that arrives before it closes, up to Trello's limit of ten
+    routes, is sent in one ``/batch`` call and each caller receives its own
+    result. A lone GET is sent directly, so sequential callers pay nothing
+    beyond the window. Routes that fail inside a batch with a retryable
+    status are re-sent directly so they get the normal retry handling.
+    """
+
+    def __init__(self, window: float = BATCH_WINDOW, max_size: int = BATCH_MAX_SIZE):
+        self.window = window
+        self.max_size = max(1, min(max_size, BATCH_MAX_SIZE))
+        # Pending requests per event loop, grouped by credentials
+        self._pending = weakref.WeakKeyDictionary()
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self.batched_requests = 0
+        self.batch_calls = 0
+        self.direct_requests = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0 and self.max_size > 1
+
+    async def fetch(self, endpoint: str, params: Optional[dict], api_key: str, token: str) -> tuple:
+        """Queue a GET for the next batch and wait for its result.
+
+        Returns ``(payload, body)`` like ``_request_with_retries``; body is
+        ``None`` for results that arrived inside a batch call.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        groups = self._pending.setdefault(loop, {})
+        key = (api_key, token)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"items": [], "timer": loop.call_later(self.window, self._flush, loop, key)}
+        group["items"].append((endpoint, params, future))
+        if len(group["items"]) >= self.max_size:
+            group["timer"].cancel()
+            self._flush(loop, key)
+        return await future
+
+    def _flush(self, loop, key):
+        """Close the collection window for one credential group."""
+        group = self._pending.get(loop, {}).pop(key, None)
+        if not group:
+            return
+        task = loop.create_task(self._dispatch(group["items"], *key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _direct(self, endpoint: str, params: Optional[dict], future, api_key: str, token: str):
+        with self._lock:
+            self.direct_requests += 1
+        try:
+            result = await _request_with_retries("GET", endpoint, params, None, api_key, token)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _dispatch(self, items: list, api_key: str, token: str):
+        if len(items) == 1:
+            await self._direct(*items[0], api_key, token)
+            return
+
+        routes = [endpoint + (f"?{urlencode(params)}" if params else "") for endpoint, params, _ in items]
+        try:
+            results, _ = await _request_with_retries(
+                "GET", "/batch", {"urls": ",".join(routes)}, None, api_key, token
+            )
+        except requests.exceptions.HTTPError as e:
+            # The batch call itself was refused; fall back to direct requests
+            logger.warning(f"Batch request failed ({e}); sending {len(items)} requests individually")
+            await asyncio.gather(*(self._direct(*item, api_key, token) for item in items))
+            return
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        with self._lock:
+            self.batch_calls += 1
+            self.batched_requests += len(items)
+
+        retry = []
+        for (endpoint, params, future), entry in zip(items, results):
+            if future.done():
+                continue
+            status, body = 500, entry
+            if isinstance(entry, dict) and len(entry) == 1 and next(iter(entry)).isdigit():
+                status, body = int(next(iter(entry))), next(iter(entry.values()))
+            elif isinstance(entry, dict) and "statusCode" in entry:
+                status = int(entry["statusCode"])
+            if 200 <= status < 300:
+                future.set_result((body, None))
+            elif status in RetryPolicy.RETRYABLE_STATUS:
+                retry.append((endpoint, params, future))
+            else:
+                future.set_exception(_batch_error(endpoint, status, body))
+        for endpoint, params, future in items[len(results):]:
+            retry.append((endpoint, params, future))
+        if retry:
+            await asyncio.gather(*(self._direct(*item, api_key, token) for item in retry))
+
+    def stats(self) -> dict:
+        """Return batching counters."""
+        with self._lock:
+            return {
+                "batch_calls": self.batch_calls,
+                "batched_requests": self.batched_requests,
+                "direct_requests": self.direct_requests,
+                "saved_round_trips": self.batched_requests - self.batch_calls,
+            }
+
+
+request_batcher = RequestBatcher()
+
+
+def _credential_namespace(token: Optional[str]) -> str:
+    """Return a short, non-reversible identifier for a token."""
+    return hashlib.sha256((token or "").encode()).hexdigest()[:16]
+
+
+def _resource_prefix(endpoint: str) -> str:
+    """Return the resource an endpoint belongs to, e.g. ``/cards/{id}``."""
+    return "/".join(endpoint.split("/")[:3])
+
+
+class ResponseCache:
+    """Bounded TTL + LRU cache of Trello GET responses.
+
+    Entries hold the raw JSON body, so every hit decodes a fresh copy and
+    callers can never change cached data. Entries are keyed by credential
+    namespace, endpoint and query parameters, expire after a per-endpoint
+    TTL, and the least recently used entries are evicted once the total
+    body size exceeds ``max_bytes``. Mutations invalidate entries by
+    endpoint prefix or pattern; a response fetched while an invalidation
+    happened is not stored, so an in-flight GET cannot resurrect stale data.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, default_ttl: float = CACHE_DEFAULT_TTL,
+                 ttls: list = None):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+        self._entries = OrderedDict()  # key -> (expires, endpoint, body)
+        self._lock = threading.Lock()
+        self.size = 0
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.default_ttl > 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        for pattern, ttl in self.ttls:
+            if pattern.match(endpoint):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(namespace: str, endpoint: str, params: Optional[dict]) -> tuple:
+        return (namespace, endpoint, tuple(sorted((params or {}).items())))
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return a decoded copy of a fresh entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            body = entry[2]
+        return json.loads(body)
+
+    def put(self, key: tuple, body: bytes, generation: int):
+        """Store a response body unless the cache was invalidated since ``generation``."""
+        endpoint = key[1]
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, endpoint, body)
+            self.size += len(body)
+            while self.size > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: tuple):
+        _, _, body = self._entries.pop(key)
+        self.size -= len(body)
+
+    def invalidate(self, namespace: str, prefixes: tuple = (), pattern: Optional[str] = None) -> int:
+        """Drop entries whose endpoint starts with a prefix or matches a pattern."""
+        regex = re.compile(pattern) if pattern else None
+        with self._lock:
+            self.generation += 1
+            stale = [
+                key for key, (_, endpoint, _) in self._entries.items()
+                if key[0] == namespace and (
+                    any(endpoint == prefix or endpoint.startswith(prefix + "/") for prefix in prefixes)
+                    or (regex is not None and regex.match(endpoint))
+                )
+            ]
+            for key in stale:
+                self._remove(key)
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
             }
-        ),
-        Tool(
-            name="list_organizations",
-            description="List all organizations/workspaces the authenticated user belongs to",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+
+
+class PersistentCache:
+    """SQLite-backed cache of slowly changing Trello data.
+
+    Keeps boards, lists, labels and members across restarts, in a file next
+    to the token cache, separated by credential namespace. Each entry
+    carries a version that is bumped whenever its content changes, and the
+    database is rebuilt when ``SCHEMA_VERSION`` changes. The least recently
+    used entries are removed once the stored bodies exceed ``max_bytes``.
+    Invalidation can be split in two: ``begin_invalidate`` bumps the
+    generation and hides matching entries at once, and the slower row
+    deletes in ``finish_invalidate`` can then run on a worker thread.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path: Path = PERSISTENT_CACHE_FILE, max_bytes: int = PERSISTENT_CACHE_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.generation = 0
+        self._pending = []  # Invalidations whose rows are not deleted yet
+        self.hits = 0
+        self.stale_hits = 0
+        self.revalidations = 0
+        # Create the file with secure permissions before SQLite opens it
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._migrate()
+
+    def _migrate(self):
+        with self._lock, self._db:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._db.execute("DROP TABLE IF EXISTS entries")
+                self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL, cache_key TEXT NOT NULL, endpoint TEXT NOT NULL,"
+                " body BLOB NOT NULL, size INTEGER NOT NULL, version INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL, accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, cache_key))"
+            )
+
+    @staticmethod
+    def eligible(endpoint: str) -> bool:
+        return any(pattern.match(endpoint) for pattern in PERSISTENT_CACHE_PATTERNS)
+
+    @staticmethod
+    def _row_key(key: tuple) -> tuple:
+        namespace, endpoint, params = key
+        return namespace, json.dumps([endpoint, list(params)])
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """Return ``(body, age_seconds)`` for a stored entry, or None."""
+        namespace, cache_key = self._row_key(key)
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT body, stored_at, endpoint FROM entries WHERE namespace = ? AND cache_key = ?",
+                (namespace, cache_key)
+            ).fetchone()
+            if row is None or any(pending_namespace == namespace and self._matches(row[2], prefixes, regex)
+                                  for pending_namespace, prefixes, regex in self._pending):
+                return None
+            self._db.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND cache_key = ?",
+                (now, namespace, cache_key)
+            )
+            self.hits += 1
+        return bytes(row[0]), now - row[1]
+
+    def put(self, key: tuple, body: bytes, generation: int):
+        """Store a body unless the cache was invalidated since ``generation``."""
+        namespace, cache_key = self._row_key(key)
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock, self._db:
+            if generation != self.generation:
+                return
+            row = self._db.execute(
+                "SELECT body, version FROM entries WHERE namespace = ? AND cache_key = ?",
+                (namespace, cache_key)
+            ).fetchone()
+            if row is not None and bytes(row[0]) == body:
+                self._db.execute(
+                    "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE namespace = ? AND cache_key = ?",
+                    (now, now, namespace, cache_key)
+                )
+                return
+            version = row[1] + 1 if row is not None else 1
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (namespace, cache_key, key[1], body, len(body), version, now, now)
+            )
+            self._enforce_size()
+
+    def _enforce_size(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for namespace, cache_key, size in self._db.execute(
+            "SELECT namespace, cache_key, size FROM entries ORDER BY accessed_at"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE namespace = ? AND cache_key = ?", (namespace, cache_key))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _matches(endpoint: str, prefixes: tuple, regex) -> bool:
+        return (any(endpoint == prefix or endpoint.startswith(prefix + "/") for prefix in prefixes)
+                or (regex is not None and regex.match(endpoint) is not None))
+
+    def invalidate(self, namespace: str, prefixes: tuple = (), pattern: Optional[str] = None):
+        """Delete entries whose endpoint starts with a prefix or matches a pattern."""
+        self.finish_invalidate(self.begin_invalidate(namespace, prefixes, pattern))
+
+    def begin_invalidate(self, namespace: str, prefixes: tuple = (), pattern: Optional[str] = None) -> tuple:
+        """Reject older puts and hide matching entries; pass the result to ``finish_invalidate``."""
+        pending = (namespace, tuple(prefixes), re.compile(pattern) if pattern else None)
+        with self._lock:
+            self.generation += 1
+            self._pending.append(pending)
+        return pending
+
+    def finish_invalidate(self, pending: tuple):
+        """Delete the entries an invalidation from ``begin_invalidate`` hid."""
+        namespace, prefixes, regex = pending
+        with self._lock:
+            try:
+                with self._db:
+                    for cache_key, endpoint in self._db.execute(
+                        "SELECT cache_key, endpoint FROM entries WHERE namespace = ?", (namespace,)
+                    ).fetchall():
+                        if self._matches(endpoint, prefixes, regex):
+                            self._db.execute(
+                                "DELETE FROM entries WHERE namespace = ? AND cache_key = ?", (namespace, cache_key)
+                            )
+            finally:
+                self._pending.remove(pending)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "revalidations": self.revalidations,
+                "entries": entries,
+                "bytes": size,
             }
-        ),
-        Tool(
-            name="get_organization",
-            description="Get details about a specific organization/workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "org_id": {
-                        "type": "string",
-                        "description": "The ID or name of the organization"
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def _open_persistent_cache() -> Optional[PersistentCache]:
+    """Open the on-disk cache if it is enabled."""
+    if not PERSISTENT_CACHE_ENABLED:
+        return None
+    try:
+        return PersistentCache()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Persistent cache disabled: {e}")
+        return None
+
+
+persistent_cache = _open_persistent_cache()
+response_cache = ResponseCache()
+
+# Cached card listings of any board
+BOARD_CARDS_PATTERN = r"^/boards/[^/]+/cards$"
+
+
+def _invalidate_namespace(namespace: str, prefixes: tuple = (), pattern: str = None, mark_stale: bool = True) -> int:
+    """Invalidate matching responses in the memory and disk caches.
+
+    Synced boards are marked stale too (unless the caller patched them
+    already), so the next read catches up on the board's action log.
+    """
+    if mark_stale:
+        board_sync.mark_stale(namespace)
+    prefixes = board_sync.with_aliases(namespace, prefixes)
+    if persistent_cache is not None:
+        # Matching rows are hidden now; deleting them is disk work for a worker thread
+        pending = persistent_cache.begin_invalidate(namespace, prefixes, pattern)
+        _request_executor.submit(persistent_cache.finish_invalidate, pending)
+    return response_cache.invalidate(namespace, prefixes, pattern)
+
+
+def invalidate_cache(*prefixes: str, pattern: str = None) -> int:
+    """Invalidate cached responses for the current credentials."""
+    return _invalidate_namespace(_credential_namespace(get_auth().token), prefixes, pattern)
+
+
+def invalidate_card_listings(card: Optional[dict] = None, keep_label_index: bool = False) -> int:
+    """Invalidate the cached card listings a changed card appears in.
+
+    Uses the card's board when the mutation response includes it, and
+    every board's card listing otherwise. The label index drops its card
+    snapshot too, unless the caller has already applied the change to it.
+    """
+    board_id = card.get("idBoard") if card else None
+    if not keep_label_index:
+        label_index.forget_cards(_credential_namespace(get_auth().token), board_id)
+    if board_id:
+        return invalidate_cache(f"/boards/{board_id}/cards")
+    return invalidate_cache(pattern=BOARD_CARDS_PATTERN)
+
+
+class MemberDirectory:
+    """Trello members seen in API responses, by id and by username.
+
+    Every response that carries members (board, organization and card
+    member listings, card payloads with nested members, and the board
+    membership PUT response) updates the directory, so confirmation
+    messages can name a member without fetching ``/members/{id}``.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._by_id = OrderedDict()  # (namespace, id) -> member
+        self._by_username = {}  # (namespace, username) -> id
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _is_member(item: Any) -> bool:
+        return isinstance(item, dict) and "id" in item and "username" in item
+
+    def remember(self, namespace: str, member: dict):
+        """Add or update one member."""
+        with self._lock:
+            key = (namespace, member["id"])
+            known = self._by_id.pop(key, {})
+            if known.get("username"):
+                self._by_username.pop((namespace, known["username"]), None)
+            entry = {**known, **{k: member[k] for k in ("id", "fullName", "username") if k in member}}
+            self._by_id[key] = entry
+            self._by_username[(namespace, entry["username"])] = entry["id"]
+            while len(self._by_id) > self.max_entries:
+                (old_namespace, _), evicted = self._by_id.popitem(last=False)
+                self._by_username.pop((old_namespace, evicted.get("username")), None)
+
+    def observe(self, namespace: str, payload: Any):
+        """Remember members found in a response payload."""
+        for item in payload if isinstance(payload, list) else [payload]:
+            if not isinstance(item, dict):
+                continue
+            if self._is_member(item) and "fullName" in item:
+                self.remember(namespace, item)
+            nested = item.get("members")
+            if isinstance(nested, list):
+                for member in nested:
+                    if self._is_member(member) and "fullName" in member:
+                        self.remember(namespace, member)
+
+    def get(self, namespace: str, id_or_username: str) -> Optional[dict]:
+        """Look a member up by id or username."""
+        with self._lock:
+            member_id = self._by_username.get((namespace, id_or_username), id_or_username)
+            member = self._by_id.get((namespace, member_id))
+            if member is None or "fullName" not in member:
+                self.misses += 1
+                return None
+            self._by_id.move_to_end((namespace, member_id))
+            self.hits += 1
+            return dict(member)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"members": len(self._by_id), "hits": self.hits, "misses": self.misses}
+
+
+member_directory = MemberDirectory()
+
+
+class LabelIndex:
+    """Per-board label index: label details and the cards carrying each label.
+
+    Built from board label and card listings (and label or card payloads
+    with nested labels) and kept current by the label mutation tools, so
+    ``filter_cards_by_label`` and ``add_card_label`` can answer without
+    scanning or re-fetching. A board's card snapshot is trusted for
+    ``card_ttl`` seconds, label details for ``label_ttl`` seconds.
+    """
+
+    BOARD = re.compile(r"^/boards/([^/]+)$")
+    BOARD_LABELS = re.compile(r"^/boards/([^/]+)/labels$")
+    BOARD_CARDS = re.compile(r"^/boards/([^/]+)/cards$")
+    LABEL = re.compile(r"^/labels/([^/]+)$")
+    CARD = re.compile(r"^/cards/([^/]+)(/labels)?$")
+    CARD_FIELDS = ("id", "name", "idList", "idLabels")
+
+    def __init__(self, card_ttl: float = CACHE_DEFAULT_TTL, label_ttl: float = 300.0, max_boards: int = 50):
+        self.card_ttl = card_ttl
+        self.label_ttl = label_ttl
+        self.max_boards = max_boards
+        self._labels = {}  # (namespace, label id) -> (seen, label)
+        self._boards = OrderedDict()  # (namespace, board id) -> card snapshot
+        self._card_boards = {}  # (namespace, card id) -> board id
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def observe(self, namespace: str, endpoint: str, payload: Any):
+        """Index the labels and card snapshots found in a fresh response."""
+        now = time.monotonic()
+        match = self.BOARD.match(endpoint)
+        if match and isinstance(payload, dict):
+            # Board snapshots with nested labels and cards
+            for label in payload.get("labels") or []:
+                self._remember_label(namespace, label, now, match.group(1))
+            if isinstance(payload.get("cards"), list):
+                self._remember_cards(namespace, match.group(1), payload["cards"], now)
+            return
+        match = self.BOARD_CARDS.match(endpoint)
+        if match and isinstance(payload, list):
+            self._remember_cards(namespace, match.group(1), payload, now)
+            return
+        match = self.BOARD_LABELS.match(endpoint)
+        if match and isinstance(payload, list):
+            for label in payload:
+                self._remember_label(namespace, label, now, match.group(1))
+            return
+        if self.LABEL.match(endpoint):
+            self._remember_label(namespace, payload, now)
+            return
+        match = self.CARD.match(endpoint)
+        if match:
+            labels = payload if match.group(2) else payload.get("labels") if isinstance(payload, dict) else None
+            for label in labels if isinstance(labels, list) else []:
+                self._remember_label(namespace, label, now)
+
+    def _remember_label(self, namespace: str, label: Any, now: float, board_id: str = None):
+        if not isinstance(label, dict) or "id" not in label or "name" not in label or "color" not in label:
+            return
+        entry = {"id": label["id"], "name": label["name"], "color": label["color"],
+                 "idBoard": label.get("idBoard", board_id)}
+        with self._lock:
+            self._labels[(namespace, label["id"])] = (now, entry)
+
+    def _remember_cards(self, namespace: str, board_id: str, cards: list, now: float):
+        if not all(isinstance(card, dict) and all(k in card for k in self.CARD_FIELDS) for card in cards):
+            return  # Not a full snapshot (projected without idLabels)
+        snapshot = {"built": now, "cards": {}, "by_label": {}}
+        for card in cards:
+            snapshot["cards"][card["id"]] = {"id": card["id"], "name": card["name"], "idList": card["idList"],
+                                             "idBoard": board_id, "idLabels": list(card["idLabels"])}
+            for label_id in card["idLabels"]:
+                snapshot["by_label"].setdefault(label_id, set()).add(card["id"])
+        with self._lock:
+            self._drop_board(namespace, board_id)
+            self._boards[(namespace, board_id)] = snapshot
+            for card_id in snapshot["cards"]:
+                self._card_boards[(namespace, card_id)] = board_id
+            while len(self._boards) > self.max_boards:
+                (old_namespace, old_board), _ = next(iter(self._boards.items()))
+                self._drop_board(old_namespace, old_board)
+
+    def _drop_board(self, namespace: str, board_id: str):
+        snapshot = self._boards.pop((namespace, board_id), None)
+        for card_id in snapshot["cards"] if snapshot else ():
+            self._card_boards.pop((namespace, card_id), None)
+
+    def _snapshot(self, namespace: str, board_id: Optional[str]) -> Optional[dict]:
+        snapshot = self._boards.get((namespace, board_id))
+        if snapshot is None or time.monotonic() - snapshot["built"] > self.card_ttl:
+            return None
+        return snapshot
+
+    def label(self, namespace: str, label_id: str) -> Optional[dict]:
+        """Return a label's id, name, color and board, if known."""
+        with self._lock:
+            seen, label = self._labels.get((namespace, label_id), (0.0, None))
+            if label is None or time.monotonic() - seen > self.label_ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(label)
+
+    def card(self, namespace: str, card_id: str) -> Optional[dict]:
+        """Return a card's name, list, board and label ids, if known."""
+        with self._lock:
+            snapshot = self._snapshot(namespace, self._card_boards.get((namespace, card_id)))
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            card = snapshot["cards"][card_id]
+            return {**card, "idLabels": list(card["idLabels"])}
+
+    def cards_with_label(self, namespace: str, board_id: str, label_id: str) -> Optional[list]:
+        """Return the board's cards carrying a label, or None without a fresh snapshot."""
+        with self._lock:
+            snapshot = self._snapshot(namespace, board_id)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            card_ids = snapshot["by_label"].get(label_id, set())
+            # Keep the board's card order
+            return [dict(card) for card_id, card in snapshot["cards"].items() if card_id in card_ids]
+
+    def add_card_label(self, namespace: str, card_id: str, label_id: str):
+        """Record a label added to a card."""
+        with self._lock:
+            snapshot = self._boards.get((namespace, self._card_boards.get((namespace, card_id))))
+            if snapshot is not None:
+                card = snapshot["cards"][card_id]
+                if label_id not in card["idLabels"]:
+                    card["idLabels"].append(label_id)
+                snapshot["by_label"].setdefault(label_id, set()).add(card_id)
+
+    def remove_card_label(self, namespace: str, card_id: str, label_id: str):
+        """Record a label removed from a card."""
+        with self._lock:
+            snapshot = self._boards.get((namespace, self._card_boards.get((namespace, card_id))))
+            if snapshot is not None:
+                card = snapshot["cards"][card_id]
+                if label_id in card["idLabels"]:
+                    card["idLabels"].remove(label_id)
+                snapshot["by_label"].get(label_id, set()).discard(card_id)
+
+    def board_of(self, namespace: str, card_id: str) -> Optional[str]:
+        """Return the board a card was last seen on."""
+        with self._lock:
+            return self._card_boards.get((namespace, card_id))
+
+    def forget_label(self, namespace: str, label_id: str):
+        """Drop a label's details after it changed."""
+        with self._lock:
+            self._labels.pop((namespace, label_id), None)
+
+    def forget_cards(self, namespace: str, board_id: Optional[str] = None):
+        """Drop card snapshots for one board, or every board, after cards change."""
+        with self._lock:
+            boards = [board_id] if board_id else [b for ns, b in self._boards if ns == namespace]
+            for board in boards:
+                self._drop_board(namespace, board)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"boards": len(self._boards), "labels": len(self._labels),
+                    "hits": self.hits, "misses": self.misses}
+
+
+label_index = LabelIndex()
+
+
+def _observe_response(namespace: str, endpoint: str, payload: Any, fetched: bool = True):
+    """Feed a response payload to the in-process indexes.
+
+    Cached responses (``fetched=False``) only feed the member directory;
+    the label index trusts snapshots by age, so it only sees fresh ones.
+    Board payloads also tell the board sync which full id a shortLink names.
+    """
+    member_directory.observe(namespace, payload)
+    if fetched:
+        label_index.observe(namespace, endpoint, payload)
+    if isinstance(payload, dict) and endpoint.count("/") == 2 and endpoint.startswith("/boards/"):
+        board_sync.add_alias(namespace, endpoint[len("/boards/"):], payload.get("id"))
+
+
+async def lookup_member(member_id: str) -> dict:
+    """Return a member's details, from the member directory when possible."""
+    member = member_directory.get(_credential_namespace(get_auth().token), member_id)
+    if member is None:
+        member = await make_trello_request_async("GET", f"/members/{member_id}", params={"fields": "fullName,username"})
+    return member
+
+
+async def _fetch_get(endpoint: str, params: Optional[dict], api_key: str, token: str) -> tuple:
+    """Fetch a GET from Trello, through the batcher when it is enabled."""
+    if request_batcher.enabled:
+        return await request_batcher.fetch(endpoint, params, api_key, token)
+    return await _request_with_retries("GET", endpoint, params, None, api_key, token)
+
+
+def _cache_generations() -> tuple:
+    """Snapshot cache generations before a fetch, to detect invalidations."""
+    return response_cache.generation, persistent_cache.generation if persistent_cache is not None else 0
+
+
+def _store_response(cache_key: tuple, payload: Any, body: Optional[bytes], generations: tuple):
+    """Write a fetched GET response to the memory and disk caches."""
+    if not response_cache.enabled and persistent_cache is None:
+        return
+    if body is None:
+        body = json.dumps(payload).encode()
+    if response_cache.enabled:
+        response_cache.put(cache_key, body, generations[0])
+    if persistent_cache is not None and persistent_cache.eligible(cache_key[1]):
+        _request_executor.submit(persistent_cache.put, cache_key, body, generations[1])
+
+
+# Background tasks are referenced here so they are not garbage collected
+_background_tasks = set()
+
+
+def _spawn_background(coro):
+    """Run a coroutine in the background, logging rather than raising failures."""
+    async def runner():
+        try:
+            await coro
+        except Exception as e:
+            logger.warning(f"Background task failed: {e}")
+    task = asyncio.get_running_loop().create_task(runner())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _revalidate(endpoint: str, params: Optional[dict], api_key: str, token: str, cache_key: tuple):
+    """Refresh a cached GET that was served stale from disk."""
+    generations = _cache_generations()
+    payload, body = await _fetch_get(endpoint, params, api_key, token)
+    _store_response(cache_key, payload, body, generations)
+    _observe_response(cache_key[0], endpoint, payload)
+    persistent_cache.revalidations += 1
+
+
+async def make_trello_request_async(method: str, endpoint: str, params: dict = None, data: dict = None,
+                                    fresh: bool = False) -> Any:
+    """Make a request to the Trello API without blocking the event loop.
+
+    GETs are answered from the response cache when possible; ``fresh``
+    GETs bypass the caches both ways, so board snapshots and action logs
+    never take cache space. Concurrent cache misses are combined into
+    ``/1/batch`` calls when batching is enabled. Any other method
+    invalidates cached responses for the resource it touches.
+    """
+    if not get_auth().is_authenticated():
+        raise ValueError(
+            "Not authenticated. Use 'authorize_interactive' for automatic authentication "
+            "or 'get_auth_url' + 'set_token' for manual setup."
+        )
+
+    api_key, token = get_auth().get_credentials()
+    namespace = _credential_namespace(token)
+
+    if method.upper() != "GET" or data is not None:
+        try:
+            payload, _ = await _request_with_retries(method, endpoint, params, data, api_key, token)
+        finally:
+            # Invalidate even on failure: a timed-out mutation may have applied.
+            # Webhook registrations change nothing a synced board holds.
+            prefix = _resource_prefix(endpoint)
+            _invalidate_namespace(namespace, (prefix,), mark_stale=prefix != "/webhooks")
+        _observe_response(namespace, endpoint, payload)
+        return payload
+
+    cache_key = response_cache.key(namespace, endpoint, params)
+    if response_cache.enabled and not fresh:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            _observe_response(namespace, endpoint, cached, fetched=False)
+            return cached
+    generations = _cache_generations()
+
+    if persistent_cache is not None and persistent_cache.eligible(endpoint) and not fresh:
+        loop = asyncio.get_running_loop()
+        stored = await loop.run_in_executor(_request_executor, persistent_cache.get, cache_key)
+        if stored is not None:
+            body, age = stored
+            if response_cache.enabled:
+                response_cache.put(cache_key, body, generations[0])
+            if age > response_cache.ttl_for(endpoint):
+                # Answer from disk now and refresh both caches in the background
+                persistent_cache.stale_hits += 1
+                _spawn_background(_revalidate(endpoint, params, api_key, token, cache_key))
+            payload = json.loads(body)
+            _observe_response(namespace, endpoint, payload, fetched=False)
+            return payload
+
+    payload, body = await _fetch_get(endpoint, params, api_key, token)
+    if not fresh:
+        _store_response(cache_key, payload, body, generations)
+    _observe_response(namespace, endpoint, payload)
+    return payload
+
+
+async def request_json_array(endpoint: str, params: dict, consume) -> Any:
+    """GET a JSON array and return ``consume`` applied to its elements.
+
+    With TRELLO_STREAM_JSON, a listing that is not cached is streamed and
+    ``consume`` runs on the worker thread as elements are decoded, so the
+    full listing is never built; it is also neither cached nor batched.
+    Otherwise this is ``consume(await make_trello_request_async(...))``.
+    """
+    if not STREAM_JSON or not get_auth().is_authenticated():
+        # (Unauthenticated calls get their error from make_trello_request_async)
+        return consume(await make_trello_request_async("GET", endpoint, params=params))
+
+    api_key, token = get_auth().get_credentials()
+    cached = response_cache.get(response_cache.key(_credential_namespace(token), endpoint, params)) \
+        if response_cache.enabled else None
+    if cached is not None:
+        return consume(cached)
+    payload, _ = await _request_with_retries("GET", endpoint, params, None, api_key, token, consume=consume)
+    return payload
+
+
+def make_trello_request(method: str, endpoint: str, params: dict = None, data: dict = None) -> dict:
+    """Make a request to the Trello API (blocking wrapper for scripts)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(make_trello_request_async(method, endpoint, params=params, data=data))
+    raise RuntimeError("make_trello_request() cannot be used inside a running event loop; "
+                       "await make_trello_request_async() instead")
+
+# One nested request for a whole board: board fields, open lists and cards,
+# labels, members with their board permissions, and the latest action id
+BOARD_SNAPSHOT_PARAMS = {
+    "fields": "name,desc,url",
+    "lists": "open", "list_fields": "name",
+    "cards": "open", "card_fields": SYNC_CARD_FIELDS,
+    "labels": "all", "label_fields": "name,color",
+    "members": "all", "member_fields": "fullName,username",
+    "memberships": "all",
+    "actions": "all", "actions_limit": 1, "action_fields": "id",
+}
+
+
+def _fill_board_caches(namespace: str, board_id: str, snapshot: dict, generations: tuple):
+    """Store the parts of a board snapshot under the cache keys the board read tools use.
+
+    Members are left out: the snapshot's ``memberType`` is the board
+    membership role, while ``list_board_members`` reports the member's
+    account type, so its answer must not depend on a snapshot.
+    """
+    parts = {
+        "get_board": (f"/boards/{board_id}", snapshot),
+        "list_board_lists": (f"/boards/{board_id}/lists", snapshot.get("lists")),
+        "list_board_cards": (f"/boards/{board_id}/cards", snapshot.get("cards")),
+        "filter_cards_by_label": (f"/boards/{board_id}/cards", snapshot.get("cards")),
+        "list_board_labels": (f"/boards/{board_id}/labels", snapshot.get("labels")),
+    }
+    for tool, (endpoint, payload) in parts.items():
+        if payload is None:
+            continue
+        fields = ["id"] + TOOL_FIELDS[tool].split(",")
+        if isinstance(payload, dict):
+            projected = {key: payload[key] for key in fields if key in payload}
+        else:
+            projected = [{key: item[key] for key in fields if key in item} for item in payload]
+        params = {"fields": TOOL_FIELDS[tool]}
+        _store_response(response_cache.key(namespace, endpoint, params), projected, None, generations)
+
+
+class BoardModel:
+    """Local mirror of one board: open lists and cards, labels and members.
+
+    Built from a single nested board snapshot and brought up to date by
+    applying the board's actions in order. Cards carry ``SYNC_CARD_FIELDS``
+    and are indexed by label, member, list and due date; every card change
+    goes through ``put_card``, ``update_card`` or ``remove_card`` so the
+    indexes stay in step with the cards.
+    """
+
+    # Actions that do not change anything the model holds
+    IGNORED_ACTIONS = {
+        "commentCard", "updateComment", "deleteComment", "copyCommentCard",
+        "addAttachmentToCard", "deleteAttachmentFromCard", "updateAttachment",
+        "addChecklistToCard", "removeChecklistFromCard", "updateChecklist",
+        "createCheckItem", "updateCheckItem", "deleteCheckItem", "updateCheckItemStateOnCard",
+        "createCustomField", "updateCustomField", "deleteCustomField", "updateCustomFieldItem",
+        "enablePowerUp", "disablePowerUp", "enablePlugin", "disablePlugin",
+        "addToOrganizationBoard", "removeFromOrganizationBoard", "voteOnCard",
+    }
+    # Actions that bring a card into the board; its details are fetched
+    CARD_ARRIVALS = {"createCard", "copyCard", "convertToCardFromCheckItem", "emailCard", "moveCardToBoard"}
+    CARD_FIELDS = SYNC_CARD_FIELDS.split(",")
+
+    def __init__(self, board_id: str, snapshot: dict):
+        self.board_id = board_id
+        self.name = snapshot.get("name")
+        self.desc = snapshot.get("desc")
+        self.url = snapshot.get("url")
+        self.lists = {item["id"]: item for item in snapshot.get("lists") or []}
+        self.labels = {item["id"]: item for item in snapshot.get("labels") or []}
+        self.members = {item["id"]: dict(item) for item in snapshot.get("members") or []}
+        for membership in snapshot.get("memberships") or []:
+            if membership.get("idMember") in self.members:
+                self.members[membership["idMember"]]["memberType"] = membership.get("memberType")
+        self.cards = {}
+        self.by_label = {}  # label id -> card ids
+        self.by_member = {}  # member id -> card ids
+        self.by_list = {}  # list id -> card ids
+        self.by_due = []  # sorted (due, card id) for cards with a due date
+        self._order = {}  # card id -> position in board order
+        for card in snapshot.get("cards") or []:
+            self.put_card(card)
+        actions = snapshot.get("actions") or []
+        self.last_action_id = actions[0]["id"] if actions else None
+        self.synced_at = time.monotonic()
+        self.stale = False
+        self.pushed = False  # Webhook deliveries keep this board current
+        self.unverified = set()  # Cards whose details must be fetched
+
+    def _index(self, card: dict):
+        for label_id in card["idLabels"]:
+            self.by_label.setdefault(label_id, set()).add(card["id"])
+        for member_id in card["idMembers"]:
+            self.by_member.setdefault(member_id, set()).add(card["id"])
+        self.by_list.setdefault(card["idList"], set()).add(card["id"])
+        if card["due"]:
+            bisect.insort(self.by_due, (card["due"], card["id"]))
+
+    def _unindex(self, card: dict):
+        for label_id in card["idLabels"]:
+            self.by_label.get(label_id, set()).discard(card["id"])
+        for member_id in card["idMembers"]:
+            self.by_member.get(member_id, set()).discard(card["id"])
+        self.by_list.get(card["idList"], set()).discard(card["id"])
+        if card["due"]:
+            position = bisect.bisect_left(self.by_due, (card["due"], card["id"]))
+            if position < len(self.by_due) and self.by_due[position] == (card["due"], card["id"]):
+                del self.by_due[position]
+
+    def put_card(self, card: dict):
+        """Add or replace a card, keeping only the synced fields."""
+        self.remove_card(card["id"], keep_order=True)
+        entry = {
+            "id": card["id"], "name": card.get("name", ""), "idList": card.get("idList"),
+            "idLabels": list(card.get("idLabels") or []), "idMembers": list(card.get("idMembers") or []),
+            "due": card.get("due"), "dueComplete": card.get("dueComplete", False), "closed": False,
+        }
+        self.cards[card["id"]] = entry
+        self._order.setdefault(card["id"], len(self._order))
+        self._index(entry)
+
+    def update_card(self, card_id: str, changes: dict):
+        """Change synced fields of a known card."""
+        card = self.cards.get(card_id)
+        if card is None:
+            return
+        self._unindex(card)
+        card.update({key: value for key, value in changes.items() if key in self.CARD_FIELDS})
+        self._index(card)
+
+    def remove_card(self, card_id: str, keep_order: bool = False):
+        card = self.cards.pop(card_id, None)
+        if card is not None:
+            self._unindex(card)
+        if not keep_order:
+            self._order.pop(card_id, None)
+
+    def card_list(self) -> list:
+        return [dict(card) for card in self.cards.values()]
+
+    def query(self, labels: tuple = (), match_all_labels: bool = True, members: tuple = (), lists: tuple = (),
+              due_after: str = None, due_before: str = None, no_due: bool = False,
+              incomplete: bool = False, name_contains: str = None) -> list:
+        """Return the cards matching every given filter, in board order.
+
+        Labels match all (or any) of the given ids, members must all be
+        assigned, lists match any. Due bounds are Trello timestamps
+        (``due_after`` inclusive, ``due_before`` exclusive). Each filter is
+        answered from its index and the candidate sets are intersected,
+        smallest first; only the name filter looks at card contents.
+        """
+        candidates = []
+        if labels:
+            sets = [self.by_label.get(label_id, set()) for label_id in labels]
+            candidates.append(set.intersection(*sets) if match_all_labels else set().union(*sets))
+        if members:
+            candidates.append(set.intersection(*[self.by_member.get(member_id, set()) for member_id in members]))
+        if lists:
+            candidates.append(set().union(*[self.by_list.get(list_id, set()) for list_id in lists]))
+        if due_after or due_before:
+            start = bisect.bisect_left(self.by_due, (due_after,)) if due_after else 0
+            end = bisect.bisect_left(self.by_due, (due_before,)) if due_before else len(self.by_due)
+            candidates.append({card_id for _, card_id in self.by_due[start:end]})
+        if no_due:
+            candidates.append(set(self.cards) - {card_id for _, card_id in self.by_due})
+        if candidates:
+            candidates.sort(key=len)
+            matches = candidates[0].intersection(*candidates[1:])
+        else:
+            matches = set(self.cards)
+        cards = [self.cards[card_id] for card_id in sorted(matches, key=self._order.__getitem__)]
+        if incomplete:
+            cards = [card for card in cards if not card["dueComplete"]]
+        if name_contains:
+            needle = name_contains.lower()
+            cards = [card for card in cards if needle in card["name"].lower()]
+        return [dict(card) for card in cards]
+
+    def apply(self, action: dict) -> bool:
+        """Apply one action; returns False when only a full resync can bring the model up to date."""
+        kind = action.get("type")
+        data = action.get("data") or {}
+        card = self.cards.get((data.get("card") or {}).get("id"))
+
+        if kind in self.IGNORED_ACTIONS:
+            return True
+
+        elif kind in self.CARD_ARRIVALS:
+            arrived = data.get("card") or {}
+            self.put_card({**arrived, "idList": (data.get("list") or {}).get("id")})
+            self.unverified.add(arrived["id"])
+
+        elif kind == "updateCard":
+            changed = data.get("card") or {}
+            if changed.get("closed") is True:
+                self.remove_card(changed.get("id"))
+            elif card is None:
+                if "closed" in (data.get("old") or {}):
+                    # Unarchived: the card rejoins the open cards
+                    self.put_card({**changed, "idList": changed.get("idList", (data.get("list") or {}).get("id"))})
+                    self.unverified.add(changed["id"])
+            else:
+                self.update_card(card["id"], {key: changed[key] for key in data.get("old") or {} if key in changed})
+
+        elif kind in ("deleteCard", "moveCardFromBoard"):
+            self.remove_card((data.get("card") or {}).get("id"))
+
+        elif kind in ("addLabelToCard", "removeLabelFromCard"):
+            label = data.get("label") or {}
+            if "id" in label and label["id"] not in self.labels:
+                self.labels[label["id"]] = {"id": label["id"], "name": label.get("name"), "color": label.get("color")}
+            if card is not None:
+                others = [label_id for label_id in card["idLabels"] if label_id != label.get("id")]
+                self.update_card(card["id"], {"idLabels": others + [label["id"]] if kind == "addLabelToCard" else others})
+
+        elif kind in ("addMemberToCard", "removeMemberFromCard"):
+            member_id = data.get("idMember")
+            if card is not None:
+                others = [member for member in card["idMembers"] if member != member_id]
+                self.update_card(card["id"], {"idMembers": others + [member_id] if kind == "addMemberToCard" else others})
+
+        elif kind in ("createLabel", "updateLabel"):
+            label = data.get("label") or {}
+            known = self.labels.get(label.get("id"), {})
+            self.labels[label["id"]] = {**known, **{k: label[k] for k in ("id", "name", "color") if k in label}}
+
+        elif kind == "deleteLabel":
+            label_id = (data.get("label") or {}).get("id")
+            self.labels.pop(label_id, None)
+            for card_id in list(self.by_label.pop(label_id, ())):
+                self.update_card(card_id, {"idLabels": [l for l in self.cards[card_id]["idLabels"] if l != label_id]})
+
+        elif kind in ("createList", "updateList"):
+            changed = data.get("list") or {}
+            if changed.get("closed") is True:
+                self.lists.pop(changed.get("id"), None)
+            else:
+                known = self.lists.get(changed.get("id"), {})
+                self.lists[changed["id"]] = {**known, **{k: changed[k] for k in ("id", "name") if k in changed}}
+
+        elif kind == "moveListFromBoard":
+            list_id = (data.get("list") or {}).get("id")
+            self.lists.pop(list_id, None)
+            for card_id in list(self.by_list.get(list_id, ())):
+                self.remove_card(card_id)
+
+        elif kind == "updateBoard":
+            if "name" in (data.get("old") or {}):
+                self.name = (data.get("board") or {}).get("name", self.name)
+
+        else:
+            # Membership changes, lists arriving from other boards and
+            # anything unknown: take a new snapshot
+            return False
+        return True
+
+
+class BoardSync:
+    """Keeps synced ``BoardModel`` copies of the boards read tools ask about.
+
+    The first read of a board takes one nested snapshot
+    (``/boards/{id}?lists=open&cards=open&labels=all&members=all``). Later
+    reads within ``interval`` seconds are answered locally; after that, or
+    once a mutation marked the board stale, one request for
+    ``/boards/{id}/actions?since=<last action id>`` brings it up to date.
+    Unknown actions, or a full page of actions, trigger a fresh snapshot.
+    Boards with a registered webhook get actions pushed as they happen and
+    only check the action log every ``push_interval`` seconds.
+
+    Models are keyed by the board's full id; a shortLink seen in a board
+    request is kept as an alias of it, so cards, webhook pushes and cache
+    invalidations by full id reach boards the caller named by shortLink.
+    """
+
+    def __init__(self, enabled: bool = BOARD_SYNC_ENABLED, interval: float = SYNC_INTERVAL,
+                 actions_limit: int = SYNC_ACTIONS_LIMIT, max_boards: int = 20,
+                 push_interval: float = WEBHOOK_SYNC_INTERVAL):
+        self.enabled = enabled
+        self.interval = interval
+        self.push_interval = push_interval
+        self.actions_limit = actions_limit
+        self.max_boards = max_boards
+        self._models = OrderedDict()  # (namespace, board id) -> BoardModel
+        self._aliases = OrderedDict()  # (namespace, shortLink) -> board id
+        self.max_aliases = max_boards * 50
+        self._lock = threading.Lock()
+        self.snapshots = 0
+        self.refreshes = 0
+        self.actions_applied = 0
+        self.resyncs = 0
+        self.local_reads = 0
+        self.pushed_actions = 0
+
+    def covers(self, arguments: dict, fields: str = SYNC_CARD_FIELDS) -> bool:
+        """Whether a read can be served from synced state (no extra fields beyond ``fields``)."""
+        return self.enabled and set(_requested_fields(arguments)) <= set(fields.split(","))
+
+    def add_alias(self, namespace: str, alias: str, board_id: Optional[str]):
+        """Remember that ``alias`` (a shortLink) names the board ``board_id``."""
+        if not board_id or alias == board_id:
+            return
+        with self._lock:
+            self._aliases[(namespace, alias)] = board_id
+            self._aliases.move_to_end((namespace, alias))
+            while len(self._aliases) > self.max_aliases:
+                self._aliases.popitem(last=False)
+
+    def with_aliases(self, namespace: str, prefixes: tuple) -> tuple:
+        """Add the same ``/boards/...`` prefixes under every other name of each board."""
+        with self._lock:
+            names = {}
+            for (alias_namespace, alias), board_id in self._aliases.items():
+                if alias_namespace == namespace:
+                    names.setdefault(board_id, {board_id}).add(alias)
+                    names[alias] = names[board_id]
+        if not names:
+            return prefixes
+        expanded = list(prefixes)
+        for prefix in prefixes:
+            match = re.match(r"/boards/([^/]+)(.*)$", prefix)
+            for name in sorted(names.get(match.group(1), ())) if match else ():
+                aliased = f"/boards/{name}{match.group(2)}"
+                if aliased not in expanded:
+                    expanded.append(aliased)
+        return tuple(expanded)
+
+    def _model(self, namespace: str, board_id: str) -> Optional[BoardModel]:
+        with self._lock:
+            board_id = self._aliases.get((namespace, board_id), board_id)
+            return self._models.get((namespace, board_id))
+
+    def mark_stale(self, namespace: str):
+        """Make the next read of each synced board check for new actions."""
+        with self._lock:
+            for (model_namespace, _), model in self._models.items():
+                if model_namespace == namespace:
+                    model.stale = True
+
+    def set_pushed(self, namespace: str, board_id: str):
+        """Note that a webhook now delivers this board's actions."""
+        model = self._model(namespace, board_id)
+        if model is not None:
+            model.pushed = True
+
+    def push(self, namespace: str, board_id: str, action: dict):
+        """Apply an action delivered by a webhook to the board's model.
+
+        The action log pointer is left alone, so the next scheduled refresh
+        still replays anything a missed delivery would have carried.
+        """
+        model = self._model(namespace, board_id)
+        if model is None:
+            return
+        self.pushed_actions += 1
+        if not model.apply(action) or model.unverified:
+            model.stale = True
+
+    def board_of(self, namespace: str, card_id: str) -> Optional[str]:
+        """Return the synced board holding a card, if any."""
+        with self._lock:
+            for (model_namespace, board_id), model in self._models.items():
+                if model_namespace == namespace and card_id in model.cards:
+                    return board_id
+        return None
+
+    def locate_cards(self, namespace: str, card_ids) -> dict:
+        """Return ``{card id: (board id, card)}`` for the cards synced boards hold.
+
+        Answers from the models as they are, without refreshing them; use
+        it for hints that are checked before being acted on.
+        """
+        located = {}
+        with self._lock:
+            for (model_namespace, board_id), model in self._models.items():
+                if model_namespace != namespace:
+                    continue
+                for card_id in card_ids:
+                    card = model.cards.get(card_id)
+                    if card is not None:
+                        located[card_id] = (board_id, dict(card))
+        return located
+
+    def require_snapshot(self, namespace: str, board_id: str):
+        """Make the next read of a synced board take a fresh snapshot.
+
+        For list-level bulk changes, whose per-card actions cost more to
+        replay than one snapshot.
+        """
+        model = self._model(namespace, board_id)
+        if model is not None:
+            model.last_action_id = None
+            model.stale = True
+
+    def board_of_list(self, namespace: str, list_id: str) -> Optional[str]:
+        """Return the synced board holding a list, if any."""
+        with self._lock:
+            for (model_namespace, board_id), model in self._models.items():
+                if model_namespace == namespace and list_id in model.lists:
+                    return board_id
+        return None
+
+    async def board(self, board_id: str) -> BoardModel:
+        """Return an up-to-date model of a board."""
+        namespace = _credential_namespace(get_auth().token)
+        with self._lock:
+            board_id = self._aliases.get((namespace, board_id), board_id)
+            model = self._models.get((namespace, board_id))
+            if model is not None:
+                self._models.move_to_end((namespace, board_id))
+        if model is None:
+            return await self._snapshot(namespace, board_id)
+        interval = self.push_interval if model.pushed else self.interval
+        if not model.stale and time.monotonic() - model.synced_at < interval:
+            self.local_reads += 1
+            return model
+        return await self._refresh(namespace, model)
+
+    async def _snapshot(self, namespace: str, board_id: str) -> BoardModel:
+        generations = _cache_generations()
+        payload = await make_trello_request_async("GET", f"/boards/{board_id}", params=BOARD_SNAPSHOT_PARAMS, fresh=True)
+        requested, board_id = board_id, payload.get("id") or board_id
+        for cached_id in OrderedDict.fromkeys((board_id, requested)):
+            _fill_board_caches(namespace, cached_id, payload, generations)
+        model = BoardModel(board_id, payload)
+        with self._lock:
+            previous = self._models.get((namespace, board_id))
+            model.pushed = previous is not None and previous.pushed
+            self._models[(namespace, board_id)] = model
+            while len(self._models) > self.max_boards:
+                self._models.popitem(last=False)
+        self.snapshots += 1
+        if webhook_receiver.running and not model.pushed:
+            _spawn_background(webhook_receiver.register(namespace, board_id))
+        return model
+
+    async def _resync(self, namespace: str, model: BoardModel) -> BoardModel:
+        self.resyncs += 1
+        return await self._snapshot(namespace, model.board_id)
+
+    async def _refresh(self, namespace: str, model: BoardModel) -> BoardModel:
+        since = model.last_action_id
+        if since is None:
+            return await self._resync(namespace, model)
+        # Mutations made while the refresh is in flight mark it stale again
+        started = time.monotonic()
+        model.stale = False
+        try:
+            actions = await make_trello_request_async("GET", f"/boards/{model.board_id}/actions", params={
+                "since": since, "limit": self.actions_limit, "fields": "type,data,date", "memberCreator": "false",
+            }, fresh=True)
+        except Exception:
+            model.stale = True
+            raise
+        self.refreshes += 1
+        if len(actions) >= self.actions_limit:
+            return await self._resync(namespace, model)
+        if model.last_action_id != since:
+            return model  # A concurrent refresh already applied these
+        for action in reversed(actions):  # Trello lists newest first
+            if action["id"] == since:
+                continue
+            if not model.apply(action):
+                return await self._resync(namespace, model)
+            self.actions_applied += 1
+        if actions:
+            model.last_action_id = actions[0]["id"]
+        model.synced_at = started
+        if model.unverified:
+            await self._verify_cards(model)
+        return model
+
+    async def _verify_cards(self, model: BoardModel):
+        """Fetch the details of cards that arrived through actions."""
+        card_ids, model.unverified = list(model.unverified), set()
+        results = await asyncio.gather(*(
+            make_trello_request_async("GET", f"/cards/{card_id}", params={"fields": f"{SYNC_CARD_FIELDS},idBoard"},
+                                      fresh=True)
+            for card_id in card_ids
+        ), return_exceptions=True)
+        for card_id, card in zip(card_ids, results):
+            if isinstance(card, requests.exceptions.HTTPError) and card.response is not None \
+                    and card.response.status_code == 404:
+                model.remove_card(card_id)  # Deleted since
+            elif isinstance(card, BaseException):
+                model.stale = True  # Try again on the next read
+                model.unverified.add(card_id)
+            elif card.get("idBoard") != model.board_id or card.get("closed"):
+                model.remove_card(card_id)
+            else:
+                model.put_card(card)
+
+    def stats(self) -> dict:
+        with self._lock:
+            boards = len(self._models)
+        return {"boards": boards, "snapshots": self.snapshots, "refreshes": self.refreshes,
+                "actions_applied": self.actions_applied, "resyncs": self.resyncs, "local_reads": self.local_reads,
+                "pushed_actions": self.pushed_actions}
+
+
+board_sync = BoardSync()
+
+
+class WebhookReceiver:
+    """Local listener for Trello webhooks that keeps caches and synced boards current.
+
+    Runs an HTTP server (from ``local_server``) on a daemon thread like
+    the OAuth callback. When ``callback_url`` is set (the public address of the
+    listener, e.g. a tunnel), a webhook is registered for every board the
+    board sync picks up; deliveries then invalidate the cached responses
+    they affect and are applied to the board's model directly. Deliveries
+    are signed by Trello with the API secret, so registering webhooks
+    requires ``secret``; unsigned or mis-signed posts are then rejected.
+    Without a secret (a local listener for testing) deliveries cannot be
+    trusted: they only invalidate caches and mark boards stale, so the
+    next read catches up from the board's action log.
+    """
+
+    def __init__(self, callback_url: str = WEBHOOK_URL, secret: str = WEBHOOK_SECRET,
+                 host: str = WEBHOOK_HOST, port: int = WEBHOOK_PORT):
+        self.callback_url = callback_url.rstrip("/")
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.loop = None
+        self._server = None
+        self._registered = {}  # (namespace, board id) -> webhook id
+        self._owners = {}  # namespace -> TrelloAuth the webhooks were registered with
+        self._lock = threading.Lock()
+        self.received = 0
+        self.rejected = 0
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> int:
+        """Start listening; deliveries are applied on ``loop`` when given. Returns the port."""
+        if self.callback_url and not self.secret:
+            raise ValueError("TRELLO_WEBHOOK_URL requires TRELLO_API_SECRET to verify webhook deliveries")
+        from local_server import start_webhook_server
+        self.loop = loop
+        self._server = start_webhook_server(self, self.host, self.port, WEBHOOK_MAX_BODY)
+        self.port = self._server.server_address[1]
+        logger.info(f"Webhook receiver listening on {self.host}:{self.port}")
+        return self.port
+
+    async def stop(self):
+        """Delete the webhooks registered with Trello, then stop listening.
+
+        Webhooks that are already gone (404) are skipped silently; other
+        failures are logged, and Trello drops such webhooks by itself once
+        deliveries keep failing.
+        """
+        with self._lock:
+            registered = [(namespace, webhook_id) for (namespace, _), webhook_id in self._registered.items()
+                          if webhook_id]
+            self._registered.clear()
+        results = await asyncio.gather(*(self._delete(namespace, webhook_id) for namespace, webhook_id in registered),
+                                       return_exceptions=True)
+        for (_, webhook_id), result in zip(registered, results):
+            if isinstance(result, requests.exceptions.HTTPError) and result.response is not None \
+                    and result.response.status_code == 404:
+                continue
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not delete webhook {webhook_id}: {result}")
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    async def _delete(self, namespace: str, webhook_id: str):
+        # Delete with the credentials that registered the webhook
+        scope = _session_auth.set(self._owners.get(namespace))
+        try:
+            await make_trello_request_async("DELETE", f"/webhooks/{webhook_id}")
+        finally:
+            _session_auth.reset(scope)
+
+    def verify(self, path: str, body: bytes, signature: Optional[str]) -> bool:
+        """Check Trello's signature: base64 HMAC-SHA1 of the body plus callback URL."""
+        if not self.secret:
+            return True
+        expected = base64.b64encode(hmac.new(
+            self.secret.encode(), body + (self.callback_url + path).encode(), hashlib.sha1
+        ).digest()).decode()
+        return signature is not None and hmac.compare_digest(expected, signature)
+
+    def receive(self, path: str, body: bytes, signature: Optional[str]) -> int:
+        """Handle one delivery on the listener thread; returns the HTTP status."""
+        if not self.verify(path, body, signature):
+            self.rejected += 1
+            logger.warning("Rejected webhook delivery with an invalid signature")
+            return 401
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self.rejected += 1
+            return 400
+        # Registered callbacks end in the credential namespace
+        namespace = urlparse(path).path.strip("/") or _credential_namespace(get_auth().token)
+        verified = bool(self.secret)
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.apply, namespace, payload, verified)
+        else:
+            self.apply(namespace, payload, verified)
+        return 200
+
+    def apply(self, namespace: str, payload: dict, verified: bool = True):
+        """Invalidate what an action changed and patch the board's model.
+
+        Unverified deliveries never reach the model or the member
+        directory; they only invalidate and mark the namespace's boards
+        stale.
+        """
+        action = payload.get("action") or {}
+        data = action.get("data") or {}
+        board_id = (data.get("board") or {}).get("id") or (payload.get("model") or {}).get("id")
+        self.received += 1
+        if verified:
+            member_directory.observe(namespace, action.get("memberCreator"))
+
+        prefixes = [f"/boards/{board_id}"] if board_id else []
+        for key, root in (("card", "/cards"), ("list", "/lists"), ("label", "/labels")):
+            item_id = (data.get(key) or {}).get("id")
+            if item_id:
+                prefixes.append(f"{root}/{item_id}")
+        _invalidate_namespace(namespace, tuple(prefixes), mark_stale=not verified)
+        if (data.get("label") or {}).get("id"):
+            label_index.forget_label(namespace, data["label"]["id"])
+        if data.get("card") or data.get("list"):
+            label_index.forget_cards(namespace, board_id)
+        if board_id and verified:
+            board_sync.push(namespace, board_id, action)
+
+    async def register(self, namespace: str, board_id: str):
+        """Register a webhook for a board, once per board and credentials."""
+        with self._lock:
+            if not self.callback_url or not self.secret or (namespace, board_id) in self._registered:
+                return
+            self._registered[(namespace, board_id)] = None
+            self._owners[namespace] = get_auth()
+        try:
+            webhook = await make_trello_request_async("POST", "/webhooks", data={
+                "callbackURL": f"{self.callback_url}/{namespace}",
+                "idModel": board_id,
+                "description": "trello-mcp-server cache invalidation",
+            })
+            self._registered[(namespace, board_id)] = webhook.get("id", "")
+        except requests.exceptions.HTTPError as e:
+            # Trello refuses duplicates for the same callback, model and token
+            if e.response is None or "already exists" not in e.response.text:
+                logger.warning(f"Could not register webhook for board {board_id}: {e}")
+                self._registered.pop((namespace, board_id), None)
+                return
+            self._registered[(namespace, board_id)] = ""
+        board_sync.set_pushed(namespace, board_id)
+
+    def stats(self) -> dict:
+        with self._lock:
+            registered = sum(1 for webhook in self._registered.values() if webhook is not None)
+        return {"running": self.running, "registered": registered, "received": self.received,
+                "rejected": self.rejected}
+
+
+webhook_receiver = WebhookReceiver()
+
+def format_board_snapshot(model: BoardModel) -> str:
+    """Render a board with its cards grouped under their lists."""
+    lines = [f"Board: {model.name} (ID: {model.board_id})"]
+    if model.url:
+        lines.append(f"URL: {model.url}")
+    if model.desc:
+        lines.append(f"Description: {model.desc}")
+    lines.append("Members: " + (", ".join(
+        f"{member.get('fullName')} (@{member.get('username')}, {member.get('memberType', 'normal')})"
+        for member in model.members.values()
+    ) or "(none)"))
+    lines.append("Labels: " + (", ".join(
+        f"{label.get('name') or 'Unnamed'} ({label.get('color') or 'none'}, ID: {label['id']})"
+        for label in model.labels.values()
+    ) or "(none)"))
+
+    cards_by_list = {}
+    for card in model.cards.values():
+        cards_by_list.setdefault(card["idList"], []).append(card)
+    groups = [(item["name"], list_id) for list_id, item in model.lists.items()]
+    groups += [("(Archived or unknown list)", list_id) for list_id in cards_by_list if list_id not in model.lists]
+    for list_name, list_id in groups:
+        cards = cards_by_list.get(list_id, [])
+        lines.append("")
+        lines.append(f"{list_name} (ID: {list_id}) - {len(cards)} card{'' if len(cards) == 1 else 's'}")
+        for card in cards:
+            details = []
+            labels = [model.labels[label_id].get("name") or model.labels[label_id].get("color") or "Unnamed"
+                      for label_id in card["idLabels"] if label_id in model.labels]
+            if labels:
+                details.append("Labels: " + ", ".join(labels))
+            members = [model.members[member_id].get("fullName", member_id)
+                       for member_id in card["idMembers"] if member_id in model.members]
+            if members:
+                details.append("Members: " + ", ".join(members))
+            if card["due"]:
+                details.append(f"Due: {card['due']}" + (" (complete)" if card["dueComplete"] else ""))
+            lines.append(f"- {card['name']} (ID: {card['id']})" + "".join(f" | {detail}" for detail in details))
+    return "\n".join(lines)
+
+
+# Named due date windows accepted by query_cards (UTC days, weeks start Monday)
+DUE_WINDOWS = ("overdue", "today", "this_week", "next_week", "none")
+
+
+def _trello_timestamp(moment: datetime) -> str:
+    """Format a datetime the way Trello stores due dates."""
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _parse_timestamp(value: str, field_name: str) -> str:
+    """Turn an ISO date or datetime argument into a Trello timestamp."""
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid {field_name}: expected an ISO date such as 2026-01-31 or 2026-01-31T17:00:00Z")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return _trello_timestamp(moment)
+
+
+def _due_window(window: str, now: datetime) -> dict:
+    """Return ``BoardModel.query`` arguments for a named due date window."""
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week = today - timedelta(days=today.weekday())
+    if window == "overdue":
+        return {"due_before": _trello_timestamp(now), "incomplete": True}
+    if window == "today":
+        return {"due_after": _trello_timestamp(today), "due_before": _trello_timestamp(today + timedelta(days=1))}
+    if window == "this_week":
+        return {"due_after": _trello_timestamp(week), "due_before": _trello_timestamp(week + timedelta(days=7))}
+    if window == "next_week":
+        return {"due_after": _trello_timestamp(week + timedelta(days=7)),
+                "due_before": _trello_timestamp(week + timedelta(days=14))}
+    if window == "none":
+        return {"no_due": True}
+    raise ValueError(f"Invalid due window. Must be one of: {', '.join(DUE_WINDOWS)}")
+
+
+def _resolve_names(values: str, known: dict, name_keys: tuple, kind: str) -> tuple:
+    """Map comma-separated ids or names (case-insensitive) to ids on a board.
+
+    ``name_keys`` are tried in order (a member's username before their full
+    name); a name shared by several items is rejected with their ids.
+    """
+    ids = []
+    for value in (value.strip() for value in values.split(",")):
+        if not value:
+            continue
+        if value in known:
+            ids.append(value)
+            continue
+        for key in name_keys:
+            matches = [item["id"] for item in known.values() if str(item.get(key) or "").lower() == value.lower()]
+            if matches:
+                break
+        if not matches:
+            raise ValueError(f"Unknown {kind} on this board: {value}")
+        if len(matches) > 1:
+            raise ValueError(f"Ambiguous {kind} on this board: {value} matches IDs {', '.join(matches)}; "
+                             f"pass one of the IDs instead")
+        ids.append(matches[0])
+    return tuple(ids)
+
+
+def _card_query(model: BoardModel, arguments: dict, now: datetime = None) -> dict:
+    """Translate query_cards arguments into ``BoardModel.query`` arguments."""
+    query = {}
+    if arguments.get("labels"):
+        query["labels"] = _resolve_names(arguments["labels"], model.labels, ("name",), "label")
+        query["match_all_labels"] = arguments.get("label_match", "all") != "any"
+    if arguments.get("members"):
+        query["members"] = _resolve_names(arguments["members"], model.members, ("username", "fullName"), "member")
+    if arguments.get("lists"):
+        query["lists"] = _resolve_names(arguments["lists"], model.lists, ("name",), "list")
+    if arguments.get("due"):
+        query.update(_due_window(arguments["due"], now or datetime.now(timezone.utc)))
+    if arguments.get("due_after"):
+        query["due_after"] = max(query.get("due_after", ""), _parse_timestamp(arguments["due_after"], "due_after"))
+    if arguments.get("due_before"):
+        bound = _parse_timestamp(arguments["due_before"], "due_before")
+        query["due_before"] = min(query["due_before"], bound) if "due_before" in query else bound
+    if arguments.get("incomplete"):
+        query["incomplete"] = True
+    if arguments.get("name_contains"):
+        query["name_contains"] = arguments["name_contains"]
+    return query
+
+
+def _error_message(error: Exception) -> str:
+    """Describe a failed request without exposing Trello's response details."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        status_code = error.response.status_code if error.response is not None else 'unknown'
+        if status_code == 401:
+            return "Authentication failed. Please check your credentials."
+        elif status_code == 403:
+            return "Permission denied. You don't have access to this resource."
+        elif status_code == 404:
+            return "Resource not found. Please check the ID."
+        elif status_code == 429:
+            return "Rate limit exceeded. Please try again later."
+        return f"API request failed (status {status_code})."
+    if isinstance(error, requests.exceptions.Timeout):
+        return "Request timed out. Please try again."
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return "Cannot connect to Trello API. Please check your network."
+    return "An unexpected error occurred. Please try again."
+
+
+async def _report_progress(progress: int, total: int, message: str):
+    """Send an MCP progress notification if the client asked for them."""
+    try:
+        context = app.request_context
+    except LookupError:
+        return  # Not called through an MCP session
+    token = context.meta.progressToken if context.meta else None
+    if token is None:
+        return
+    try:
+        await context.session.send_progress_notification(token, progress, total, message)
+    except Exception as e:
+        logger.debug(f"Could not send progress notification: {e}")
+
+
+async def run_bulk(items: list, operation, description: str) -> list:
+    """Run ``operation(item)`` for every item, BULK_CONCURRENCY at a time.
+
+    Requests still go through the rate limiter, so large batches are paced
+    to the token's budget. Returns ``(result, error)`` pairs in input
+    order; a failed request is recorded as its error without stopping the
+    others. Progress is reported to the client as operations finish.
+    """
+    semaphore = asyncio.Semaphore(max(1, BULK_CONCURRENCY))
+    finished = 0
+
+    async def run(item):
+        nonlocal finished
+        async with semaphore:
+            try:
+                outcome = await operation(item), None
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Bulk {description} failed for {item!r}: {e}")
+                outcome = None, e
+        finished += 1
+        await _report_progress(finished, len(items), f"{description}: {finished} of {len(items)} done")
+        return outcome
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+def _bulk_items(value: Any, kind: str) -> list:
+    """Check the list argument of a bulk tool.
+
+    Raises:
+        ValueError: If it is not a non-empty list within BULK_MAX_ITEMS
+    """
+    if not isinstance(value, list) or not value:
+        raise ValueError(f"{kind} must be a non-empty array")
+    if len(value) > BULK_MAX_ITEMS:
+        raise ValueError(f"Too many {kind}: at most {BULK_MAX_ITEMS} per call")
+    return value
+
+
+def validate_card_specs(specs: Any) -> list:
+    """Validate the card specs of create_cards into POST /cards bodies.
+
+    Raises:
+        ValueError: If a spec lacks a list ID or name, or has a malformed ID
+    """
+    bodies = []
+    for number, spec in enumerate(_bulk_items(specs, "cards"), start=1):
+        try:
+            if not isinstance(spec, dict):
+                raise ValueError("must be an object")
+            if not isinstance(spec.get("name"), str) or not spec["name"].strip():
+                raise ValueError("name cannot be empty")
+            body = {"idList": validate_trello_id(spec.get("list_id"), "List ID"), "name": spec["name"]}
+            if spec.get("desc"):
+                body["desc"] = str(spec["desc"])
+            for key, field, id_type in (("labels", "idLabels", "Label ID"), ("members", "idMembers", "Member ID")):
+                if spec.get(key):
+                    if not isinstance(spec[key], list):
+                        raise ValueError(f"{key} must be an array of IDs")
+                    body[field] = ",".join(validate_trello_id(value, id_type) for value in spec[key])
+        except ValueError as e:
+            raise ValueError(f"Card {number}: {e}")
+        bodies.append(body)
+    return bodies
+
+
+def _table_cell(value: Any) -> str:
+    """Flatten a value for one cell of a result table."""
+    return str(value).replace("|", "/").replace("\n", " ")
+
+
+def format_create_results(bodies: list, outcomes: list) -> str:
+    """Render the result table of create_cards."""
+    created = sum(1 for card, _ in outcomes if card is not None)
+    lines = [f"Created {created} of {len(bodies)} cards:", "| # | Name | List | Result |", "|---|---|---|---|"]
+    for number, (body, (card, error)) in enumerate(zip(bodies, outcomes), start=1):
+        result = f"ID: {card['id']}" if card is not None else f"Failed: {_error_message(error)}"
+        lines.append(f"| {number} | {_table_cell(body['name'])} | {body['idList']} | {result} |")
+    return "\n".join(lines)
+
+
+# Card fields update_cards can change, by argument name
+CARD_UPDATE_FIELDS = {"name": "name", "desc": "desc", "list_id": "idList"}
+
+# A group of at least this many cards moved out of one list is checked
+# against the list's contents and moved with one moveAllCards request
+LIST_MOVE_MIN_CARDS = 3
+
+
+def validate_card_updates(updates: Any) -> OrderedDict:
+    """Merge the updates of update_cards into one PUT body per card.
+
+    Later changes to the same card override earlier ones.
+
+    Raises:
+        ValueError: If an update lacks a card ID or changes, or has a malformed ID
+    """
+    merged = OrderedDict()
+    for number, update in enumerate(_bulk_items(updates, "updates"), start=1):
+        try:
+            if not isinstance(update, dict):
+                raise ValueError("must be an object")
+            card_id = validate_trello_id(update.get("card_id"), "Card ID")
+            changes = {field: update[key] for key, field in CARD_UPDATE_FIELDS.items() if key in update}
+            if not changes:
+                raise ValueError("no changes given (name, desc or list_id)")
+            if "idList" in changes:
+                validate_trello_id(changes["idList"], "List ID")
+            if "name" in changes and (not isinstance(changes["name"], str) or not changes["name"].strip()):
+                raise ValueError("name cannot be empty")
+        except ValueError as e:
+            raise ValueError(f"Update {number}: {e}")
+        merged.setdefault(card_id, {}).update(changes)
+    return merged
+
+
+async def _move_whole_lists(namespace: str, merged: OrderedDict) -> dict:
+    """Move cards with ``/lists/{id}/moveAllCards`` where a whole list moves.
+
+    Cards whose only change is their list are grouped by source list (as
+    known to the synced boards) and destination. A group is moved in one
+    request only after a fresh read of the source list shows it holds
+    exactly those cards. Returns ``{card id: source list id}`` for the
+    cards moved this way; the rest are left for per-card updates.
+    """
+    moves = [card_id for card_id, changes in merged.items() if set(changes) == {"idList"}]
+    if len(moves) < LIST_MOVE_MIN_CARDS:
+        return {}
+    groups = {}
+    for card_id, (_, card) in board_sync.locate_cards(namespace, moves).items():
+        source, destination = card["idList"], merged[card_id]["idList"]
+        if source != destination:
+            groups.setdefault((source, destination), set()).add(card_id)
+
+    moved = {}
+    for (source, destination), card_ids in groups.items():
+        if len(card_ids) < LIST_MOVE_MIN_CARDS:
+            continue
+        try:
+            current = await make_trello_request_async("GET", f"/lists/{source}/cards", params={"fields": "id"},
+                                                      fresh=True)
+            if {card["id"] for card in current} != card_ids:
+                continue
+            board_id = board_sync.board_of_list(namespace, destination)
+            if board_id is None:
+                board_id = (await make_trello_request_async(
+                    "GET", f"/lists/{destination}", params={"fields": "idBoard"}))["idBoard"]
+            await make_trello_request_async("POST", f"/lists/{source}/moveAllCards",
+                                            data={"idBoard": board_id, "idList": destination})
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Moving list {source} in one request failed, updating its cards one by one: {e}")
+            continue
+        moved.update((card_id, source) for card_id in card_ids)
+    return moved
+
+
+def format_update_results(merged: OrderedDict, outcomes: dict, list_moves: dict) -> str:
+    """Render the per-card outcomes of update_cards."""
+    updated = len(list_moves) + sum(1 for card, _ in outcomes.values() if card is not None)
+    header = f"Updated {updated} of {len(merged)} cards"
+    if list_moves:
+        sources = len(set(list_moves.values()))
+        header += f" ({len(list_moves)} moved with {sources} moveAllCards request{'s' if sources != 1 else ''})"
+    lines = [header + ":", "| Card | Changes | Result |", "|---|---|---|"]
+    for card_id, changes in merged.items():
+        described = ", ".join(f"list -> {value}" if field == "idList" else field for field, value in changes.items())
+        if card_id in list_moves:
+            result = f"Moved with list {list_moves[card_id]}"
+        else:
+            card, error = outcomes[card_id]
+            result = f"Updated: {_table_cell(card['name'])}" if card is not None else f"Failed: {_error_message(error)}"
+        lines.append(f"| {card_id} | {described} | {result} |")
+    return "\n".join(lines)
+
+
+async def board_of_list(namespace: str, list_id: str) -> str:
+    """Return the board a list is on, from a synced board or the API."""
+    board_id = board_sync.board_of_list(namespace, list_id)
+    if board_id is None:
+        board_id = (await make_trello_request_async("GET", f"/lists/{list_id}", params={"fields": "idBoard"}))["idBoard"]
+    return board_id
+
+
+def invalidate_board_lists(namespace: str, board_id: str):
+    """Drop a board's cached list and card listings after a list-level change.
+
+    Its synced copy takes a fresh snapshot on the next read instead of
+    replaying one action per card.
+    """
+    invalidate_cache(f"/boards/{board_id}/lists")
+    invalidate_card_listings({"idBoard": board_id})
+    board_sync.require_snapshot(namespace, board_id)
+
+
+# Gap between list positions written by reorder_lists
+LIST_POS_STEP = 16384
+
+
+def reorder_positions(lists: list, order: list) -> dict:
+    """Return new positions for the lists that must move to follow ``order``.
+
+    ``lists`` carry their current ``pos``. Walking the target order, a list
+    keeps its position when it already sorts after the previous one, and
+    is placed just after it otherwise.
+    """
+    positions = {lst["id"]: lst["pos"] for lst in lists}
+    moves, previous = {}, None
+    for list_id in order:
+        pos = positions[list_id]
+        if previous is not None and pos <= previous:
+            pos = moves[list_id] = previous + LIST_POS_STEP
+        previous = pos
+    return moves
+
+
+# Bulk assignment tools: the card field each changes and whether it adds
+CARD_ASSIGNMENTS = {
+    "add_label_to_cards": ("idLabels", True),
+    "remove_label_from_cards": ("idLabels", False),
+    "add_member_to_cards": ("idMembers", True),
+    "remove_member_from_cards": ("idMembers", False),
+}
+
+
+async def select_cards(namespace: str, arguments: dict) -> tuple:
+    """Resolve the card selection of a bulk assignment tool.
+
+    Cards are given as ``card_ids``, or as every card on ``board_id``
+    matching the optional ``filter_label_id`` and ``filter_list_id``; with
+    both, the ids are narrowed to the board's matching cards. Returns
+    ``(card ids, known cards, models)``: the known cards are the current
+    state the board data holds, read from the synced boards (brought up to
+    date first, and returned as ``models``) or the label index.
+
+    Raises:
+        ValueError: If no selection is given, or it has malformed IDs or too many cards
+    """
+    card_ids = arguments.get("card_ids")
+    if card_ids is not None:
+        card_ids = list(OrderedDict.fromkeys(
+            validate_trello_id(card_id, "Card ID") for card_id in _bulk_items(card_ids, "card_ids")))
+    filters = {key: validate_trello_id(arguments[key], name) for key, name in
+               (("filter_label_id", "Label ID"), ("filter_list_id", "List ID")) if arguments.get(key)}
+    board_id = arguments.get("board_id")
+    if not board_id and (card_ids is None or filters):
+        raise ValueError("Pass card_ids, or board_id with optional filter_label_id/filter_list_id")
+
+    if board_id:
+        models = [await board_sync.board(board_id)]
+    else:
+        boards = {located_board for located_board, _ in board_sync.locate_cards(namespace, card_ids).values()}
+        models = await asyncio.gather(*(board_sync.board(located_board) for located_board in boards))
+    known = {card_id: {**card, "idBoard": model.board_id} for model in models for card_id, card in model.cards.items()}
+
+    if board_id:
+        matched = [card["id"] for card in models[0].query(
+            labels=tuple(filter(None, [filters.get("filter_label_id")])),
+            lists=tuple(filter(None, [filters.get("filter_list_id")])))]
+        if card_ids is not None:
+            matched_ids = set(matched)
+            matched = [card_id for card_id in card_ids if card_id in matched_ids]
+        card_ids = matched
+        if len(card_ids) > BULK_MAX_ITEMS:
+            raise ValueError(f"The selection matches {len(card_ids)} cards: at most {BULK_MAX_ITEMS} per call")
+    for card_id in card_ids:
+        if card_id not in known:
+            card = label_index.card(namespace, card_id)
+            if card is not None:
+                known[card_id] = card
+    return card_ids, known, models
+
+
+def format_assignment_result(name: str, target: str, changed: int, skipped: int, failures: list) -> str:
+    """Summarize a bulk assignment: counts, then the cards that failed."""
+    field, adding = CARD_ASSIGNMENTS[name]
+    kind = "label" if field == "idLabels" else "member"
+    if adding:
+        text = f"Added {kind} {target} to {changed} cards; {skipped} already had it"
+    else:
+        text = f"Removed {kind} {target} from {changed} cards; {skipped} did not have it"
+    if not failures:
+        return text
+    return "\n".join([f"{text}; {len(failures)} failed:"] +
+                     [f"- {card_id}: {_error_message(error)}" for card_id, error in failures])
+
+
+def format_api_stats() -> str:
+    """Render the API client counters reported by the get_api_stats tool."""
+    api_key, token = get_auth().get_credentials()
+    pool = get_transport(token).stats()
+    rate = rate_limiter.stats(api_key, token)
+    retry = retry_policy.stats()
+    batch = request_batcher.stats()
+    cache = response_cache.stats()
+    members = member_directory.stats()
+    labels = label_index.stats()
+    sync = board_sync.stats()
+    reasons = ", ".join(f"{reason}: {count}" for reason, count in sorted(retry["reasons"].items()))
+    lines = [
+        "Trello API client statistics:",
+        f"Connections: {pool['requests']} requests, {pool['new_connections']} new, "
+        f"{pool['reused_connections']} reused "
+        f"(pool size {pool['pool_maxsize']}, idle recycles {pool['idle_recycles']})",
+        f"Rate limiting: {rate['delayed']} of {rate['requests']} requests paced, "
+        f"{rate['total_wait']:.1f}s total wait, {rate['throttled']} throttled (429); "
+        f"budget left: token {rate['token_remaining']}, key {rate['key_remaining']}",
+        f"Retries: {retry['retries']} ({reasons or 'none'}), {retry['retry_wait']:.1f}s spent waiting, "
+        f"{retry['recovered']} calls recovered, {retry['exhausted']} gave up",
+        f"Batching: {batch['batched_requests']} GETs sent in {batch['batch_calls']} batch calls "
+        f"({batch['saved_round_trips']} round trips saved), {batch['direct_requests']} sent directly",
+        f"Cache: {cache['hits']} hits, {cache['misses']} misses, {cache['entries']} entries, "
+        f"{cache['bytes']:,} of {cache['max_bytes']:,} bytes, {cache['evictions']} evicted, "
+        f"{cache['invalidations']} invalidated",
+    ]
+    if persistent_cache is not None:
+        disk = persistent_cache.stats()
+        lines.append(
+            f"Disk cache: {disk['hits']} hits ({disk['stale_hits']} revalidated in background), "
+            f"{disk['entries']} entries, {disk['bytes']:,} bytes"
+        )
+    else:
+        lines.append("Disk cache: disabled")
+    lines.append(
+        f"Member directory: {members['members']} members known, "
+        f"{members['hits']} lookups answered locally, {members['misses']} fetched"
+    )
+    lines.append(
+        f"Label index: {labels['labels']} labels, card snapshots for {labels['boards']} boards, "
+        f"{labels['hits']} lookups answered locally, {labels['misses']} fetched"
+    )
+    if board_sync.enabled:
+        lines.append(
+            f"Board sync: {sync['boards']} boards synced, {sync['snapshots']} snapshots "
+            f"({sync['resyncs']} full resyncs), {sync['refreshes']} incremental refreshes applying "
+            f"{sync['actions_applied']} actions, {sync['local_reads']} reads answered locally"
+        )
+    else:
+        lines.append("Board sync: disabled")
+    if webhook_receiver.running:
+        hooks = webhook_receiver.stats()
+        lines.append(
+            f"Webhooks: {hooks['registered']} boards registered, {hooks['received']} deliveries "
+            f"({sync['pushed_actions']} applied to synced boards), {hooks['rejected']} rejected"
+        )
+    return "\n".join(lines)
+
+
+class ToolSpec:
+    """An MCP tool: its schema, handler and argument validators.
+
+    Validators come from the schema: every declared argument with an entry
+    in ARGUMENT_VALIDATORS is checked before the handler runs. Handlers
+    invalidate the cached responses their changes affect themselves.
+    """
+
+    def __init__(self, tool: Tool, handler):
+        self.tool = tool
+        self.handler = handler
+        properties = tool.inputSchema.get("properties", {})
+        self.validators = [(key, ARGUMENT_VALIDATORS[key]) for key in ARGUMENT_VALIDATORS if key in properties]
+
+
+# Registered tools by name, in the order list_tools reports them
+TOOL_REGISTRY = {}
+
+
+def tool(definition: Tool, fields: str = None):
+    """Register the decorated coroutine as the handler of a tool.
+
+    ``fields`` are the Trello fields a read tool renders (see TOOL_FIELDS).
+    A handler may serve several tools; it gets the tool name and arguments.
+    """
+    def register(handler):
+        TOOL_REGISTRY[definition.name] = ToolSpec(definition, handler)
+        if fields:
+            TOOL_FIELDS[definition.name] = fields
+        return handler
+    return register
+
+
+@tool(
+    Tool(
+        name="list_boards",
+        description="List all boards accessible to the authenticated user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "fields": FIELDS_PROPERTY
+            },
+        }
+    ),
+    fields="name",
+)
+async def handle_list_boards(name: str, arguments: dict) -> list[TextContent]:
+    boards = await make_trello_request_async("GET", "/members/me/boards", params={"fields": _tool_fields(name, arguments)})
+    result = "\n".join([f"- {board['name']} (ID: {board['id']}){_format_extra_fields(board, arguments)}" for board in boards])
+    return [TextContent(type="text", text=f"Your Trello Boards:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="get_board",
+        description="Get details about a specific board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["board_id"]
+        }
+    ),
+    fields="name,desc,url",
+)
+async def handle_get_board(name: str, arguments: dict) -> list[TextContent]:
+    board = await make_trello_request_async("GET", f"/boards/{arguments['board_id']}", params={"fields": _tool_fields(name, arguments)})
+    return [TextContent(
+        type="text",
+        text=f"Board: {board['name']}\nID: {board['id']}\nURL: {board['url']}\nDescription: {board.get('desc', 'N/A')}"
+             f"{_format_extra_fields(board, arguments, inline=False)}"
+    )]
+
+
+@tool(
+    Tool(
+        name="list_board_lists",
+        description="Get all lists on a board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["board_id"]
+        }
+    ),
+    fields="name",
+)
+async def handle_list_board_lists(name: str, arguments: dict) -> list[TextContent]:
+    lists = await make_trello_request_async("GET", f"/boards/{arguments['board_id']}/lists", params={"fields": _tool_fields(name, arguments)})
+    result = "\n".join([f"- {lst['name']} (ID: {lst['id']}){_format_extra_fields(lst, arguments)}" for lst in lists])
+    return [TextContent(type="text", text=f"Lists on board:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="list_board_cards",
+        description="Get all cards on a board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "fields": FIELDS_PROPERTY,
+                "limit": LIMIT_PROPERTY,
+                "cursor": CURSOR_PROPERTY
+            },
+            "required": ["board_id"]
+        }
+    ),
+    fields="name,idList",
+)
+async def handle_list_board_cards(name: str, arguments: dict) -> list[TextContent]:
+    def render_card(card):
+        return f"- {card['name']} (ID: {card['id']}, List: {card['idList']}){_format_extra_fields(card, arguments)}"
+
+    # A synced board holds every card, which streaming is there to avoid
+    if board_sync.covers(arguments) and not STREAM_JSON:
+        cards = (await board_sync.board(arguments["board_id"])).card_list()
+        text = _render_page("Cards on board:", cards, arguments, render_card)
+    else:
+        # Rendered as the cards are decoded when streaming is enabled
+        text = await request_json_array(
+            f"/boards/{arguments['board_id']}/cards", {"fields": _tool_fields(name, arguments)},
+            lambda cards: _render_streamed_page("Cards on board:", cards, arguments, render_card))
+    return [TextContent(type="text", text=text)]
+
+
+@tool(
+    Tool(
+        name="create_card",
+        description="Create a new card on a list",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_id": {
+                    "type": "string",
+                    "description": "The ID of the list to create the card in"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "The name/title of the card"
+                },
+                "desc": {
+                    "type": "string",
+                    "description": "The description of the card (optional)"
+                }
+            },
+            "required": ["list_id", "name"]
+        }
+    ),
+)
+async def handle_create_card(name: str, arguments: dict) -> list[TextContent]:
+    data = {
+        "idList": arguments["list_id"],
+        "name": arguments["name"]
+    }
+    if "desc" in arguments:
+        data["desc"] = arguments["desc"]
+
+    card = await make_trello_request_async("POST", "/cards", data=data)
+    invalidate_card_listings(card)
+    return [TextContent(
+        type="text",
+        text=f"Created card: {card['name']}\nID: {card['id']}\nURL: {card['url']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="create_cards",
+        description="Create many cards in one call; the creates run concurrently and the result is one table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cards": {
+                    "type": "array",
+                    "description": f"The cards to create (at most {BULK_MAX_ITEMS})",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "list_id": {
+                                "type": "string",
+                                "description": "The ID of the list to create the card in"
+                            },
+                            "name": {
+                                "type": "string",
+                                "description": "The name/title of the card"
+                            },
+                            "desc": {
+                                "type": "string",
+                                "description": "The description of the card (optional)"
+                            },
+                            "labels": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Label IDs to add (optional)"
+                            },
+                            "members": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Member IDs to assign (optional)"
+                            }
+                        },
+                        "required": ["list_id", "name"]
+                    }
+                }
+            },
+            "required": ["cards"]
+        }
+    ),
+)
+async def handle_create_cards(name: str, arguments: dict) -> list[TextContent]:
+    try:
+        bodies = validate_card_specs(arguments["cards"])
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+    outcomes = await run_bulk(
+        bodies, lambda body: make_trello_request_async("POST", "/cards", data=body), "create_cards")
+    # A failed create may still have applied, so drop every board's
+    # listings then; otherwise just the boards that gained cards
+    if any(error is not None for _, error in outcomes):
+        invalidate_card_listings()
+    else:
+        for board_id in {card.get("idBoard") for card, _ in outcomes}:
+            invalidate_card_listings({"idBoard": board_id})
+    return [TextContent(type="text", text=format_create_results(bodies, outcomes))]
+
+
+@tool(
+    Tool(
+        name="update_card",
+        description="Update a card's properties",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card to update"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "New name for the card (optional)"
+                },
+                "desc": {
+                    "type": "string",
+                    "description": "New description for the card (optional)"
+                },
+                "list_id": {
+                    "type": "string",
+                    "description": "Move card to this list ID (optional)"
+                }
+            },
+            "required": ["card_id"]
+        }
+    ),
+)
+async def handle_update_card(name: str, arguments: dict) -> list[TextContent]:
+    data = {}
+    if "name" in arguments:
+        data["name"] = arguments["name"]
+    if "desc" in arguments:
+        data["desc"] = arguments["desc"]
+    if "list_id" in arguments:
+        data["idList"] = arguments["list_id"]
+
+    card = await make_trello_request_async("PUT", f"/cards/{arguments['card_id']}", data=data)
+    invalidate_card_listings(card)
+    return [TextContent(
+        type="text",
+        text=f"Updated card: {card['name']}\nID: {card['id']}\nURL: {card['url']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="update_cards",
+        description="Update or move many cards in one call; changes to the same card are merged into one update",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "updates": {
+                    "type": "array",
+                    "description": f"The changes to make (at most {BULK_MAX_ITEMS})",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "card_id": {
+                                "type": "string",
+                                "description": "The ID of the card to update"
+                            },
+                            "name": {
+                                "type": "string",
+                                "description": "New name for the card (optional)"
+                            },
+                            "desc": {
+                                "type": "string",
+                                "description": "New description for the card (optional)"
+                            },
+                            "list_id": {
+                                "type": "string",
+                                "description": "Move card to this list ID (optional)"
+                            }
+                        },
+                        "required": ["card_id"]
                     }
+                }
+            },
+            "required": ["updates"]
+        }
+    ),
+)
+async def handle_update_cards(name: str, arguments: dict) -> list[TextContent]:
+    try:
+        merged = validate_card_updates(arguments["updates"])
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+    list_moves = await _move_whole_lists(_credential_namespace(get_auth().token), merged)
+    remaining = [card_id for card_id in merged if card_id not in list_moves]
+    results = await run_bulk(
+        remaining,
+        lambda card_id: make_trello_request_async("PUT", f"/cards/{card_id}", data=merged[card_id]),
+        "update_cards")
+    outcomes = dict(zip(remaining, results))
+    # Whole-list moves touch two lists' boards; a failed update may
+    # still have applied. Either way drop every board's listings.
+    if list_moves or any(error is not None for _, error in outcomes.values()):
+        invalidate_card_listings()
+    else:
+        for board_id in {card.get("idBoard") for card, _ in outcomes.values()}:
+            invalidate_card_listings({"idBoard": board_id})
+    return [TextContent(type="text", text=format_update_results(merged, outcomes, list_moves))]
+
+
+@tool(
+    Tool(
+        name="get_card",
+        description="Get details about a specific card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
+                },
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["card_id"]
+        }
+    ),
+    fields="name,desc,idList,url",
+)
+async def handle_get_card(name: str, arguments: dict) -> list[TextContent]:
+    card = await make_trello_request_async("GET", f"/cards/{arguments['card_id']}", params={"fields": _tool_fields(name, arguments)})
+    return [TextContent(
+        type="text",
+        text=f"Card: {card['name']}\nID: {card['id']}\nDescription: {card.get('desc', 'N/A')}\nList ID: {card['idList']}\nURL: {card['url']}"
+             f"{_format_extra_fields(card, arguments, inline=False)}"
+    )]
+
+
+@tool(
+    Tool(
+        name="create_list",
+        description="Create a new list on a board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board to create the list on"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "The name of the list"
+                },
+                "pos": {
+                    "type": "string",
+                    "description": "Position of the list: 'top', 'bottom', or a positive number (optional, defaults to 'bottom')"
+                }
+            },
+            "required": ["board_id", "name"]
+        }
+    )
+)
+async def handle_create_list(name: str, arguments: dict) -> list[TextContent]:
+    data = {
+        "name": arguments["name"],
+        "idBoard": arguments["board_id"]
+    }
+    if "pos" in arguments:
+        data["pos"] = arguments["pos"]
+
+    lst = await make_trello_request_async("POST", "/lists", data=data)
+    invalidate_cache(f"/boards/{arguments['board_id']}/lists")
+    return [TextContent(
+        type="text",
+        text=f"Created list: {lst['name']}\nID: {lst['id']}\nBoard ID: {lst['idBoard']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="archive_all_cards",
+        description="Archive every card in a list with one request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_id": {
+                    "type": "string",
+                    "description": "The ID of the list to clear"
+                }
+            },
+            "required": ["list_id"]
+        }
+    ),
+)
+async def handle_archive_all_cards(name: str, arguments: dict) -> list[TextContent]:
+    namespace = _credential_namespace(get_auth().token)
+    list_id = arguments["list_id"]
+    await make_trello_request_async("POST", f"/lists/{list_id}/archiveAllCards")
+    try:
+        board_id = await board_of_list(namespace, list_id)
+    except requests.exceptions.RequestException as e:
+        # The cards are archived either way: drop every board's card listings
+        logger.warning(f"Could not look up the board of list {list_id}: {e}")
+        invalidate_card_listings()
+        board_sync.mark_stale(namespace)
+        return [TextContent(type="text", text=f"Archived all cards in list\nList ID: {list_id}")]
+    invalidate_board_lists(namespace, board_id)
+    return [TextContent(
+        type="text",
+        text=f"Archived all cards in list\nList ID: {list_id}\nBoard ID: {board_id}"
+    )]
+
+
+@tool(
+    Tool(
+        name="move_all_cards",
+        description="Move every card in a list to another list (on this or another board) with one request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_id": {
+                    "type": "string",
+                    "description": "The ID of the list to move the cards out of"
+                },
+                "target_list_id": {
+                    "type": "string",
+                    "description": "The ID of the list to move the cards to"
+                },
+                "target_board_id": {
+                    "type": "string",
+                    "description": "The ID of the target list's board (optional, looked up if omitted)"
+                }
+            },
+            "required": ["list_id", "target_list_id"]
+        }
+    ),
+)
+async def handle_move_all_cards(name: str, arguments: dict) -> list[TextContent]:
+    namespace = _credential_namespace(get_auth().token)
+    list_id = arguments["list_id"]
+    try:
+        target_list_id = validate_trello_id(arguments["target_list_id"], "Target list ID")
+        target_board_id = validate_trello_id(arguments["target_board_id"], "Target board ID") \
+            if arguments.get("target_board_id") else None
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+    lookups = [board_of_list(namespace, list_id)]
+    if target_board_id is None:
+        lookups.append(board_of_list(namespace, target_list_id))
+    board_id, *found = await asyncio.gather(*lookups)
+    target_board_id = found[0] if found else target_board_id
+    await make_trello_request_async("POST", f"/lists/{list_id}/moveAllCards",
+                                    data={"idBoard": target_board_id, "idList": target_list_id})
+    for changed_board in {board_id, target_board_id}:
+        invalidate_board_lists(namespace, changed_board)
+    return [TextContent(
+        type="text",
+        text=f"Moved all cards from list {list_id} to list {target_list_id}\nBoard ID: {target_board_id}"
+    )]
+
+
+@tool(
+    Tool(
+        name="archive_list",
+        description="Archive a list",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_id": {
+                    "type": "string",
+                    "description": "The ID of the list to archive"
+                }
+            },
+            "required": ["list_id"]
+        }
+    ),
+)
+async def handle_archive_list(name: str, arguments: dict) -> list[TextContent]:
+    namespace = _credential_namespace(get_auth().token)
+    lst = await make_trello_request_async("PUT", f"/lists/{arguments['list_id']}/closed", data={"value": True})
+    invalidate_board_lists(namespace, lst["idBoard"])
+    return [TextContent(
+        type="text",
+        text=f"Archived list: {lst['name']}\nID: {lst['id']}\nBoard ID: {lst['idBoard']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="reorder_lists",
+        description="Put a board's lists in the given order; only lists that must move are updated",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
                 },
-                "required": ["org_id"]
-            }
-        ),
-        Tool(
-            name="list_organization_boards",
-            description="Get all boards in an organization/workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "org_id": {
-                        "type": "string",
-                        "description": "The ID or name of the organization"
-                    }
+                "list_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List IDs in the new order, from the left; lists not given keep their order after them"
+                }
+            },
+            "required": ["board_id", "list_ids"]
+        }
+    ),
+)
+async def handle_reorder_lists(name: str, arguments: dict) -> list[TextContent]:
+    namespace = _credential_namespace(get_auth().token)
+    board_id = arguments["board_id"]
+    try:
+        order = list(OrderedDict.fromkeys(
+            validate_trello_id(list_id, "List ID") for list_id in _bulk_items(arguments["list_ids"], "list_ids")))
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+    lists = await make_trello_request_async("GET", f"/boards/{board_id}/lists", params={"fields": "name,pos"},
+                                            fresh=True)
+    known = {lst["id"]: lst for lst in sorted(lists, key=lambda lst: lst["pos"])}
+    unknown = [list_id for list_id in order if list_id not in known]
+    if unknown:
+        return [TextContent(type="text", text=f"Validation Error: Not an open list on this board: {', '.join(unknown)}")]
+    order += [list_id for list_id in known if list_id not in order]
+    moves = reorder_positions(lists, order)
+    results = await run_bulk(
+        list(moves),
+        lambda list_id: make_trello_request_async("PUT", f"/lists/{list_id}", data={"pos": moves[list_id]}),
+        name)
+    failures = [(list_id, error) for list_id, (_, error) in zip(moves, results) if error is not None]
+    if moves:
+        # Synced copies keep lists in snapshot order
+        invalidate_cache(f"/boards/{board_id}/lists")
+        board_sync.require_snapshot(namespace, board_id)
+    result = "\n".join(f"- {known[list_id]['name']} (ID: {list_id})" for list_id in order)
+    text = f"Lists on board in new order:\n{result}\n({len(moves) - len(failures)} lists moved)"
+    if failures:
+        text += "\nFailed to move:\n" + "\n".join(
+            f"- {list_id}: {_error_message(error)}" for list_id, error in failures)
+    return [TextContent(type="text", text=text)]
+
+
+@tool(
+    Tool(
+        name="list_organizations",
+        description="List all organizations/workspaces the authenticated user belongs to",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "fields": FIELDS_PROPERTY
+            },
+        }
+    ),
+    fields="displayName,name",
+)
+async def handle_list_organizations(name: str, arguments: dict) -> list[TextContent]:
+    orgs = await make_trello_request_async("GET", "/members/me/organizations", params={"fields": _tool_fields(name, arguments)})
+    result = "\n".join([f"- {org['displayName']} (ID: {org['id']}, Name: {org['name']}){_format_extra_fields(org, arguments)}" for org in orgs])
+    return [TextContent(type="text", text=f"Your Organizations/Workspaces:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="get_organization",
+        description="Get details about a specific organization/workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "org_id": {
+                    "type": "string",
+                    "description": "The ID or name of the organization"
                 },
-                "required": ["org_id"]
-            }
-        ),
-        Tool(
-            name="list_organization_members",
-            description="Get all members of an organization/workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "org_id": {
-                        "type": "string",
-                        "description": "The ID or name of the organization"
-                    }
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["org_id"]
+        }
+    ),
+    fields="displayName,name,desc,url,website",
+)
+async def handle_get_organization(name: str, arguments: dict) -> list[TextContent]:
+    org = await make_trello_request_async("GET", f"/organizations/{arguments['org_id']}", params={"fields": _tool_fields(name, arguments)})
+    return [TextContent(
+        type="text",
+        text=f"Organization: {org['displayName']}\nID: {org['id']}\nName: {org['name']}\nDescription: {org.get('desc', 'N/A')}\nURL: {org['url']}\nWebsite: {org.get('website', 'N/A')}"
+             f"{_format_extra_fields(org, arguments, inline=False)}"
+    )]
+
+
+@tool(
+    Tool(
+        name="list_organization_boards",
+        description="Get all boards in an organization/workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "org_id": {
+                    "type": "string",
+                    "description": "The ID or name of the organization"
                 },
-                "required": ["org_id"]
-            }
-        ),
-        Tool(
-            name="add_organization_member",
-            description="Add a member to an organization/workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "org_id": {
-                        "type": "string",
-                        "description": "The ID or name of the organization"
-                    },
-                    "email": {
-                        "type": "string",
-                        "description": "Email address of the member to add"
-                    },
-                    "full_name": {
-                        "type": "string",
-                        "description": "Full name of the member (optional)"
-                    },
-                    "type": {
-                        "type": "string",
-                        "description": "Member type: 'normal' or 'admin' (optional, defaults to 'normal')"
-                    }
+                "fields": FIELDS_PROPERTY,
+                "limit": LIMIT_PROPERTY,
+                "cursor": CURSOR_PROPERTY
+            },
+            "required": ["org_id"]
+        }
+    ),
+    fields="name",
+)
+async def handle_list_organization_boards(name: str, arguments: dict) -> list[TextContent]:
+    boards = await make_trello_request_async("GET", f"/organizations/{arguments['org_id']}/boards", params={"fields": _tool_fields(name, arguments)})
+    return [TextContent(type="text", text=_render_page(
+        "Boards in organization:", boards, arguments,
+        lambda board: f"- {board['name']} (ID: {board['id']}){_format_extra_fields(board, arguments)}"
+    ))]
+
+
+@tool(
+    Tool(
+        name="list_organization_members",
+        description="Get all members of an organization/workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "org_id": {
+                    "type": "string",
+                    "description": "The ID or name of the organization"
                 },
-                "required": ["org_id", "email"]
-            }
-        ),
-        Tool(
-            name="remove_organization_member",
-            description="Remove a member from an organization/workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "org_id": {
-                        "type": "string",
-                        "description": "The ID or name of the organization"
-                    },
-                    "member_id": {
-                        "type": "string",
-                        "description": "The ID of the member to remove"
-                    }
+                "fields": FIELDS_PROPERTY,
+                "limit": LIMIT_PROPERTY,
+                "cursor": CURSOR_PROPERTY
+            },
+            "required": ["org_id"]
+        }
+    ),
+    fields="fullName,username",
+)
+async def handle_list_organization_members(name: str, arguments: dict) -> list[TextContent]:
+    members = await make_trello_request_async("GET", f"/organizations/{arguments['org_id']}/members", params={"fields": _tool_fields(name, arguments)})
+    return [TextContent(type="text", text=_render_page(
+        "Members in organization:", members, arguments,
+        lambda member: f"- {member['fullName']} (@{member['username']}, ID: {member['id']}){_format_extra_fields(member, arguments)}"
+    ))]
+
+
+@tool(
+    Tool(
+        name="add_organization_member",
+        description="Add a member to an organization/workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "org_id": {
+                    "type": "string",
+                    "description": "The ID or name of the organization"
                 },
-                "required": ["org_id", "member_id"]
-            }
-        ),
-        Tool(
-            name="add_card_label",
-            description="Add a label to a card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    },
-                    "label_id": {
-                        "type": "string",
-                        "description": "The ID of the label to add"
-                    }
+                "email": {
+                    "type": "string",
+                    "description": "Email address of the member to add"
                 },
-                "required": ["card_id", "label_id"]
-            }
-        ),
-        Tool(
-            name="remove_card_label",
-            description="Remove a label from a card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    },
-                    "label_id": {
-                        "type": "string",
-                        "description": "The ID of the label to remove"
-                    }
+                "full_name": {
+                    "type": "string",
+                    "description": "Full name of the member (optional)"
                 },
-                "required": ["card_id", "label_id"]
-            }
-        ),
-        Tool(
-            name="list_card_labels",
-            description="List all labels on a card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    }
+                "type": {
+                    "type": "string",
+                    "description": "Member type: 'normal' or 'admin' (optional, defaults to 'normal')"
+                }
+            },
+            "required": ["org_id", "email"]
+        }
+    ),
+)
+async def handle_add_organization_member(name: str, arguments: dict) -> list[TextContent]:
+    data = {
+        "email": arguments["email"]
+    }
+    if "full_name" in arguments:
+        data["fullName"] = arguments["full_name"]
+    if "type" in arguments:
+        data["type"] = arguments["type"]
+
+    member = await make_trello_request_async("PUT", f"/organizations/{arguments['org_id']}/members", data=data)
+    return [TextContent(
+        type="text",
+        text=f"Added member to organization: {member.get('fullName', arguments['email'])}"
+    )]
+
+
+@tool(
+    Tool(
+        name="remove_organization_member",
+        description="Remove a member from an organization/workspace",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "org_id": {
+                    "type": "string",
+                    "description": "The ID or name of the organization"
                 },
-                "required": ["card_id"]
-            }
-        ),
-        Tool(
-            name="list_board_labels",
-            description="List all available labels on a board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    }
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to remove"
+                }
+            },
+            "required": ["org_id", "member_id"]
+        }
+    ),
+)
+async def handle_remove_organization_member(name: str, arguments: dict) -> list[TextContent]:
+    await make_trello_request_async("DELETE", f"/organizations/{arguments['org_id']}/members/{arguments['member_id']}")
+    return [TextContent(
+        type="text",
+        text=f"Removed member {arguments['member_id']} from organization"
+    )]
+
+
+@tool(
+    Tool(
+        name="add_card_label",
+        description="Add a label to a card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
                 },
-                "required": ["board_id"]
-            }
-        ),
-        Tool(
-            name="filter_cards_by_label",
-            description="Filter cards on a board by a specific label",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    },
-                    "label_id": {
-                        "type": "string",
-                        "description": "The ID of the label to filter by"
-                    }
+                "label_id": {
+                    "type": "string",
+                    "description": "The ID of the label to add"
+                }
+            },
+            "required": ["card_id", "label_id"]
+        }
+    ),
+)
+async def handle_add_card_label(name: str, arguments: dict) -> list[TextContent]:
+    card_id = arguments["card_id"]
+    label_id = arguments["label_id"]
+    namespace = _credential_namespace(get_auth().token)
+    # Take the card name and label details from the label index; only
+    # what it does not know is fetched, alongside the POST
+    card = label_index.card(namespace, card_id)
+    label_info = label_index.label(namespace, label_id)
+    lookups = {}
+    if card is None:
+        lookups["card"] = make_trello_request_async("GET", f"/cards/{card_id}", params={"fields": "name,idBoard"})
+    if label_info is None:
+        lookups["label"] = make_trello_request_async("GET", f"/labels/{label_id}", params={"fields": "name,color,idBoard"})
+    _, *fetched = await asyncio.gather(
+        make_trello_request_async("POST", f"/cards/{card_id}/idLabels", data={"value": label_id}),
+        *lookups.values()
+    )
+    fetched = dict(zip(lookups, fetched))
+    card = fetched.get("card", card)
+    label_info = fetched.get("label", label_info)
+    label_index.add_card_label(namespace, card_id, label_id)
+    invalidate_card_listings(card, keep_label_index=True)
+
+    if label_info:
+        label_name = label_info.get('name', 'Unnamed')
+        label_color = label_info.get('color', 'none')
+        return [TextContent(
+            type="text",
+            text=f"Added label to card: {card['name']}\nLabel: {label_name} ({label_color})\nCard ID: {card['id']}"
+        )]
+    else:
+        return [TextContent(
+            type="text",
+            text=f"Added label to card: {card['name']}\nCard ID: {card['id']}"
+        )]
+
+
+@tool(
+    Tool(
+        name="remove_card_label",
+        description="Remove a label from a card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
                 },
-                "required": ["board_id", "label_id"]
-            }
-        ),
-        Tool(
-            name="list_board_members",
-            description="List all members of a board with their permission levels",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    }
+                "label_id": {
+                    "type": "string",
+                    "description": "The ID of the label to remove"
+                }
+            },
+            "required": ["card_id", "label_id"]
+        }
+    ),
+)
+async def handle_remove_card_label(name: str, arguments: dict) -> list[TextContent]:
+    namespace = _credential_namespace(get_auth().token)
+    await make_trello_request_async("DELETE", f"/cards/{arguments['card_id']}/idLabels/{arguments['label_id']}")
+    label_index.remove_card_label(namespace, arguments["card_id"], arguments["label_id"])
+    invalidate_card_listings({"idBoard": label_index.board_of(namespace, arguments["card_id"])},
+                             keep_label_index=True)
+    return [TextContent(
+        type="text",
+        text=f"Removed label from card\nCard ID: {arguments['card_id']}\nLabel ID: {arguments['label_id']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="add_label_to_cards",
+        description="Add a label to many cards, selected by ID or by board and filters; cards that already have it are skipped",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "label_id": {
+                    "type": "string",
+                    "description": "The ID of the label to add"
                 },
-                "required": ["board_id"]
-            }
-        ),
-        Tool(
-            name="add_board_member",
-            description="Add an existing Trello user to a board with specified permission level",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    },
-                    "member_id": {
-                        "type": "string",
-                        "description": "The ID of the member to add"
-                    },
-                    "type": {
-                        "type": "string",
-                        "description": "Permission level: 'admin', 'normal', or 'observer' (optional, defaults to 'normal')"
-                    }
+                **CARD_SELECTION_PROPERTIES
+            },
+            "required": ["label_id"]
+        }
+    ),
+)
+@tool(
+    Tool(
+        name="remove_label_from_cards",
+        description="Remove a label from many cards, selected by ID or by board and filters; cards without it are skipped",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "label_id": {
+                    "type": "string",
+                    "description": "The ID of the label to remove"
                 },
-                "required": ["board_id", "member_id"]
-            }
-        ),
-        Tool(
-            name="remove_board_member",
-            description="Remove a member from a board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    },
-                    "member_id": {
-                        "type": "string",
-                        "description": "The ID of the member to remove"
-                    }
+                **CARD_SELECTION_PROPERTIES
+            },
+            "required": ["label_id"]
+        }
+    ),
+)
+@tool(
+    Tool(
+        name="add_member_to_cards",
+        description="Assign a member to many cards, selected by ID or by board and filters; cards that already have them are skipped",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to add"
                 },
-                "required": ["board_id", "member_id"]
-            }
-        ),
-        Tool(
-            name="update_board_member",
-            description="Update a member's permission level on a board",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    },
-                    "member_id": {
-                        "type": "string",
-                        "description": "The ID of the member to update"
-                    },
-                    "type": {
-                        "type": "string",
-                        "description": "New permission level: 'admin', 'normal', or 'observer'"
-                    }
+                **CARD_SELECTION_PROPERTIES
+            },
+            "required": ["member_id"]
+        }
+    ),
+)
+@tool(
+    Tool(
+        name="remove_member_from_cards",
+        description="Remove a member from many cards, selected by ID or by board and filters; cards without them are skipped",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to remove"
                 },
-                "required": ["board_id", "member_id", "type"]
-            }
-        ),
-        Tool(
-            name="invite_board_member",
-            description="Invite a new member to a board via email address",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "string",
-                        "description": "The ID of the board"
-                    },
-                    "email": {
-                        "type": "string",
-                        "description": "Email address of the person to invite"
-                    },
-                    "type": {
-                        "type": "string",
-                        "description": "Permission level: 'admin', 'normal', or 'observer' (optional, defaults to 'normal')"
-                    }
+                **CARD_SELECTION_PROPERTIES
+            },
+            "required": ["member_id"]
+        }
+    ),
+)
+async def handle_card_assignment(name: str, arguments: dict) -> list[TextContent]:
+    field, adding = CARD_ASSIGNMENTS[name]
+    value = arguments["label_id" if field == "idLabels" else "member_id"]
+    namespace = _credential_namespace(get_auth().token)
+    try:
+        card_ids, known, models = await select_cards(namespace, arguments)
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+    # Cards already in the target state (as far as the board data
+    # knows) are skipped; cards whose data lacks the field are always sent
+    pending = [card_id for card_id in card_ids
+               if field not in known.get(card_id, {}) or (value in known[card_id][field]) != adding]
+
+    async def assign(card_id):
+        if adding:
+            return await make_trello_request_async("POST", f"/cards/{card_id}/{field}", data={"value": value})
+        return await make_trello_request_async("DELETE", f"/cards/{card_id}/{field}/{value}")
+
+    outcomes = dict(zip(pending, await run_bulk(pending, assign, name)))
+    failures = [(card_id, error) for card_id, (_, error) in outcomes.items() if error is not None]
+    if field == "idLabels":
+        for card_id, (_, error) in outcomes.items():
+            if error is None:
+                (label_index.add_card_label if adding else label_index.remove_card_label)(
+                    namespace, card_id, value)
+    if outcomes:
+        boards = {known.get(card_id, {}).get("idBoard") for card_id in outcomes}
+        if failures or None in boards:
+            invalidate_card_listings(keep_label_index=not failures and field == "idLabels")
+        else:
+            for board_id in boards:
+                invalidate_card_listings({"idBoard": board_id}, keep_label_index=field == "idLabels")
+
+    # Name the label or member from data already at hand
+    if field == "idLabels":
+        found = next((model.labels[value] for model in models if value in model.labels), None)
+        target = (found or label_index.label(namespace, value) or {}).get("name")
+    else:
+        found = next((model.members[value] for model in models if value in model.members), None)
+        target = (found or member_directory.get(namespace, value) or {}).get("fullName")
+    target = f"{target} ({value})" if target else value
+    return [TextContent(type="text", text=format_assignment_result(
+        name, target, len(outcomes) - len(failures), len(card_ids) - len(pending), failures))]
+
+
+@tool(
+    Tool(
+        name="list_card_labels",
+        description="List all labels on a card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
                 },
-                "required": ["board_id", "email"]
-            }
-        ),
-        Tool(
-            name="add_card_member",
-            description="Add a member to a card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    },
-                    "member_id": {
-                        "type": "string",
-                        "description": "The ID of the member to add"
-                    }
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["card_id"]
+        }
+    ),
+    fields="name,color",
+)
+async def handle_list_card_labels(name: str, arguments: dict) -> list[TextContent]:
+    # Cards on a synced board are answered from its model
+    labels = None
+    board_id = board_sync.board_of(_credential_namespace(get_auth().token), arguments["card_id"])
+    if board_id and board_sync.covers(arguments, TOOL_FIELDS[name]):
+        model = await board_sync.board(board_id)
+        card = model.cards.get(arguments["card_id"])
+        if card is not None:
+            labels = [dict(model.labels[label_id]) for label_id in card["idLabels"] if label_id in model.labels]
+    if labels is None:
+        labels = await make_trello_request_async("GET", f"/cards/{arguments['card_id']}/labels", params={"fields": _tool_fields(name, arguments)})
+
+    # Handle empty label list case
+    if not labels:
+        return [TextContent(
+            type="text",
+            text="Labels on card:\n(No labels)"
+        )]
+
+    # Format response as list of labels with name, color, and ID
+    result = "\n".join([
+        f"- {label.get('name', 'Unnamed')} (Color: {label.get('color', 'none')}, ID: {label['id']})"
+        f"{_format_extra_fields(label, arguments)}"
+        for label in labels
+    ])
+    return [TextContent(type="text", text=f"Labels on card:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="list_board_labels",
+        description="List all available labels on a board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
                 },
-                "required": ["card_id", "member_id"]
-            }
-        ),
-        Tool(
-            name="remove_card_member",
-            description="Remove a member from a card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    },
-                    "member_id": {
-                        "type": "string",
-                        "description": "The ID of the member to remove"
-                    }
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["board_id"]
+        }
+    ),
+    fields="name,color",
+)
+async def handle_list_board_labels(name: str, arguments: dict) -> list[TextContent]:
+    labels = await make_trello_request_async("GET", f"/boards/{arguments['board_id']}/labels", params={"fields": _tool_fields(name, arguments)})
+
+    # Format response as list of available labels with name, color, and ID
+    result = "\n".join([
+        f"- {label.get('name', 'Unnamed')} (Color: {label.get('color', 'none')}, ID: {label['id']})"
+        f"{_format_extra_fields(label, arguments)}"
+        for label in labels
+    ])
+    return [TextContent(type="text", text=f"Available labels on board:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="filter_cards_by_label",
+        description="Filter cards on a board by a specific label",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
                 },
-                "required": ["card_id", "member_id"]
-            }
-        ),
-        Tool(
-            name="list_card_members",
-            description="List all members assigned to a card",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "card_id": {
-                        "type": "string",
-                        "description": "The ID of the card"
-                    }
+                "label_id": {
+                    "type": "string",
+                    "description": "The ID of the label to filter by"
                 },
-                "required": ["card_id"]
-            }
-        )
-    ]
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["board_id", "label_id"]
+        }
+    ),
+    fields="name,idList,idLabels",
+)
+async def handle_filter_cards_by_label(name: str, arguments: dict) -> list[TextContent]:
+    # Extract board_id and label_id from arguments
+    board_id = arguments['board_id']
+    label_id = arguments['label_id']
+    namespace = _credential_namespace(get_auth().token)
+
+    if board_sync.covers(arguments) and not STREAM_JSON:
+        model = await board_sync.board(board_id)
+        filtered_cards = [card for card in model.card_list() if label_id in card['idLabels']]
+        label = model.labels.get(label_id, {"id": label_id, "name": "Unknown"})
+    else:
+        # Answer from the label index when it has a fresh snapshot of
+        # the board; otherwise fetch what is missing (cards and labels
+        # go out together as one batch call)
+        filtered_cards = None if _requested_fields(arguments) else label_index.cards_with_label(namespace, board_id, label_id)
+        label = label_index.label(namespace, label_id)
+    lookups = {}
+    if filtered_cards is None:
+        # Filter cards by checking if label_id is in card's idLabels
+        # array (as they are decoded when streaming is enabled)
+        lookups["cards"] = request_json_array(
+            f"/boards/{board_id}/cards", {"fields": _tool_fields(name, arguments)},
+            lambda cards: [card for card in cards if label_id in card.get('idLabels', [])])
+    if label is None:
+        lookups["labels"] = make_trello_request_async("GET", f"/boards/{board_id}/labels", params={"fields": "name,color"})
+    fetched = dict(zip(lookups, await asyncio.gather(*lookups.values())))
+
+    if "cards" in fetched:
+        filtered_cards = fetched["cards"]
+
+    # Get label name for the response
+    label_name = "Unknown"
+    for candidate in [label] if label else fetched["labels"]:
+        if candidate['id'] == label_id:
+            label_name = candidate.get('name', 'Unnamed')
+            break
+
+    # Handle empty results case
+    if not filtered_cards:
+        return [TextContent(
+            type="text",
+            text=f"Cards with label {label_name}:\n(No cards found)"
+        )]
+
+    # Format response as list of cards with name, ID, and list ID
+    result = "\n".join([
+        f"- {card['name']} (ID: {card['id']}, List: {card['idList']}){_format_extra_fields(card, arguments)}"
+        for card in filtered_cards
+    ])
+    return [TextContent(type="text", text=f"Cards with label {label_name}:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="list_board_members",
+        description="List all members of a board with their permission levels",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["board_id"]
+        }
+    ),
+    fields="fullName,username,memberType",
+)
+async def handle_list_board_members(name: str, arguments: dict) -> list[TextContent]:
+    board_id = arguments["board_id"]
+    members = await make_trello_request_async("GET", f"/boards/{board_id}/members", params={"fields": _tool_fields(name, arguments)})
+
+    # Format response with member details (name, username, ID, permission)
+    result = "\n".join([
+        f"- {member['fullName']} (@{member['username']}, ID: {member['id']}, Permission: {member.get('memberType', 'normal')})"
+        f"{_format_extra_fields(member, arguments)}"
+        for member in members
+    ])
+    return [TextContent(type="text", text=f"Board Members:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="add_board_member",
+        description="Add an existing Trello user to a board with specified permission level",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to add"
+                },
+                "type": {
+                    "type": "string",
+                    "description": "Permission level: 'admin', 'normal', or 'observer' (optional, defaults to 'normal')"
+                }
+            },
+            "required": ["board_id", "member_id"]
+        }
+    ),
+)
+async def handle_add_board_member(name: str, arguments: dict) -> list[TextContent]:
+    board_id = arguments["board_id"]
+    member_id = arguments["member_id"]
+    member_type = arguments.get("type", "normal")
+
+    # Build query parameters with type
+    params = {"type": member_type}
+
+    # Call make_trello_request_async with PUT method
+    result = await make_trello_request_async("PUT", f"/boards/{board_id}/members/{member_id}", params=params)
+
+    # Member details for confirmation; the PUT response lists the
+    # board's members, so this rarely needs another request
+    member = await lookup_member(member_id)
+
+    return [TextContent(
+        type="text",
+        text=f"Added member to board: {member['fullName']} (@{member['username']})\nPermission: {member_type}"
+    )]
+
+
+@tool(
+    Tool(
+        name="remove_board_member",
+        description="Remove a member from a board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to remove"
+                }
+            },
+            "required": ["board_id", "member_id"]
+        }
+    ),
+)
+async def handle_remove_board_member(name: str, arguments: dict) -> list[TextContent]:
+    board_id = arguments["board_id"]
+    member_id = arguments["member_id"]
+
+    # Call make_trello_request_async with DELETE method
+    await make_trello_request_async("DELETE", f"/boards/{board_id}/members/{member_id}")
+
+    return [TextContent(
+        type="text",
+        text=f"Removed member {member_id} from board"
+    )]
+
+
+@tool(
+    Tool(
+        name="update_board_member",
+        description="Update a member's permission level on a board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to update"
+                },
+                "type": {
+                    "type": "string",
+                    "description": "New permission level: 'admin', 'normal', or 'observer'"
+                }
+            },
+            "required": ["board_id", "member_id", "type"]
+        }
+    ),
+)
+async def handle_update_board_member(name: str, arguments: dict) -> list[TextContent]:
+    board_id = arguments["board_id"]
+    member_id = arguments["member_id"]
+    member_type = arguments["type"]
+
+    # Validate type is one of: "admin", "normal", "observer"
+    valid_permissions = ["admin", "normal", "observer"]
+    if member_type not in valid_permissions:
+        return [TextContent(
+            type="text",
+            text=f"Error: Invalid permission type. Must be one of: {', '.join(valid_permissions)}"
+        )]
+
+    # Build query parameters with type
+    params = {"type": member_type}
+
+    # Call make_trello_request_async with PUT method
+    await make_trello_request_async("PUT", f"/boards/{board_id}/members/{member_id}", params=params)
+
+    # Member details for confirmation; the PUT response lists the
+    # board's members, so this rarely needs another request
+    member = await lookup_member(member_id)
+
+    return [TextContent(
+        type="text",
+        text=f"Updated member permission: {member['fullName']} (@{member['username']})\nNew permission: {member_type}"
+    )]
+
+
+@tool(
+    Tool(
+        name="invite_board_member",
+        description="Invite a new member to a board via email address",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "The ID of the board"
+                },
+                "email": {
+                    "type": "string",
+                    "description": "Email address of the person to invite"
+                },
+                "type": {
+                    "type": "string",
+                    "description": "Permission level: 'admin', 'normal', or 'observer' (optional, defaults to 'normal')"
+                }
+            },
+            "required": ["board_id", "email"]
+        }
+    ),
+)
+async def handle_invite_board_member(name: str, arguments: dict) -> list[TextContent]:
+    board_id = arguments["board_id"]
+    email = arguments["email"]
+    member_type = arguments.get("type", "normal")
+
+    # Build query parameters with email and type
+    params = {"email": email, "type": member_type}
+
+    # Call make_trello_request_async with PUT method
+    await make_trello_request_async("PUT", f"/boards/{board_id}/members", params=params)
+
+    return [TextContent(
+        type="text",
+        text=f"Invited {email} to board\nPermission: {member_type}"
+    )]
+
+
+@tool(
+    Tool(
+        name="add_card_member",
+        description="Add a member to a card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
+                },
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to add"
+                }
+            },
+            "required": ["card_id", "member_id"]
+        }
+    ),
+)
+async def handle_add_card_member(name: str, arguments: dict) -> list[TextContent]:
+    data = {"value": arguments["member_id"]}
+    await make_trello_request_async("POST", f"/cards/{arguments['card_id']}/idMembers", data=data)
+    invalidate_card_listings()
+    return [TextContent(
+        type="text",
+        text=f"Added member {arguments['member_id']} to card {arguments['card_id']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="remove_card_member",
+        description="Remove a member from a card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
+                },
+                "member_id": {
+                    "type": "string",
+                    "description": "The ID of the member to remove"
+                }
+            },
+            "required": ["card_id", "member_id"]
+        }
+    ),
+)
+async def handle_remove_card_member(name: str, arguments: dict) -> list[TextContent]:
+    await make_trello_request_async("DELETE", f"/cards/{arguments['card_id']}/idMembers/{arguments['member_id']}")
+    invalidate_card_listings()
+    return [TextContent(
+        type="text",
+        text=f"Removed member {arguments['member_id']} from card {arguments['card_id']}"
+    )]
+
+
+@tool(
+    Tool(
+        name="list_card_members",
+        description="List all members assigned to a card",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "The ID of the card"
+                },
+                "fields": FIELDS_PROPERTY
+            },
+            "required": ["card_id"]
+        }
+    ),
+    fields="fullName,username",
+)
+async def handle_list_card_members(name: str, arguments: dict) -> list[TextContent]:
+    members = await make_trello_request_async("GET", f"/cards/{arguments['card_id']}/members", params={"fields": _tool_fields(name, arguments)})
+
+    # Handle empty member list case
+    if not members:
+        return [TextContent(type="text", text="No members assigned to this card")]
+
+    # Format response as list of members with fullName, username, and ID
+    result = "\n".join([
+        f"- {member['fullName']} (@{member['username']}, ID: {member['id']})"
+        f"{_format_extra_fields(member, arguments)}"
+        for member in members
+    ])
+    return [TextContent(type="text", text=f"Members on card:\n{result}")]
+
+
+@tool(
+    Tool(
+        name="get_board_snapshot",
+        description="Get a whole board in one request: lists with their cards, labels and members",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "ID of the board"
+                }
+            },
+            "required": ["board_id"]
+        }
+    ),
+)
+async def handle_get_board_snapshot(name: str, arguments: dict) -> list[TextContent]:
+    # One nested request, shared with the board sync; it also fills
+    # the caches of the individual board read tools
+    model = await board_sync.board(arguments["board_id"])
+    return [TextContent(type="text", text=format_board_snapshot(model))]
+
+
+@tool(
+    Tool(
+        name="query_cards",
+        description="Find cards on a board by combined filters (labels, members, lists, due dates), "
+                    "answered from a synced local copy of the board",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "string",
+                    "description": "ID of the board"
+                },
+                "labels": {
+                    "type": "string",
+                    "description": "Comma-separated label IDs or names (optional)"
+                },
+                "label_match": {
+                    "type": "string",
+                    "enum": ["all", "any"],
+                    "description": "Whether cards need all of the labels or any of them (default: all)"
+                },
+                "members": {
+                    "type": "string",
+                    "description": "Comma-separated member IDs or usernames; cards need all of them (optional)"
+                },
+                "lists": {
+                    "type": "string",
+                    "description": "Comma-separated list IDs or names; cards may be in any of them (optional)"
+                },
+                "due": {
+                    "type": "string",
+                    "enum": list(DUE_WINDOWS),
+                    "description": "Due date window in UTC; weeks start on Monday (optional)"
+                },
+                "due_after": {
+                    "type": "string",
+                    "description": "Only cards due at or after this ISO date/time (optional)"
+                },
+                "due_before": {
+                    "type": "string",
+                    "description": "Only cards due before this ISO date/time (optional)"
+                },
+                "incomplete": {
+                    "type": "boolean",
+                    "description": "Only cards whose due date is not marked complete (optional)"
+                },
+                "name_contains": {
+                    "type": "string",
+                    "description": "Only cards whose name contains this text, case-insensitive (optional)"
+                }
+            },
+            "required": ["board_id"]
+        }
+    ),
+)
+async def handle_query_cards(name: str, arguments: dict) -> list[TextContent]:
+    model = await board_sync.board(arguments["board_id"])
+    try:
+        query = _card_query(model, arguments)
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+    cards = model.query(**query)
+
+    if not cards:
+        return [TextContent(type="text", text="Cards matching query:\n(No cards found)")]
+
+    # Format response with list names and due dates from the mirror
+    result = "\n".join([
+        f"- {card['name']} (ID: {card['id']}, List: {model.lists.get(card['idList'], {}).get('name', card['idList'])}"
+        f"{', Due: ' + card['due'] if card['due'] else ''})"
+        for card in cards
+    ])
+    return [TextContent(type="text", text=f"Cards matching query ({len(cards)}):\n{result}")]
+
+
+@tool(
+    Tool(
+        name="get_api_stats",
+        description="Show Trello API client statistics (connection reuse) for this server process",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        }
+    ),
+)
+async def handle_get_api_stats(name: str, arguments: dict) -> list[TextContent]:
+    return [TextContent(type="text", text=format_api_stats())]
+
+
+# Built once: clients ask for the tool list often and it never changes
+TOOL_LIST = [spec.tool for spec in TOOL_REGISTRY.values()]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Trello tools."""
+    return TOOL_LIST
+
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls."""
+    spec = TOOL_REGISTRY.get(name)
+    if spec is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
     try:
-        # Validate IDs for security before processing
-        id_fields = {
-            'board_id': 'Board ID',
-            'list_id': 'List ID', 
-            'card_id': 'Card ID',
-            'member_id': 'Member ID',
-            'organization_id': 'Organization ID',
-            'label_id': 'Label ID'
-        }
-        
-        for field, field_name in id_fields.items():
-            if field in arguments:
-                try:
-                    arguments[field] = validate_trello_id(arguments[field], field_name)
-                except ValueError as e:
-                    return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
-        
-        if name == "list_boards":
-            boards = make_trello_request("GET", "/members/me/boards")
-            result = "\n".join([f"- {board['name']} (ID: {board['id']})" for board in boards])
-            return [TextContent(type="text", text=f"Your Trello Boards:\n{result}")]
-
-        elif name == "get_board":
-            board = make_trello_request("GET", f"/boards/{arguments['board_id']}")
-            return [TextContent(
-                type="text",
-                text=f"Board: {board['name']}\nID: {board['id']}\nURL: {board['url']}\nDescription: {board.get('desc', 'N/A')}"
-            )]
-
-        elif name == "list_board_lists":
-            lists = make_trello_request("GET", f"/boards/{arguments['board_id']}/lists")
-            result = "\n".join([f"- {lst['name']} (ID: {lst['id']})" for lst in lists])
-            return [TextContent(type="text", text=f"Lists on board:\n{result}")]
-
-        elif name == "list_board_cards":
-            cards = make_trello_request("GET", f"/boards/{arguments['board_id']}/cards")
-            result = "\n".join([f"- {card['name']} (ID: {card['id']}, List: {card['idList']})" for card in cards])
-            return [TextContent(type="text", text=f"Cards on board:\n{result}")]
-
-        elif name == "list_board_members":
-            board_id = arguments["board_id"]
-            members = make_trello_request("GET", f"/boards/{board_id}/members")
-            
-            # Format response with member details (name, username, ID, permission)
-            result = "\n".join([
-                f"- {member['fullName']} (@{member['username']}, ID: {member['id']}, Permission: {member.get('memberType', 'normal')})"
-                for member in members
-            ])
-            return [TextContent(type="text", text=f"Board Members:\n{result}")]
-
-        elif name == "add_board_member":
-            board_id = arguments["board_id"]
-            member_id = arguments["member_id"]
-            member_type = arguments.get("type", "normal")
-            
-            # Build query parameters with type
-            params = {"type": member_type}
-            
-            # Call make_trello_request with PUT method
-            result = make_trello_request("PUT", f"/boards/{board_id}/members/{member_id}", params=params)
-            
-            # Get member details for confirmation
-            member = make_trello_request("GET", f"/members/{member_id}")
-            
-            return [TextContent(
-                type="text",
-                text=f"Added member to board: {member['fullName']} (@{member['username']})\nPermission: {member_type}"
-            )]
-
-        elif name == "remove_board_member":
-            board_id = arguments["board_id"]
-            member_id = arguments["member_id"]
-            
-            # Call make_trello_request with DELETE method
-            make_trello_request("DELETE", f"/boards/{board_id}/members/{member_id}")
-            
-            return [TextContent(
-                type="text",
-                text=f"Removed member {member_id} from board"
-            )]
-
-        elif name == "update_board_member":
-            board_id = arguments["board_id"]
-            member_id = arguments["member_id"]
-            member_type = arguments["type"]
-            
-            # Validate type is one of: "admin", "normal", "observer"
-            valid_permissions = ["admin", "normal", "observer"]
-            if member_type not in valid_permissions:
-                return [TextContent(
-                    type="text",
-                    text=f"Error: Invalid permission type. Must be one of: {', '.join(valid_permissions)}"
-                )]
-            
-            # Build query parameters with type
-            params = {"type": member_type}
-            
-            # Call make_trello_request with PUT method
-            make_trello_request("PUT", f"/boards/{board_id}/members/{member_id}", params=params)
-            
-            # Get member details for confirmation
-            member = make_trello_request("GET", f"/members/{member_id}")
-            
-            return [TextContent(
-                type="text",
-                text=f"Updated member permission: {member['fullName']} (@{member['username']})\nNew permission: {member_type}"
-            )]
-
-        elif name == "invite_board_member":
-            board_id = arguments["board_id"]
-            email = arguments["email"]
-            member_type = arguments.get("type", "normal")
-            
-            # Build query parameters with email and type
-            params = {"email": email, "type": member_type}
-            
-            # Call make_trello_request with PUT method
-            make_trello_request("PUT", f"/boards/{board_id}/members", params=params)
-            
-            return [TextContent(
-                type="text",
-                text=f"Invited {email} to board\nPermission: {member_type}"
-            )]
-
-        elif name == "create_card":
-            data = {
-                "idList": arguments["list_id"],
-                "name": arguments["name"]
-            }
-            if "desc" in arguments:
-                data["desc"] = arguments["desc"]
-
-            card = make_trello_request("POST", "/cards", data=data)
-            return [TextContent(
-                type="text",
-                text=f"Created card: {card['name']}\nID: {card['id']}\nURL: {card['url']}"
-            )]
-
-        elif name == "update_card":
-            data = {}
-            if "name" in arguments:
-                data["name"] = arguments["name"]
-            if "desc" in arguments:
-                data["desc"] = arguments["desc"]
-            if "list_id" in arguments:
-                data["idList"] = arguments["list_id"]
-
-            card = make_trello_request("PUT", f"/cards/{arguments['card_id']}", data=data)
-            return [TextContent(
-                type="text",
-                text=f"Updated card: {card['name']}\nID: {card['id']}\nURL: {card['url']}"
-            )]
-
-        elif name == "get_card":
-            card = make_trello_request("GET", f"/cards/{arguments['card_id']}")
-            return [TextContent(
-                type="text",
-                text=f"Card: {card['name']}\nID: {card['id']}\nDescription: {card.get('desc', 'N/A')}\nList ID: {card['idList']}\nURL: {card['url']}"
-            )]
-
-        elif name == "create_list":
-            data = {
-                "name": arguments["name"],
-                "idBoard": arguments["board_id"]
-            }
-            if "pos" in arguments:
-                data["pos"] = arguments["pos"]
-
-            lst = make_trello_request("POST", "/lists", data=data)
-            return [TextContent(
-                type="text",
-                text=f"Created list: {lst['name']}\nID: {lst['id']}\nBoard ID: {lst['idBoard']}"
-            )]
-
-        elif name == "list_organizations":
-            orgs = make_trello_request("GET", "/members/me/organizations")
-            result = "\n".join([f"- {org['displayName']} (ID: {org['id']}, Name: {org['name']})" for org in orgs])
-            return [TextContent(type="text", text=f"Your Organizations/Workspaces:\n{result}")]
-
-        elif name == "get_organization":
-            org = make_trello_request("GET", f"/organizations/{arguments['org_id']}")
-            return [TextContent(
-                type="text",
-                text=f"Organization: {org['displayName']}\nID: {org['id']}\nName: {org['name']}\nDescription: {org.get('desc', 'N/A')}\nURL: {org['url']}\nWebsite: {org.get('website', 'N/A')}"
-            )]
-
-        elif name == "list_organization_boards":
-            boards = make_trello_request("GET", f"/organizations/{arguments['org_id']}/boards")
-            result = "\n".join([f"- {board['name']} (ID: {board['id']})" for board in boards])
-            return [TextContent(type="text", text=f"Boards in organization:\n{result}")]
-
-        elif name == "list_organization_members":
-            members = make_trello_request("GET", f"/organizations/{arguments['org_id']}/members")
-            result = "\n".join([f"- {member['fullName']} (@{member['username']}, ID: {member['id']})" for member in members])
-            return [TextContent(type="text", text=f"Members in organization:\n{result}")]
-
-        elif name == "add_organization_member":
-            data = {
-                "email": arguments["email"]
-            }
-            if "full_name" in arguments:
-                data["fullName"] = arguments["full_name"]
-            if "type" in arguments:
-                data["type"] = arguments["type"]
-
-            member = make_trello_request("PUT", f"/organizations/{arguments['org_id']}/members", data=data)
-            return [TextContent(
-                type="text",
-                text=f"Added member to organization: {member.get('fullName', arguments['email'])}"
-            )]
-
-        elif name == "remove_organization_member":
-            make_trello_request("DELETE", f"/organizations/{arguments['org_id']}/members/{arguments['member_id']}")
-            return [TextContent(
-                type="text",
-                text=f"Removed member {arguments['member_id']} from organization"
-            )]
-
-        elif name == "add_card_label":
-            data = {"value": arguments["label_id"]}
-            result = make_trello_request("POST", f"/cards/{arguments['card_id']}/idLabels", data=data)
-            
-            # Get card details to include in response
-            card = make_trello_request("GET", f"/cards/{arguments['card_id']}")
-            
-            # Find the label details from the card's labels
-            label_info = None
-            for label in card.get('labels', []):
-                if label['id'] == arguments['label_id']:
-                    label_info = label
-                    break
-            
-            if label_info:
-                label_name = label_info.get('name', 'Unnamed')
-                label_color = label_info.get('color', 'none')
-                return [TextContent(
-                    type="text",
-                    text=f"Added label to card: {card['name']}\nLabel: {label_name} ({label_color})\nCard ID: {card['id']}"
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=f"Added label to card: {card['name']}\nCard ID: {card['id']}"
-                )]
-
-        elif name == "remove_card_label":
-            make_trello_request("DELETE", f"/cards/{arguments['card_id']}/idLabels/{arguments['label_id']}")
-            return [TextContent(
-                type="text",
-                text=f"Removed label from card\nCard ID: {arguments['card_id']}\nLabel ID: {arguments['label_id']}"
-            )]
-
-        elif name == "list_card_labels":
-            labels = make_trello_request("GET", f"/cards/{arguments['card_id']}/labels")
-            
-            # Handle empty label list case
-            if not labels:
-                return [TextContent(
-                    type="text",
-                    text="Labels on card:\n(No labels)"
-                )]
-            
-            # Format response as list of labels with name, color, and ID
-            result = "\n".join([
-                f"- {label.get('name', 'Unnamed')} (Color: {label.get('color', 'none')}, ID: {label['id']})"
-                for label in labels
-            ])
-            return [TextContent(type="text", text=f"Labels on card:\n{result}")]
-
-        elif name == "list_board_labels":
-            labels = make_trello_request("GET", f"/boards/{arguments['board_id']}/labels")
-            
-            # Format response as list of available labels with name, color, and ID
-            result = "\n".join([
-                f"- {label.get('name', 'Unnamed')} (Color: {label.get('color', 'none')}, ID: {label['id']})"
-                for label in labels
-            ])
-            return [TextContent(type="text", text=f"Available labels on board:\n{result}")]
-
-        elif name == "filter_cards_by_label":
-            # Extract board_id and label_id from arguments
-            board_id = arguments['board_id']
-            label_id = arguments['label_id']
-            
-            # Call make_trello_request() with GET method to /boards/{board_id}/cards
-            cards = make_trello_request("GET", f"/boards/{board_id}/cards")
-            
-            # Filter cards by checking if label_id is in card's idLabels array
-            filtered_cards = [card for card in cards if label_id in card.get('idLabels', [])]
-            
-            # Handle empty results case
-            if not filtered_cards:
-                # Get label name for better user experience
-                labels = make_trello_request("GET", f"/boards/{board_id}/labels")
-                label_name = "Unknown"
-                for label in labels:
-                    if label['id'] == label_id:
-                        label_name = label.get('name', 'Unnamed')
-                        break
-                
-                return [TextContent(
-                    type="text",
-                    text=f"Cards with label {label_name}:\n(No cards found)"
-                )]
-            
-            # Get label name for the response
-            label_name = "Unknown"
-            if filtered_cards:
-                # Get label details from the first card's labels
-                for label in filtered_cards[0].get('labels', []):
-                    if label['id'] == label_id:
-                        label_name = label.get('name', 'Unnamed')
-                        break
-            
-            # Format response as list of cards with name, ID, and list ID
-            result = "\n".join([
-                f"- {card['name']} (ID: {card['id']}, List: {card['idList']})"
-                for card in filtered_cards
-            ])
-            return [TextContent(type="text", text=f"Cards with label {label_name}:\n{result}")]
-
-        elif name == "add_card_member":
-            data = {"value": arguments["member_id"]}
-            make_trello_request("POST", f"/cards/{arguments['card_id']}/idMembers", data=data)
-            return [TextContent(
-                type="text",
-                text=f"Added member {arguments['member_id']} to card {arguments['card_id']}"
-            )]
-
-        elif name == "remove_card_member":
-            make_trello_request("DELETE", f"/cards/{arguments['card_id']}/idMembers/{arguments['member_id']}")
-            return [TextContent(
-                type="text",
-                text=f"Removed member {arguments['member_id']} from card {arguments['card_id']}"
-            )]
-
-        elif name == "list_card_members":
-            members = make_trello_request("GET", f"/cards/{arguments['card_id']}/members")
-            
-            # Handle empty member list case
-            if not members:
-                return [TextContent(type="text", text="No members assigned to this card")]
-            
-            # Format response as list of members with fullName, username, and ID
-            result = "\n".join([
-                f"- {member['fullName']} (@{member['username']}, ID: {member['id']})"
-                for member in members
-            ])
-            return [TextContent(type="text", text=f"Members on card:\n{result}")]
+        credentials = session_credentials()
+    except ValueError as e:
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+    # Everything the tool does, including tasks it starts, runs as this identity
+    scope = _session_auth.set(credentials)
+    try:
+        return await _run_tool(spec, name, arguments)
+    finally:
+        _session_auth.reset(scope)
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+async def _run_tool(spec: ToolSpec, name: str, arguments: Any) -> list[TextContent]:
+    """Validate arguments, run a tool's handler and apply its invalidation."""
+    status = await authorization.ready(AUTH_WAIT_TIMEOUT)
+    if status:
+        return [TextContent(type="text", text=status)]
+    try:
+        # Validate IDs and shared arguments for security before processing
+        try:
+            for key, validate in spec.validators:
+                if key in arguments:
+                    arguments[key] = validate(arguments[key])
+        except ValueError as e:
+            return [TextContent(type="text", text=f"Validation Error: {str(e)}")]
+
+        return await spec.handler(name, arguments)
 
     except requests.exceptions.HTTPError as e:
         # Log detailed error internally but return sanitized message to user
         logger.error(f"Trello API error for tool {name}: {e}")
         logger.error(f"Response: {e.response.text if hasattr(e, 'response') else 'N/A'}")
         # Return generic error without exposing internal details
-        status_code = e.response.status_code if hasattr(e, 'response') else 'unknown'
-        if status_code == 401:
-            return [TextContent(type="text", text="Error: Authentication failed. Please check your credentials.")]
-        elif status_code == 403:
-            return [TextContent(type="text", text="Error: Permission denied. You don't have access to this resource.")]
-        elif status_code == 404:
-            return [TextContent(type="text", text="Error: Resource not found. Please check the ID.")]
-        elif status_code == 429:
-            return [TextContent(type="text", text="Error: Rate limit exceeded. Please try again later.")]
-        else:
-            return [TextContent(type="text", text=f"Error: API request failed (status {status_code}).")]
-    except requests.exceptions.Timeout:
+        return [TextContent(type="text", text=f"Error: {_error_message(e)}")]
+    except requests.exceptions.Timeout as e:
         logger.error(f"Timeout executing tool {name}")
-        return [TextContent(type="text", text="Error: Request timed out. Please try again.")]
-    except requests.exceptions.ConnectionError:
+        return [TextContent(type="text", text=f"Error: {_error_message(e)}")]
+    except requests.exceptions.ConnectionError as e:
         logger.error(f"Connection error executing tool {name}")
-        return [TextContent(type="text", text="Error: Cannot connect to Trello API. Please check your network.")]
+        return [TextContent(type="text", text=f"Error: {_error_message(e)}")]
     except Exception as e:
         # Log full error internally
         logger.error(f"Error executing tool {name}: {e}")
@@ -1184,21 +4811,30 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
 
 
-async def main():
-    """Run the server."""
+async def main(transport: str = MCP_TRANSPORT, host: str = MCP_HOST, port: int = MCP_PORT):
+    """Run the server over stdio or, with ``transport="http"``, streamable HTTP."""
     # Debug: Log startup
     logger.info("=" * 70)
     logger.info("TRELLO MCP SERVER STARTING")
     logger.info("=" * 70)
     logger.info(f"API Key from env: {'SET' if os.getenv('TRELLO_API_KEY') else 'NOT SET'}")
     logger.info(f"Token from env: {'SET' if os.getenv('TRELLO_TOKEN') else 'NOT SET'}")
-    logger.info(f"Auth object API Key: {'SET' if auth.api_key else 'NOT SET'}")
-    logger.info(f"Auth object Token: {'SET' if auth.token else 'NOT SET'}")
-    logger.info(f"Is authenticated: {auth.is_authenticated()}")
+    logger.info(f"Auth object API Key: {'SET' if get_auth().api_key else 'NOT SET'}")
+    logger.info(f"Auth object Token: {'SET' if get_auth().token else 'NOT SET'}")
+    logger.info(f"Is authenticated: {get_auth().is_authenticated()}")
     logger.info("=" * 70)
     
+    if transport == "http" and host not in LOCAL_HOSTS and not MCP_REQUIRE_TOKEN:
+        # Anyone reaching the port would otherwise act as the server's Trello user
+        logger.error(f"Refusing to serve HTTP on {host} without TRELLO_MCP_REQUIRE_TOKEN=1.")
+        logger.error("Set it so every client must send its own X-Trello-Token, or bind to 127.0.0.1.")
+        raise SystemExit(1)
+    
     # Check authentication at startup
-    if not auth.is_authenticated():
+    if transport == "http" and MCP_REQUIRE_TOKEN:
+        # Every client brings its own token, so the server needs none
+        logger.info("Serving clients with their own Trello tokens; server credentials are not used.")
+    elif not get_auth().is_authenticated():
         logger.info("=" * 70)
         logger.info("AUTHENTICATION REQUIRED")
         logger.info("=" * 70)
@@ -1222,43 +4858,97 @@ async def main():
         logger.info(f"Found API key: {api_key[:4]}...")
         logger.info("Opening browser for authorization...")
         logger.info("Please click 'Allow' in your browser to authorize the app.")
+        logger.info("Serving MCP requests meanwhile; tool calls wait for authorization.")
         logger.info("")
         
-        # Run interactive authentication
-        token = auth.authorize_interactive(api_key)
-        
-        if not token:
-            logger.error("")
-            logger.error("=" * 70)
-            logger.error("AUTHENTICATION FAILED")
-            logger.error("=" * 70)
-            logger.error("Authorization timed out or was cancelled.")
-            logger.error("")
-            logger.error("The browser should have opened. If not, you can:")
-            logger.error("1. Check if a browser window opened in the background")
-            logger.error("2. Use manual authentication:")
-            logger.error("   python auth.py --interactive")
-            logger.error("=" * 70)
-            raise SystemExit(1)
-        
-        logger.info("")
-        logger.info("=" * 70)
-        logger.info("✓ AUTHENTICATION SUCCESSFUL!")
-        logger.info("=" * 70)
-        logger.info(f"Credentials saved to: {TOKEN_CACHE_FILE}")
-        logger.info("")
+        # Authorize in the background so the stdio session starts now
+        authorization.start(api_key)
+    else:
+        logger.info(f"Starting Trello MCP server (authenticated with key: {get_auth().api_key[:8]}...)")
     
-    logger.info(f"Starting Trello MCP server (authenticated with key: {auth.api_key[:8]}...)")
+    if WEBHOOK_PORT:
+        try:
+            webhook_receiver.start(asyncio.get_running_loop())
+        except ValueError as e:
+            logger.error(f"Webhook receiver not started: {e}")
     
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
+    try:
+        if transport == "http":
+            await serve_http(host, port)
+            return
+
+        import mcp.server.stdio
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        if webhook_receiver.running:
+            await webhook_receiver.stop()
+
+
+class _SessionManagerEndpoint:
+    """ASGI endpoint handing every request at the MCP path to the session manager.
+
+    A class rather than a function, so Starlette routes raw ASGI calls to
+    it instead of wrapping it as a request/response endpoint.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    async def __call__(self, scope, receive, send):
+        await self.manager.handle_request(scope, receive, send)
+
+
+def build_http_app(host: str = MCP_HOST, path: str = MCP_PATH):
+    """Return the ASGI app serving MCP sessions over streamable HTTP at ``path``.
+
+    Sessions are independent MCP conversations, but their tool calls all
+    go through this module's transport, response cache, board sync and
+    rate limiter, so every client benefits from the others' warm
+    connections and cached responses and shares one rate budget.
+    """
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from mcp.server.transport_security import TransportSecuritySettings
+
+    security = None
+    if host in LOCAL_HOSTS:
+        # Reject DNS rebinding from web pages when bound to loopback
+        security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=True,
+            allowed_hosts=["127.0.0.1:*", "localhost:*", "[::1]:*"],
+            allowed_origins=["http://127.0.0.1:*", "http://localhost:*", "http://[::1]:*"],
         )
+    manager = StreamableHTTPSessionManager(app=app, security_settings=security)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_):
+        async with manager.run():
+            yield
+
+    return Starlette(routes=[Route(path, endpoint=_SessionManagerEndpoint(manager))], lifespan=lifespan)
+
+
+async def serve_http(host: str = MCP_HOST, port: int = MCP_PORT):
+    """Serve MCP over streamable HTTP until the process is stopped."""
+    import uvicorn
+    logger.info(f"Serving MCP over streamable HTTP at http://{host}:{port}{MCP_PATH}")
+    config = uvicorn.Config(build_http_app(host), host=host, port=port, log_level="info")
+    await uvicorn.Server(config).serve()
 
 
 def run():
     """Synchronous entry point for the CLI."""
-    import asyncio
-    asyncio.run(main())
+    import argparse
+    parser = argparse.ArgumentParser(description="Trello MCP server")
+    parser.add_argument("--transport", choices=("stdio", "http"), default=MCP_TRANSPORT,
+                        help="stdio for a single client, http to serve many clients (default: %(default)s)")
+    parser.add_argument("--host", default=MCP_HOST, help="HTTP bind address (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=MCP_PORT, help="HTTP port (default: %(default)s)")
+    args = parser.parse_args()
+    asyncio.run(main(args.transport, args.host, args.port))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark the payload bytes saved by field projection on the read tools.
+
+For every read tool, fetches its endpoint once with Trello's default fields
+and once with the tool's declared fields, and prints the bytes of each.
+Requires cached credentials (python auth.py --interactive).
+
+Usage:
+    python tests/bench_field_projection.py
+    python tests/bench_field_projection.py --board-id abc123 --org-id myteam
+"""
+
+import argparse
+import os
+import sys
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from server import TOOL_FIELDS, TRELLO_API_BASE, TrelloTransport
+from auth import TrelloAuth
+
+# Endpoint fetched by each read tool
+TOOL_ENDPOINTS = {
+    "list_boards": "/members/me/boards",
+    "get_board": "/boards/{board_id}",
+    "list_board_lists": "/boards/{board_id}/lists",
+    "list_board_cards": "/boards/{board_id}/cards",
+    "list_board_members": "/boards/{board_id}/members",
+    "get_card": "/cards/{card_id}",
+    "list_organizations": "/members/me/organizations",
+    "get_organization": "/organizations/{org_id}",
+    "list_organization_boards": "/organizations/{org_id}/boards",
+    "list_organization_members": "/organizations/{org_id}/members",
+    "list_card_labels": "/cards/{card_id}/labels",
+    "list_board_labels": "/boards/{board_id}/labels",
+    "filter_cards_by_label": "/boards/{board_id}/cards",
+    "list_card_members": "/cards/{card_id}/members",
+}
+
+
+def fetch_bytes(transport, credentials, endpoint, params=None):
+    """Return the body size of a GET request."""
+    response = transport.request("GET", f"{TRELLO_API_BASE}{endpoint}", params={**credentials, **(params or {})})
+    response.raise_for_status()
+    return len(response.content), response.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure bytes saved by field projection")
+    parser.add_argument("--board-id", help="Board to measure (defaults to your first board)")
+    parser.add_argument("--card-id", help="Card to measure (defaults to the board's first card)")
+    parser.add_argument("--org-id", help="Organization to measure (defaults to your first organization)")
+    args = parser.parse_args()
+
+    auth = TrelloAuth()
+    if not auth.is_authenticated():
+        print("❌ Not authenticated!")
+        print("Please run authentication first:")
+        print("  python auth.py --interactive")
+        return 1
+
+    api_key, token = auth.get_credentials()
+    credentials = {"key": api_key, "token": token}
+    transport = TrelloTransport()
+
+    ids = {"board_id": args.board_id, "card_id": args.card_id, "org_id": args.org_id}
+    if not ids["board_id"]:
+        _, boards = fetch_bytes(transport, credentials, "/members/me/boards", {"fields": "name"})
+        ids["board_id"] = boards[0]["id"] if boards else None
+    if not ids["card_id"] and ids["board_id"]:
+        _, cards = fetch_bytes(transport, credentials, f"/boards/{ids['board_id']}/cards", {"fields": "name"})
+        ids["card_id"] = cards[0]["id"] if cards else None
+    if not ids["org_id"]:
+        _, orgs = fetch_bytes(transport, credentials, "/members/me/organizations", {"fields": "name"})
+        ids["org_id"] = orgs[0]["id"] if orgs else None
+
+    print("=" * 72)
+    print(f"{'Tool':<28}{'Full bytes':>14}{'Projected':>14}{'Saved':>14}")
+    print("=" * 72)
+    total_full = total_projected = 0
+    for tool, template in TOOL_ENDPOINTS.items():
+        endpoint = template.format(**ids)
+        if "None" in endpoint:
+            print(f"{tool:<28}{'(skipped: no id)':>42}")
+            continue
+        full, _ = fetch_bytes(transport, credentials, endpoint)
+        projected, _ = fetch_bytes(transport, credentials, endpoint, {"fields": TOOL_FIELDS[tool]})
+        total_full += full
+        total_projected += projected
+        saved = 100 * (full - projected) / full if full else 0
+        print(f"{tool:<28}{full:>14,}{projected:>14,}{saved:>13.1f}%")
+    print("-" * 72)
+    saved = 100 * (total_full - total_projected) / total_full if total_full else 0
+    print(f"{'Total':<28}{total_full:>14,}{total_projected:>14,}{saved:>13.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
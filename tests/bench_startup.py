@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark server startup: import time and time to the first tools/list.
+
+Each run starts a fresh interpreter. "import" times ``import server`` alone;
+"tools/list" launches the stdio server with placeholder credentials, sends
+initialize, initialized and tools/list, and stops the clock when the tool
+list arrives. Both report the median over several runs. Runs offline.
+
+Usage:
+    python tests/bench_startup.py
+    python tests/bench_startup.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = "import time; t = time.perf_counter(); import server; print(time.perf_counter() - t)"
+SERVE_SCRIPT = "import server; server.run()"
+
+
+def time_import() -> float:
+    result = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT, capture_output=True, text=True,
+                            check=True)
+    return float(result.stdout)
+
+
+def send(process, message: dict):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def read_response(process, request_id: int) -> dict:
+    while True:
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before answering")
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+def time_first_list_tools() -> tuple[float, int]:
+    env = dict(os.environ, TRELLO_API_KEY="bench-key", TRELLO_TOKEN="bench-token")
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", SERVE_SCRIPT], cwd=ROOT, env=env, text=True,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        send(process, {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+            "protocolVersion": "2025-06-18", "capabilities": {},
+            "clientInfo": {"name": "bench_startup", "version": "1.0"}}})
+        read_response(process, 1)
+        send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send(process, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = read_response(process, 2)["result"]["tools"]
+        return time.perf_counter() - start, len(tools)
+    finally:
+        process.stdin.close()
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="fresh processes per measurement (default: 10)")
+    args = parser.parse_args()
+
+    imports = [time_import() for _ in range(args.runs)]
+    listings = [time_first_list_tools() for _ in range(args.runs)]
+    print(f"import server:    median {statistics.median(imports) * 1000:7.1f} ms "
+          f"(min {min(imports) * 1000:.1f} ms, {args.runs} runs)")
+    times = [elapsed for elapsed, _ in listings]
+    print(f"first tools/list: median {statistics.median(times) * 1000:7.1f} ms "
+          f"(min {min(times) * 1000:.1f} ms, {listings[0][1]} tools, {args.runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
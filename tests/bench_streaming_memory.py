@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak memory of buffered versus streamed decoding of a card listing.
+
+Builds a synthetic /boards/{id}/cards response (50,000 cards by default)
+that is generated as it is read, then measures with tracemalloc the peak
+memory of filtering it by label and rendering its first page, once from
+``response.json()`` and once through the streaming decoder
+(TRELLO_STREAM_JSON). Runs offline.
+
+Usage:
+    python tests/bench_streaming_memory.py
+    python tests/bench_streaming_memory.py --cards 200000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import requests
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from server import STREAM_CHUNK_SIZE, _render_page, _render_streamed_page, iter_json_array
+
+
+class SyntheticCards:
+    """File-like response body producing a JSON array of cards on demand."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.index = 0
+        self.pending = b"["
+
+    def _card(self, i: int) -> bytes:
+        card = {
+            "id": f"{i:024x}",
+            "name": f"Synthetic card number {i} with a reasonably long title",
+            "idList": f"{i % 8:024x}",
+            "idLabels": [f"{label:024x}" for label in range(i % 3)],
+        }
+        return (b"," if i else b"") + json.dumps(card).encode()
+
+    def read(self, size: int = -1) -> bytes:
+        while (size < 0 or len(self.pending) < size) and self.index <= self.count:
+            self.pending += self._card(self.index) if self.index < self.count else b"]"
+            self.index += 1
+        data, self.pending = (self.pending, b"") if size < 0 else (self.pending[:size], self.pending[size:])
+        return data
+
+
+def make_response(count: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = SyntheticCards(count)
+    response.encoding = "utf-8"
+    return response
+
+
+def filter_label(cards):
+    label_id = f"{1:024x}"
+    return [card for card in cards if label_id in card["idLabels"]]
+
+
+def first_page(cards):
+    return _render_page("Cards on board:", cards, {}, render)
+
+
+def render(card):
+    return f"- {card['name']} (ID: {card['id']}, List: {card['idList']})"
+
+
+def streamed_first_page(cards):
+    return _render_streamed_page("Cards on board:", cards, {}, render)
+
+
+def measure(count: int, decode, consume) -> tuple:
+    """Return (peak bytes, seconds, result size) for one decode-and-consume run."""
+    response = make_response(count)
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = consume(decode(response))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, len(result)
+
+
+def buffered(response):
+    return response.json()
+
+
+def streamed(response):
+    return iter_json_array(response.iter_content(STREAM_CHUNK_SIZE))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory of buffered vs streamed card decoding")
+    parser.add_argument("--cards", type=int, default=50000, help="Number of synthetic cards (default 50000)")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"{'Workload':<32}{'Mode':<10}{'Peak memory':>14}{'Time':>8}{'Result':>8}")
+    print("=" * 72)
+    workloads = [("filter_cards_by_label", filter_label, filter_label),
+                 ("list_board_cards (first page)", first_page, streamed_first_page)]
+    for workload, consume_list, consume_stream in workloads:
+        for mode, decode, consume in (("buffered", buffered, consume_list), ("streamed", streamed, consume_stream)):
+            peak, elapsed, size = measure(args.cards, decode, consume)
+            print(f"{workload:<32}{mode:<10}{peak / 1024 / 1024:>11.1f} MB{elapsed:>7.2f}s{size:>8}")
+    print("-" * 72)
+    print(f"{args.cards:,} cards; result is the number of matching cards or characters rendered")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Offline stand-in for the Trello API used by the unit tests.
+
+Install it with ``install_fake_trello(monkeypatch)``; it replaces the server's
+transport and credentials so tool handlers run without network access.
+"""
+import json
+import os
+import sys
+import time
+from urllib.parse import parse_qsl, urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+
+
+def make_response(status: int = 200, payload=None, headers: dict = None, url: str = "") -> requests.Response:
+    """Build a requests.Response carrying a JSON payload."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload if payload is not None else {}).encode()
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json", **(headers or {})})
+    response.url = url
+    response.encoding = "utf-8"
+    response._content_consumed = True  # The body is in memory, so stream=True reads can iterate it
+    return response
+
+
+class FakeTransport:
+    """Answer Trello API requests from an in-memory route table.
+
+    Routes map ``(method, path)`` to a payload, a ``requests.Response`` or a
+    callable ``(params, json) -> payload | Response``. Paths are relative to
+    the API base, e.g. ``"/boards/abc/cards"``.
+    """
+
+    def __init__(self, routes: dict = None, delay: float = 0.0):
+        self.routes = dict(routes or {})
+        self.delay = delay
+        self.calls = []
+
+    def request(self, method: str, url: str, params: dict = None, json: dict = None, **kwargs):
+        path = urlparse(url).path
+        if path.startswith("/1/"):
+            path = path[2:]
+        params = {k: v for k, v in (params or {}).items() if k not in ("key", "token")}
+        self.calls.append((method, path, params, json))
+        if self.delay:
+            time.sleep(self.delay)
+        if (method, path) == ("GET", "/batch") and ("GET", "/batch") not in self.routes:
+            return make_response(200, [self._batch_entry(route) for route in params["urls"].split(",")], url=url)
+        return self._resolve(method, path, params, json, url)
+
+    def _resolve(self, method, path, params, json, url=""):
+        route = self.routes.get((method, path))
+        if route is None:
+            return make_response(404, {"message": "not found"}, url=url)
+        if callable(route):
+            route = route(params, json)
+        if isinstance(route, requests.Response):
+            return route
+        return make_response(200, route, url=url)
+
+    def _batch_entry(self, route: str):
+        """Answer one route of a /batch call the way Trello does."""
+        parsed = urlparse(route)
+        response = self._resolve("GET", parsed.path, dict(parse_qsl(parsed.query)), None)
+        if response.ok:
+            return {str(response.status_code): response.json()}
+        return {"name": "Error", "message": response.text, "statusCode": response.status_code}
+
+    def stats(self) -> dict:
+        return {"requests": len(self.calls), "new_connections": 0, "reused_connections": len(self.calls),
+                "idle_recycles": 0, "pool_maxsize": 1}
+
+    def batched_paths(self) -> list:
+        """Return the routes requested through /batch calls."""
+        return [route for m, path, params, _ in self.calls if path == "/batch"
+                for route in params["urls"].split(",")]
+
+    def paths(self, method: str = None) -> list:
+        return [path for m, path, _, _ in self.calls if method is None or m == method]
+
+
+def install_fake_trello(monkeypatch, routes: dict = None, delay: float = 0.0, sync: bool = False) -> FakeTransport:
+    """Point the server at a FakeTransport with dummy credentials.
+
+    Board sync is off unless ``sync`` is set, so read tools make their
+    direct requests.
+    """
+    fake = FakeTransport(routes, delay=delay)
+    monkeypatch.setattr(server, "transport", fake)
+    monkeypatch.setattr(server, "response_cache", server.ResponseCache())
+    monkeypatch.setattr(server, "label_index", server.LabelIndex())
+    monkeypatch.setattr(server, "board_sync", server.BoardSync(enabled=sync))
+    monkeypatch.setattr(server.auth, "api_key", "test-key")
+    monkeypatch.setattr(server.auth, "token", "test-token")
+    return fake
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests for the non-blocking Trello client path (no Trello access needed)."""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+import requests
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+def test_tool_calls_run_concurrently(monkeypatch):
+    install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): {"id": "b1", "name": "One", "url": "u1"},
+        ("GET", "/boards/b2"): {"id": "b2", "name": "Two", "url": "u2"},
+    }, delay=0.3)
+
+    async def run_both():
+        return await asyncio.gather(
+            server.call_tool("get_board", {"board_id": "b1"}),
+            server.call_tool("get_board", {"board_id": "b2"}),
+        )
+
+    started = time.monotonic()
+    first, second = asyncio.run(run_both())
+    elapsed = time.monotonic() - started
+
+    assert "Board: One" in first[0].text
+    assert "Board: Two" in second[0].text
+    assert elapsed < 0.55  # Sequential execution would take at least 0.6s
+
+
+def test_sync_wrapper(monkeypatch):
+    install_fake_trello(monkeypatch, {("GET", "/members/me/boards"): [{"id": "b1", "name": "One"}]})
+    assert server.make_trello_request("GET", "/members/me/boards") == [{"id": "b1", "name": "One"}]
+
+
+def test_sync_wrapper_raises_http_errors(monkeypatch):
+    install_fake_trello(monkeypatch)
+    with pytest.raises(requests.exceptions.HTTPError):
+        server.make_trello_request("GET", "/boards/missing")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for authorizing in the background while the server answers (no Trello access needed)."""
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+class BrowserFlow:
+    """Stand-in for ``authorize_interactive`` that finishes when released."""
+
+    def __init__(self, token="browser-token"):
+        self.token = token
+        self.release = threading.Event()
+
+    def __call__(self, api_key, *args, **kwargs):
+        self.release.wait(5)
+        if self.token:
+            server.auth.set_credentials(api_key, self.token)
+        return self.token
+
+
+@pytest.fixture
+def unauthenticated(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("GET", "/members/me/boards"): [{"id": "b1", "name": "Roadmap"}]})
+    monkeypatch.setattr(server.auth, "token", None)
+    monkeypatch.setattr(server.TrelloAuth, "set_credentials", lambda auth, key, token: setattr(auth, "token", token))
+    monkeypatch.setattr(server, "authorization", server.BackgroundAuthorization())
+    monkeypatch.setattr(server, "AUTH_WAIT_TIMEOUT", 0.05)
+    return fake
+
+
+async def call(name, arguments):
+    return (await server.call_tool(name, arguments))[0].text
+
+
+def test_tool_calls_report_authorizing_then_proceed(monkeypatch, unauthenticated):
+    flow = BrowserFlow()
+    monkeypatch.setattr(server.auth, "authorize_interactive", flow)
+
+    async def scenario():
+        server.authorization.start("test-key")
+        tools = await server.list_tools()
+        waiting = await call("list_boards", {})
+        flow.release.set()
+        await asyncio.wait_for(asyncio.shield(server.authorization.future), 5)
+        return tools, waiting, await call("list_boards", {})
+
+    tools, waiting, listed = asyncio.run(scenario())
+    assert len(tools) == len(server.TOOL_REGISTRY)
+    assert waiting.startswith("Authorizing:")
+    assert "Roadmap" in listed
+    assert unauthenticated.paths() == ["/members/me/boards"]
+
+
+def test_call_waiting_within_deadline_succeeds(monkeypatch, unauthenticated):
+    flow = BrowserFlow()
+    monkeypatch.setattr(server.auth, "authorize_interactive", flow)
+    monkeypatch.setattr(server, "AUTH_WAIT_TIMEOUT", 5.0)
+
+    async def scenario():
+        server.authorization.start("test-key")
+        asyncio.get_running_loop().call_later(0.05, flow.release.set)
+        return await call("list_boards", {})
+
+    assert "Roadmap" in asyncio.run(scenario())
+
+
+def test_failed_authorization_is_reported(monkeypatch, unauthenticated):
+    flow = BrowserFlow(token=None)
+    flow.release.set()
+    monkeypatch.setattr(server.auth, "authorize_interactive", flow)
+
+    async def scenario():
+        server.authorization.start("test-key")
+        return await call("list_boards", {})
+
+    assert asyncio.run(scenario()).startswith("Error: Trello authorization failed")
+    assert unauthenticated.calls == []
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Tests for combining concurrent GETs into /1/batch calls (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+import pytest
+import requests
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello, make_response
+
+
+@pytest.fixture(autouse=True)
+def batcher(monkeypatch):
+    batcher = server.RequestBatcher(window=0.01)
+    monkeypatch.setattr(server, "request_batcher", batcher)
+    monkeypatch.setattr(server, "retry_policy", server.RetryPolicy(base_delay=0.01))
+    return batcher
+
+
+def gather_gets(*endpoints):
+    async def run():
+        return await asyncio.gather(
+            *(server.make_trello_request_async("GET", endpoint) for endpoint in endpoints),
+            return_exceptions=True
+        )
+    return asyncio.run(run())
+
+
+def test_concurrent_gets_share_one_batch(monkeypatch, batcher):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): {"id": "b1"},
+        ("GET", "/cards/c1"): {"id": "c1"},
+    })
+    assert gather_gets("/boards/b1", "/cards/c1") == [{"id": "b1"}, {"id": "c1"}]
+    assert fake.paths() == ["/batch"]
+    assert batcher.stats()["saved_round_trips"] == 1
+
+
+def test_single_get_is_sent_directly(monkeypatch, batcher):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1"): {"id": "b1"}})
+    assert gather_gets("/boards/b1") == [{"id": "b1"}]
+    assert fake.paths() == ["/boards/b1"]
+
+
+def test_batch_is_split_at_ten_routes(monkeypatch):
+    routes = {("GET", f"/cards/c{i}"): {"id": f"c{i}"} for i in range(12)}
+    fake = install_fake_trello(monkeypatch, routes)
+    results = gather_gets(*(f"/cards/c{i}" for i in range(12)))
+    assert results == [{"id": f"c{i}"} for i in range(12)]
+    assert fake.paths() == ["/batch", "/batch"]
+
+
+def test_failed_route_raises_http_error_for_its_caller(monkeypatch):
+    install_fake_trello(monkeypatch, {("GET", "/boards/b1"): {"id": "b1"}})
+    ok, missing = gather_gets("/boards/b1", "/cards/missing")
+    assert ok == {"id": "b1"}
+    assert isinstance(missing, requests.exceptions.HTTPError)
+    assert missing.response.status_code == 404
+
+
+def test_retryable_route_is_resent_directly(monkeypatch):
+    outcomes = [make_response(503), {"id": "c1"}]
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): {"id": "b1"},
+        ("GET", "/cards/c1"): lambda params, json: outcomes.pop(0),
+    })
+    assert gather_gets("/boards/b1", "/cards/c1") == [{"id": "b1"}, {"id": "c1"}]
+    assert fake.paths() == ["/batch", "/cards/c1"]
+
+
+def test_query_parameters_survive_batching(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): lambda params, json: {"fields": params.get("fields")},
+        ("GET", "/cards/c1"): {"id": "c1"},
+    })
+
+    async def run():
+        return await asyncio.gather(
+            server.make_trello_request_async("GET", "/boards/b1", params={"fields": "name,url"}),
+            server.make_trello_request_async("GET", "/cards/c1"),
+        )
+    board, _ = asyncio.run(run())
+    assert board == {"fields": "name,url"}
+    assert fake.batched_paths() == ["/boards/b1?fields=name%2Curl", "/cards/c1"]
+
+
+def test_filter_cards_by_label_uses_one_round_trip(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): [
+            {"id": "c1", "name": "Fix bug", "idList": "l1", "idLabels": ["lab1"]},
+            {"id": "c2", "name": "Write docs", "idList": "l1", "idLabels": []},
+        ],
+        ("GET", "/boards/b1/labels"): [{"id": "lab1", "name": "Bug", "color": "red"}],
+    })
+    result = asyncio.run(server.call_tool("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}))
+    assert result[0].text == "Cards with label Bug:\n- Fix bug (ID: c1, List: l1)"
+    assert fake.paths() == ["/batch"]
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the single-request board snapshot tool (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+SNAPSHOT = {
+    "id": "b1",
+    "name": "Roadmap",
+    "desc": "Q4 plans",
+    "url": "https://trello.com/b/b1",
+    "lists": [{"id": "l1", "name": "To Do"}, {"id": "l2", "name": "Done"}],
+    "labels": [{"id": "lab1", "name": "Bug", "color": "red"}, {"id": "lab2", "name": "", "color": "green"}],
+    "members": [{"id": "m1", "fullName": "Alice Doe", "username": "alice"}],
+    "memberships": [{"id": "ms1", "idMember": "m1", "memberType": "admin"}],
+    "cards": [
+        {"id": "c1", "name": "Fix bug", "idList": "l1", "idLabels": ["lab1", "lab2"], "idMembers": ["m1"],
+         "due": "2026-10-20T12:00:00.000Z", "dueComplete": False, "closed": False},
+        {"id": "c2", "name": "Write docs", "idList": "l1", "idLabels": [], "idMembers": [],
+         "due": None, "dueComplete": False, "closed": False},
+    ],
+    "actions": [{"id": "a1"}],
+}
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def test_snapshot_renders_grouped_view_in_one_request(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1"): SNAPSHOT})
+    text = call("get_board_snapshot", {"board_id": "b1"})
+    assert text == (
+        "Board: Roadmap (ID: b1)\n"
+        "URL: https://trello.com/b/b1\n"
+        "Description: Q4 plans\n"
+        "Members: Alice Doe (@alice, admin)\n"
+        "Labels: Bug (red, ID: lab1), Unnamed (green, ID: lab2)\n"
+        "\n"
+        "To Do (ID: l1) - 2 cards\n"
+        "- Fix bug (ID: c1) | Labels: Bug, green | Members: Alice Doe | Due: 2026-10-20T12:00:00.000Z\n"
+        "- Write docs (ID: c2)\n"
+        "\n"
+        "Done (ID: l2) - 0 cards"
+    )
+    assert fake.paths() == ["/boards/b1"]
+    params = fake.calls[0][2]
+    assert (params["lists"], params["cards"], params["labels"], params["members"]) == ("open", "open", "all", "all")
+
+
+def test_snapshot_fills_board_tool_caches(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1"): SNAPSHOT})
+    call("get_board_snapshot", {"board_id": "b1"})
+    assert call("get_board", {"board_id": "b1"}).startswith("Board: Roadmap\nID: b1\nURL: https://trello.com/b/b1")
+    assert call("list_board_lists", {"board_id": "b1"}) == "Lists on board:\n- To Do (ID: l1)\n- Done (ID: l2)"
+    assert call("list_board_cards", {"board_id": "b1"}) == (
+        "Cards on board:\n- Fix bug (ID: c1, List: l1)\n- Write docs (ID: c2, List: l1)")
+    assert "Bug (Color: red, ID: lab1)" in call("list_board_labels", {"board_id": "b1"})
+    assert fake.paths() == ["/boards/b1"]
+
+
+def test_snapshot_does_not_answer_list_board_members(monkeypatch):
+    # The snapshot's memberType is the board role; the members endpoint reports the account type
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): SNAPSHOT,
+        ("GET", "/boards/b1/members"): [{"id": "m1", "fullName": "Alice Doe", "username": "alice",
+                                         "memberType": "normal"}],
+    })
+    call("get_board_snapshot", {"board_id": "b1"})
+    assert call("list_board_members", {"board_id": "b1"}) == (
+        "Board Members:\n- Alice Doe (@alice, ID: m1, Permission: normal)")
+    assert fake.paths() == ["/boards/b1", "/boards/b1/members"]
+
+
+def test_snapshot_response_itself_is_not_cached(monkeypatch):
+    install_fake_trello(monkeypatch, {("GET", "/boards/b1"): SNAPSHOT})
+    call("get_board_snapshot", {"board_id": "b1"})
+    namespace = server._credential_namespace("test-token")
+    assert server.response_cache.key(namespace, "/boards/b1", server.BOARD_SNAPSHOT_PARAMS) \
+        not in server.response_cache._entries
+    # Only the projections stored for the board read tools take cache space
+    assert len(server.response_cache._entries) == 5
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Tests for the incremental board sync engine (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+def snapshot():
+    return {
+        "id": "b1",
+        "name": "Roadmap",
+        "lists": [{"id": "l1", "name": "To Do"}, {"id": "l2", "name": "Done"}],
+        "labels": [{"id": "lab1", "name": "Bug", "color": "red"}, {"id": "lab2", "name": "Docs", "color": "blue"}],
+        "members": [{"id": "m1", "fullName": "Alice Doe", "username": "alice"}],
+        "cards": [
+            {"id": "c1", "name": "Fix bug", "idList": "l1", "idLabels": ["lab1"], "idMembers": [],
+             "due": None, "dueComplete": False, "closed": False},
+            {"id": "c2", "name": "Write docs", "idList": "l1", "idLabels": [], "idMembers": ["m1"],
+             "due": None, "dueComplete": False, "closed": False},
+        ],
+        "actions": [{"id": "a1"}],
+    }
+
+
+class ActionLog:
+    """Route handler serving the actions newer than ``since``, newest first."""
+
+    def __init__(self):
+        self.actions = []  # Oldest first
+        self.requests = []
+
+    def add(self, action_id, kind, **data):
+        self.actions.append({"id": action_id, "type": kind, "data": data})
+
+    def __call__(self, params, json):
+        self.requests.append(params)
+        ids = [action["id"] for action in self.actions]
+        newer = self.actions[ids.index(params["since"]) + 1:] if params["since"] in ids else self.actions
+        return list(reversed(newer))[:int(params["limit"])]
+
+
+def install(monkeypatch, routes=None, **sync_options):
+    log = ActionLog()
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): lambda params, json: snapshot(),
+        ("GET", "/boards/b1/actions"): log,
+        **(routes or {}),
+    }, sync=True)
+    monkeypatch.setattr(server, "board_sync", server.BoardSync(**{"interval": 0.0, **sync_options}))
+    return fake, log
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def test_first_read_takes_one_snapshot(monkeypatch):
+    fake, _ = install(monkeypatch)
+    text = call("list_board_cards", {"board_id": "b1"})
+    assert text == "Cards on board:\n- Fix bug (ID: c1, List: l1)\n- Write docs (ID: c2, List: l1)"
+    assert fake.paths() == ["/boards/b1"]
+    assert fake.calls[0][2]["cards"] == "open"
+
+
+def test_reads_within_interval_are_local(monkeypatch):
+    fake, _ = install(monkeypatch, interval=60.0)
+    call("list_board_cards", {"board_id": "b1"})
+    call("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"})
+    call("list_card_labels", {"card_id": "c1"})
+    assert fake.paths() == ["/boards/b1"]
+    assert server.board_sync.stats()["local_reads"] == 2
+
+
+def test_refresh_applies_actions(monkeypatch):
+    fake, log = install(monkeypatch, {
+        ("GET", "/cards/c3"): {"id": "c3", "name": "New card", "idList": "l2", "idLabels": ["lab2"],
+                               "idMembers": [], "due": None, "dueComplete": False, "closed": False, "idBoard": "b1"},
+    })
+    call("list_board_cards", {"board_id": "b1"})
+    log.add("a2", "updateCard", card={"id": "c1", "idList": "l2"}, old={"idList": "l1"})
+    log.add("a3", "addLabelToCard", card={"id": "c2"}, label={"id": "lab1", "name": "Bug", "color": "red"})
+    log.add("a4", "createCard", card={"id": "c3", "name": "New card"}, list={"id": "l2"})
+    log.add("a5", "commentCard", card={"id": "c3"}, text="hello")
+
+    text = call("list_board_cards", {"board_id": "b1"})
+    assert text == ("Cards on board:\n- Fix bug (ID: c1, List: l2)\n- Write docs (ID: c2, List: l1)"
+                    "\n- New card (ID: c3, List: l2)")
+    assert call("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}) == (
+        "Cards with label Bug:\n- Fix bug (ID: c1, List: l2)\n- Write docs (ID: c2, List: l1)")
+    assert call("list_card_labels", {"card_id": "c3"}) == "Labels on card:\n- Docs (Color: blue, ID: lab2)"
+    assert fake.paths().count("/boards/b1") == 1
+    assert log.requests[0]["since"] == "a1"
+    assert log.requests[-1]["since"] == "a5"
+
+
+def test_archived_and_deleted_cards_leave_the_model(monkeypatch):
+    _, log = install(monkeypatch)
+    call("list_board_cards", {"board_id": "b1"})
+    log.add("a2", "updateCard", card={"id": "c1", "closed": True}, old={"closed": False})
+    log.add("a3", "deleteCard", card={"id": "c2"})
+    assert call("list_board_cards", {"board_id": "b1"}) == "Cards on board:\n"
+
+
+def test_unknown_action_triggers_resync(monkeypatch):
+    fake, log = install(monkeypatch)
+    call("list_board_cards", {"board_id": "b1"})
+    log.add("a2", "addMemberToBoard", idMemberAdded="m2")
+    call("list_board_cards", {"board_id": "b1"})
+    assert fake.paths() == ["/boards/b1", "/boards/b1/actions", "/boards/b1"]
+    assert server.board_sync.stats()["resyncs"] == 1
+
+
+def test_full_page_of_actions_triggers_resync(monkeypatch):
+    fake, log = install(monkeypatch, actions_limit=2)
+    call("list_board_cards", {"board_id": "b1"})
+    log.add("a2", "commentCard", card={"id": "c1"})
+    log.add("a3", "commentCard", card={"id": "c1"})
+    call("list_board_cards", {"board_id": "b1"})
+    assert fake.paths() == ["/boards/b1", "/boards/b1/actions", "/boards/b1"]
+
+
+def test_mutation_marks_board_stale(monkeypatch):
+    fake, log = install(monkeypatch, {
+        ("PUT", "/cards/c1"): {"id": "c1", "name": "Renamed", "idBoard": "b1", "url": "https://trello.com/c/c1"},
+    }, interval=60.0)
+    call("list_board_cards", {"board_id": "b1"})
+    call("update_card", {"card_id": "c1", "name": "Renamed"})
+    log.add("a2", "updateCard", card={"id": "c1", "name": "Renamed"}, old={"name": "Fix bug"})
+    text = call("list_board_cards", {"board_id": "b1"})
+    assert text.startswith("Cards on board:\n- Renamed (ID: c1, List: l1)")
+    assert fake.paths() == ["/boards/b1", "/cards/c1", "/boards/b1/actions"]
+
+
+def test_extra_fields_outside_the_model_bypass_sync(monkeypatch):
+    fake, _ = install(monkeypatch, {
+        ("GET", "/boards/b1/cards"): [{"id": "c1", "name": "Fix bug", "idList": "l1", "url": "https://trello.com/c/c1"}],
+    })
+    call("list_board_cards", {"board_id": "b1", "fields": "url"})
+    assert fake.paths() == ["/boards/b1/cards"]
+
+
+def test_board_named_by_shortlink_is_keyed_by_its_full_id(monkeypatch):
+    fake, log = install(monkeypatch, {
+        ("GET", "/boards/Ab12Cd34"): lambda params, json: snapshot(),
+        ("GET", "/cards/c3"): {"id": "c3", "name": "New card", "idList": "l2", "idLabels": [], "idMembers": [],
+                               "due": None, "dueComplete": False, "closed": False, "idBoard": "b1"},
+        ("PUT", "/cards/c1"): {"id": "c1", "name": "Renamed", "idBoard": "b1", "url": "https://trello.com/c/c1"},
+    })
+    namespace = server._credential_namespace("test-token")
+    call("list_board_cards", {"board_id": "Ab12Cd34"})
+    log.add("a2", "createCard", card={"id": "c3", "name": "New card"}, list={"id": "l2"})
+    # The card reports the board's full id and stays on the board
+    assert call("list_board_cards", {"board_id": "Ab12Cd34"}).endswith("- New card (ID: c3, List: l2)")
+    assert server.board_sync.board_of(namespace, "c3") == "b1"
+    # Webhook deliveries name the board by its full id
+    server.board_sync.push(namespace, "b1", {"id": "a3", "type": "deleteCard", "data": {"card": {"id": "c3"}}})
+    assert server.board_sync.board_of(namespace, "c3") is None
+    # Invalidating by full id drops the snapshot's entries cached under the shortLink
+    def cached_card_listings():
+        return {endpoint for _, endpoint, _ in server.response_cache._entries.values() if endpoint.endswith("/cards")}
+    assert cached_card_listings() == {"/boards/Ab12Cd34/cards", "/boards/b1/cards"}
+    call("update_card", {"card_id": "c1", "name": "Renamed"})
+    assert cached_card_listings() == set()
+    assert fake.paths() == ["/boards/Ab12Cd34", "/boards/b1/actions", "/cards/c3", "/cards/c1"]
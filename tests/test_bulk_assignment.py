@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for the bulk label and member assignment tools (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello, make_response
+
+
+def card(card_id, list_id, labels=(), members=()):
+    return {"id": card_id, "name": f"Card {card_id}", "idList": list_id, "idLabels": list(labels),
+            "idMembers": list(members), "due": None, "dueComplete": False, "closed": False}
+
+
+SNAPSHOT = {
+    "id": "b1", "name": "Sprint",
+    "lists": [{"id": "l1", "name": "To Do"}, {"id": "l2", "name": "Done"}],
+    "labels": [{"id": "lab1", "name": "Bug", "color": "red"}],
+    "members": [{"id": "m1", "fullName": "Alice Doe", "username": "alice"}],
+    "actions": [{"id": "a1"}],
+    "cards": [card("c1", "l1", ["lab1"], ["m1"]), card("c2", "l1"), card("c3", "l1", [], ["m1"]),
+              card("c4", "l2", ["lab1"], ["m1"])],
+}
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def routes(extra=None):
+    return {("GET", "/boards/b1"): SNAPSHOT, **(extra or {})}
+
+
+def test_board_filter_skips_cards_already_labelled(monkeypatch):
+    fake = install_fake_trello(monkeypatch, routes({
+        ("POST", f"/cards/{card_id}/idLabels"): ["lab1"] for card_id in ("c2", "c3")}), sync=True)
+    text = call("add_label_to_cards", {"label_id": "lab1", "board_id": "b1", "filter_list_id": "l1"})
+    assert text == "Added label Bug (lab1) to 2 cards; 1 already had it"
+    assert sorted(fake.paths("POST")) == ["/cards/c2/idLabels", "/cards/c3/idLabels"]
+    assert fake.calls[-1][3] == {"value": "lab1"}
+
+
+def test_remove_member_by_label_filter(monkeypatch):
+    fake = install_fake_trello(monkeypatch, routes({
+        ("DELETE", f"/cards/{card_id}/idMembers/m1"): [] for card_id in ("c1", "c4")}), sync=True)
+    text = call("remove_member_from_cards", {"member_id": "m1", "board_id": "b1", "filter_label_id": "lab1"})
+    assert text == "Removed member Alice Doe (m1) from 2 cards; 0 did not have it"
+    assert sorted(fake.paths("DELETE")) == ["/cards/c1/idMembers/m1", "/cards/c4/idMembers/m1"]
+
+
+def test_explicit_ids_use_synced_state_and_report_failures(monkeypatch):
+    fake = install_fake_trello(monkeypatch, routes({
+        ("POST", "/cards/c2/idMembers"): [],
+        ("POST", "/cards/c9/idMembers"): make_response(404, {"message": "not found"}),
+    }), sync=True)
+    call("list_board_cards", {"board_id": "b1"})
+    text = call("add_member_to_cards", {"member_id": "m1", "card_ids": ["c1", "c2", "c9", "c2"]})
+    assert text == ("Added member Alice Doe (m1) to 1 cards; 1 already had it; 1 failed:\n"
+                    "- c9: Resource not found. Please check the ID.")
+    assert sorted(fake.paths("POST")) == ["/cards/c2/idMembers", "/cards/c9/idMembers"]
+
+
+def test_selection_is_required(monkeypatch):
+    install_fake_trello(monkeypatch, routes())
+    assert call("add_label_to_cards", {"label_id": "lab1"}).startswith("Validation Error: Pass card_ids")
+    assert call("add_label_to_cards", {"label_id": "lab1", "card_ids": ["c1"], "filter_list_id": "l1"}).startswith(
+        "Validation Error: Pass card_ids")
+
+
+def test_cards_known_only_from_the_label_index_are_sent(monkeypatch):
+    # The label index snapshot of board b2 carries no idMembers
+    install_fake_trello(monkeypatch, routes({
+        ("GET", "/boards/b2/cards"): [{"id": "c7", "name": "Card c7", "idList": "l7", "idLabels": ["lab7"]}],
+        ("GET", "/labels/lab7"): {"id": "lab7", "name": "Ops", "color": "blue"},
+        ("DELETE", "/cards/c1/idMembers/m1"): [],
+        ("DELETE", "/cards/c7/idMembers/m1"): [],
+    }))
+    call("filter_cards_by_label", {"board_id": "b2", "label_id": "lab7"})
+    monkeypatch.setattr(server, "board_sync", server.BoardSync(enabled=True))
+    call("list_board_cards", {"board_id": "b1"})
+    fake = server.transport
+    fake.calls.clear()
+    text = call("remove_member_from_cards", {"member_id": "m1", "card_ids": ["c1", "c2", "c7"]})
+    assert text == "Removed member Alice Doe (m1) from 2 cards; 1 did not have it"
+    assert sorted(fake.paths("DELETE")) == ["/cards/c1/idMembers/m1", "/cards/c7/idMembers/m1"]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for the bulk card tools (no Trello access needed)."""
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello, make_response
+from mcp.server.lowlevel.server import request_ctx
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def create_route(params, body):
+    if body["name"] == "Broken":
+        return make_response(400, {"message": "invalid value for idList"})
+    return {"id": f"new{body['name'][-1]}", "idBoard": "b1", "url": "https://trello.com/c/x", **body}
+
+
+def test_create_cards_runs_concurrently_and_reports_each_card(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("POST", "/cards"): create_route}, delay=0.05)
+    monkeypatch.setattr(server, "BULK_CONCURRENCY", 4)
+    cards = [{"list_id": "l1", "name": f"Task {i}"} for i in range(1, 9)]
+    cards[2] = {"list_id": "l1", "name": "Task 3", "desc": "Details", "labels": ["lab1", "lab2"], "members": ["m1"]}
+    started = time.monotonic()
+    text = call("create_cards", {"cards": cards})
+    elapsed = time.monotonic() - started
+    assert text.splitlines()[:4] == [
+        "Created 8 of 8 cards:", "| # | Name | List | Result |", "|---|---|---|---|", "| 1 | Task 1 | l1 | ID: new1 |"]
+    assert elapsed < 8 * 0.05
+    assert fake.calls[2][3] == {"idList": "l1", "name": "Task 3", "desc": "Details",
+                                "idLabels": "lab1,lab2", "idMembers": "m1"}
+
+
+def test_partial_failure_is_reported_per_card(monkeypatch):
+    install_fake_trello(monkeypatch, {("POST", "/cards"): create_route})
+    text = call("create_cards", {"cards": [{"list_id": "l1", "name": "Task 1"},
+                                           {"list_id": "l1", "name": "Broken"}]})
+    assert text.splitlines()[0] == "Created 1 of 2 cards:"
+    assert text.splitlines()[-1] == "| 2 | Broken | l1 | Failed: API request failed (status 400). |"
+
+
+def test_invalid_specs_are_rejected_before_any_request(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("POST", "/cards"): create_route})
+    assert call("create_cards", {"cards": []}) == "Validation Error: cards must be a non-empty array"
+    text = call("create_cards", {"cards": [{"list_id": "l1", "name": "Ok"}, {"list_id": "bad id!", "name": "x"}]})
+    assert text.startswith("Validation Error: Card 2: Invalid List ID format")
+    assert fake.calls == []
+
+
+def test_progress_is_reported_when_requested(monkeypatch):
+    install_fake_trello(monkeypatch, {("POST", "/cards"): create_route})
+    sent = []
+
+    class Session:
+        async def send_progress_notification(self, token, progress, total, message):
+            sent.append((token, progress, total))
+
+    reset = request_ctx.set(SimpleNamespace(meta=SimpleNamespace(progressToken="p1"), session=Session()))
+    try:
+        call("create_cards", {"cards": [{"list_id": "l1", "name": f"Task {i}"} for i in range(3)]})
+    finally:
+        request_ctx.reset(reset)
+    assert sent == [("p1", 1, 3), ("p1", 2, 3), ("p1", 3, 3)]
+
+
+def update_route(params, body):
+    return {"id": "c", "idBoard": "b1", "name": body.get("name", "Card"), **body}
+
+
+SNAPSHOT = {
+    "id": "b1", "name": "Sprint",
+    "lists": [{"id": "l1", "name": "Doing"}, {"id": "l2", "name": "Done"}],
+    "labels": [], "members": [], "actions": [{"id": "a1"}],
+    "cards": [{"id": f"c{i}", "name": f"Card {i}", "idList": "l1", "idLabels": [], "idMembers": [],
+               "due": None, "dueComplete": False, "closed": False} for i in range(1, 4)],
+}
+
+
+def test_update_cards_merges_changes_per_card(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("PUT", "/cards/c1"): update_route, ("PUT", "/cards/c2"): update_route})
+    text = call("update_cards", {"updates": [
+        {"card_id": "c1", "name": "Renamed"},
+        {"card_id": "c2", "list_id": "l2"},
+        {"card_id": "c1", "desc": "Details", "list_id": "l2"},
+    ]})
+    assert fake.paths("PUT") == ["/cards/c1", "/cards/c2"]
+    assert fake.calls[0][3] == {"name": "Renamed", "desc": "Details", "idList": "l2"}
+    assert text.splitlines() == [
+        "Updated 2 of 2 cards:", "| Card | Changes | Result |", "|---|---|---|",
+        "| c1 | name, desc, list -> l2 | Updated: Renamed |",
+        "| c2 | list -> l2 | Updated: Card |",
+    ]
+
+
+def test_moving_a_whole_list_uses_move_all_cards(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): SNAPSHOT,
+        ("GET", "/lists/l1/cards"): [{"id": "c1"}, {"id": "c2"}, {"id": "c3"}],
+        ("POST", "/lists/l1/moveAllCards"): [],
+    }, sync=True)
+    call("list_board_cards", {"board_id": "b1"})
+    text = call("update_cards", {"updates": [{"card_id": f"c{i}", "list_id": "l2"} for i in range(1, 4)]})
+    assert fake.paths() == ["/boards/b1", "/lists/l1/cards", "/lists/l1/moveAllCards"]
+    assert fake.calls[-1][3] == {"idBoard": "b1", "idList": "l2"}
+    assert text.splitlines()[0] == "Updated 3 of 3 cards (3 moved with 1 moveAllCards request):"
+    assert text.splitlines()[-1] == "| c3 | list -> l2 | Moved with list l1 |"
+
+
+def test_partial_list_move_falls_back_to_card_updates(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): SNAPSHOT,
+        ("GET", "/lists/l1/cards"): [{"id": "c1"}, {"id": "c2"}, {"id": "c3"}, {"id": "c4"}],
+        **{("PUT", f"/cards/c{i}"): update_route for i in range(1, 4)},
+    }, sync=True)
+    call("list_board_cards", {"board_id": "b1"})
+    text = call("update_cards", {"updates": [{"card_id": f"c{i}", "list_id": "l2"} for i in range(1, 4)]})
+    assert sorted(fake.paths("PUT")) == ["/cards/c1", "/cards/c2", "/cards/c3"]
+    assert "/lists/l1/moveAllCards" not in fake.paths()
+    assert text.splitlines()[0] == "Updated 3 of 3 cards:"
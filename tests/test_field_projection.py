@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Tests for field projection on the read tools (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+def test_list_board_cards_requests_only_rendered_fields(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): [{"id": "c1", "name": "Fix bug", "idList": "l1"}],
+    })
+    result = asyncio.run(server.call_tool("list_board_cards", {"board_id": "b1"}))
+    assert result[0].text == "Cards on board:\n- Fix bug (ID: c1, List: l1)"
+    assert fake.calls[0][2] == {"fields": "name,idList"}
+
+
+def test_extra_fields_are_requested_and_rendered(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): [{"id": "c1", "name": "Fix bug", "idList": "l1", "due": "2026-01-01"}],
+    })
+    result = asyncio.run(server.call_tool("list_board_cards", {"board_id": "b1", "fields": "due,closed"}))
+    assert result[0].text == "Cards on board:\n- Fix bug (ID: c1, List: l1) | due: 2026-01-01, closed: N/A"
+    assert fake.calls[0][2] == {"fields": "name,idList,due,closed"}
+
+
+def test_invalid_fields_are_rejected(monkeypatch):
+    fake = install_fake_trello(monkeypatch)
+    result = asyncio.run(server.call_tool("list_boards", {"fields": "name&token=x"}))
+    assert result[0].text.startswith("Validation Error:")
+    assert fake.calls == []
+
+
+def test_every_projected_tool_accepts_fields():
+    tools = {tool.name: tool for tool in asyncio.run(server.list_tools())}
+    for name in server.TOOL_FIELDS:
+        assert "fields" in tools[name].inputSchema["properties"], name
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Tests for serving several MCP sessions over streamable HTTP (no Trello access needed)."""
+import asyncio
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pytest
+from starlette.testclient import TestClient
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import FakeTransport, install_fake_trello
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+class Session:
+    """Minimal MCP client speaking streamable HTTP through a TestClient."""
+
+    def __init__(self, client, headers=None):
+        self.client = client
+        self.headers = {**HEADERS, **(headers or {})}
+        self.next_id = 1
+        result = self.request("initialize", {"protocolVersion": "2025-06-18", "capabilities": {},
+                                             "clientInfo": {"name": "test", "version": "1.0"}})
+        assert result["serverInfo"]["name"] == "trello-mcp-server"
+        self.notify("notifications/initialized")
+
+    def post(self, message):
+        response = self.client.post(server.MCP_PATH, json=message, headers=self.headers)
+        assert response.status_code in (200, 202), response.text
+        if "mcp-session-id" in response.headers:
+            self.headers["mcp-session-id"] = response.headers["mcp-session-id"]
+        return response
+
+    def request(self, method, params=None):
+        message_id, self.next_id = self.next_id, self.next_id + 1
+        response = self.post({"jsonrpc": "2.0", "id": message_id, "method": method, "params": params or {}})
+        for line in response.text.splitlines():
+            if line.startswith("data:"):
+                message = json.loads(line[len("data:"):])
+                if message.get("id") == message_id:
+                    return message["result"]
+        raise AssertionError(f"No response to {method}: {response.text}")
+
+    def notify(self, method):
+        self.post({"jsonrpc": "2.0", "method": method})
+
+    def call(self, name, arguments):
+        return self.request("tools/call", {"name": name, "arguments": arguments})["content"][0]["text"]
+
+
+@pytest.fixture
+def client():
+    with TestClient(server.build_http_app("127.0.0.1"), base_url="http://127.0.0.1:8000") as client:
+        yield client
+
+
+def test_sessions_share_caches(monkeypatch, client):
+    fake = install_fake_trello(monkeypatch, {("GET", "/members/me/boards"): [{"id": "b1", "name": "Roadmap"}]})
+    first, second = Session(client), Session(client)
+    assert first.headers["mcp-session-id"] != second.headers["mcp-session-id"]
+    assert len(second.request("tools/list")["tools"]) == len(server.TOOL_REGISTRY)
+    assert "Roadmap" in first.call("list_boards", {})
+    assert "Roadmap" in second.call("list_boards", {})
+    # The second session is answered from the response cache the first one filled
+    assert fake.paths() == ["/members/me/boards"]
+
+
+def test_foreign_host_header_is_rejected(client):
+    response = client.post(server.MCP_PATH, json={}, headers={**HEADERS, "Host": "evil.example:8000"})
+    assert response.status_code == 421
+
+
+@pytest.fixture
+def tenant_pools(monkeypatch):
+    """Give every new connection pool its own FakeTransport and collect them."""
+    pools = []
+
+    def make_pool():
+        pools.append(FakeTransport({("GET", "/members/me/boards"): [{"id": "b1", "name": "Roadmap"}]}))
+        return pools[-1]
+    install_fake_trello(monkeypatch)
+    monkeypatch.setattr(server, "TrelloTransport", make_pool)
+    monkeypatch.setattr(server, "_tenant_transports", OrderedDict())
+    monkeypatch.setattr(server, "_tenant_executors", OrderedDict())
+    monkeypatch.setattr(server, "rate_limiter", server.RateLimiter())
+    return pools
+
+
+def test_tenants_get_their_own_pool_cache_and_budget(client, tenant_pools):
+    alice = Session(client, {"X-Trello-Token": "alice-token"})
+    bob = Session(client, {"X-Trello-Token": "bob-token", "X-Trello-Api-Key": "bob-key"})
+    for session in (alice, bob, alice):
+        assert "Roadmap" in session.call("list_boards", {})
+    # One pool per token; Bob's call was not answered from Alice's cached response
+    assert [pool.paths() for pool in tenant_pools] == [["/members/me/boards"], ["/members/me/boards"]]
+    assert "budget left: token 99, key 299" in bob.call("get_api_stats", {})
+    assert ("token", "alice-token") in server.rate_limiter._buckets
+    assert ("key", "bob-key") in server.rate_limiter._buckets
+
+
+def test_session_keeps_its_identity_without_headers(client, tenant_pools):
+    alice = Session(client, {"X-Trello-Token": "alice-token"})
+    alice.call("list_boards", {})
+    del alice.headers["X-Trello-Token"]
+    alice.call("get_board", {"board_id": "b1"})
+    assert [pool.paths() for pool in tenant_pools] == [["/members/me/boards", "/boards/b1"]]
+
+
+def test_required_token_is_enforced(monkeypatch, client, tenant_pools):
+    monkeypatch.setattr(server, "MCP_REQUIRE_TOKEN", True)
+    assert Session(client).call("list_boards", {}).startswith("Error: This server requires your own Trello token")
+    assert "Roadmap" in Session(client, {"X-Trello-Token": "alice-token"}).call("list_boards", {})
+
+
+def test_least_recently_used_tenant_pools_are_dropped_without_closing(monkeypatch, tenant_pools):
+    monkeypatch.setattr(server, "TENANT_POOLS_MAX", 2)
+    closed = []
+    monkeypatch.setattr(FakeTransport, "close", lambda pool: closed.append(pool), raising=False)
+    first = server.get_transport("token-1")
+    second = server.get_transport("token-2")
+    assert server.get_transport("token-1") is first
+    server.get_transport("token-3")
+    assert second not in server._tenant_transports.values()
+    # A request still holding the dropped pool can finish on it
+    assert closed == []
+    assert second.request("GET", f"{server.TRELLO_API_BASE}/members/me/boards").ok
+    assert server.get_transport("token-2") is not second
+    assert server.get_transport("test-token") is server.transport
+
+
+def test_tenant_with_every_worker_busy_does_not_delay_another(tenant_pools):
+    release = threading.Event()
+    server.get_transport("alice-token").routes[("GET", "/boards/b1")] = \
+        lambda params, json: release.wait(5) and {"id": "b1"}
+
+    def fetch(endpoint, token):
+        return server._request_with_retries("GET", endpoint, None, None, "test-key", token)
+
+    async def scenario():
+        slow = [asyncio.ensure_future(fetch("/boards/b1", "alice-token")) for _ in range(server.POOL_MAXSIZE + 1)]
+        await asyncio.sleep(0.05)
+        try:
+            payload, _ = await asyncio.wait_for(fetch("/members/me/boards", "bob-token"), 2)
+        finally:
+            release.set()
+        await asyncio.gather(*slow)
+        return payload
+    assert asyncio.run(scenario()) == [{"id": "b1", "name": "Roadmap"}]
+    assert len(server._tenant_executors) == 2
+
+
+def test_required_token_mode_starts_without_server_credentials(monkeypatch, tenant_pools):
+    served = []
+
+    async def serve(host, port):
+        served.append((host, port))
+    monkeypatch.setattr(server, "serve_http", serve)
+    monkeypatch.setattr(server, "MCP_REQUIRE_TOKEN", True)
+    monkeypatch.setattr(server, "WEBHOOK_PORT", 0)
+    monkeypatch.setattr(server.auth, "api_key", None)
+    monkeypatch.setattr(server.auth, "token", None)
+    monkeypatch.delenv("TRELLO_API_KEY", raising=False)
+    monkeypatch.setattr(server, "authorization", server.BackgroundAuthorization())
+    asyncio.run(server.main("http", "0.0.0.0", 8000))
+    assert served == [("0.0.0.0", 8000)]
+    assert server.authorization.future is None
+
+
+def test_http_off_loopback_requires_client_tokens(monkeypatch):
+    async def serve(host, port):
+        raise AssertionError("served without TRELLO_MCP_REQUIRE_TOKEN")
+    monkeypatch.setattr(server, "serve_http", serve)
+    monkeypatch.setattr(server, "MCP_REQUIRE_TOKEN", False)
+    with pytest.raises(SystemExit):
+        asyncio.run(server.main("http", "0.0.0.0", 8000))
+
+
+def test_client_token_without_any_api_key_is_rejected(monkeypatch, client, tenant_pools):
+    monkeypatch.setattr(server.auth, "api_key", None)
+    text = Session(client, {"X-Trello-Token": "alice-token"}).call("list_boards", {})
+    assert text.startswith("Error: This server has no Trello API key")
+    assert "Roadmap" in Session(client, {"X-Trello-Token": "alice-token", "X-Trello-Api-Key": "alice-key"}).call(
+        "list_boards", {})
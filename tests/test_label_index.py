@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for the per-board label index (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+CARDS = [
+    {"id": "c1", "name": "Fix bug", "idList": "l1", "idLabels": ["lab1"]},
+    {"id": "c2", "name": "Write docs", "idList": "l2", "idLabels": []},
+]
+LABELS = [
+    {"id": "lab1", "name": "Bug", "color": "red"},
+    {"id": "lab2", "name": "Docs", "color": "blue"},
+]
+
+
+def board_routes(extra: dict = None):
+    return {
+        ("GET", "/boards/b1/cards"): CARDS,
+        ("GET", "/boards/b1/labels"): LABELS,
+        **(extra or {}),
+    }
+
+
+def call(*calls):
+    async def scenario():
+        return [await server.call_tool(name, arguments) for name, arguments in calls]
+    return [result[0].text for result in asyncio.run(scenario())]
+
+
+def test_second_filter_needs_no_requests(monkeypatch):
+    fake = install_fake_trello(monkeypatch, board_routes())
+    texts = call(
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab2"}),
+    )
+    assert texts[0] == "Cards with label Bug:\n- Fix bug (ID: c1, List: l1)"
+    assert texts[1] == "Cards with label Docs:\n(No cards found)"
+    assert fake.paths() == ["/batch"]
+
+
+def test_add_card_label_sends_only_the_post(monkeypatch):
+    fake = install_fake_trello(monkeypatch, board_routes({
+        ("POST", "/cards/c2/idLabels"): ["lab2"],
+    }))
+    texts = call(
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+        ("add_card_label", {"card_id": "c2", "label_id": "lab2"}),
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab2"}),
+    )
+    assert texts[1] == "Added label to card: Write docs\nLabel: Docs (blue)\nCard ID: c2"
+    assert texts[2] == "Cards with label Docs:\n- Write docs (ID: c2, List: l2)"
+    assert fake.paths() == ["/batch", "/cards/c2/idLabels"]
+
+
+def test_add_card_label_fetches_what_the_index_lacks(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("POST", "/cards/c1/idLabels"): ["lab1"],
+        ("GET", "/cards/c1"): {"id": "c1", "name": "Fix bug", "idBoard": "b1"},
+        ("GET", "/labels/lab1"): {"id": "lab1", "name": "Bug", "color": "red", "idBoard": "b1"},
+    })
+    texts = call(("add_card_label", {"card_id": "c1", "label_id": "lab1"}))
+    assert texts[0] == "Added label to card: Fix bug\nLabel: Bug (red)\nCard ID: c1"
+    assert sorted(fake.paths()) == ["/batch", "/cards/c1/idLabels"]
+    assert server.label_index.label(server._credential_namespace("test-token"), "lab1")["name"] == "Bug"
+
+
+def test_remove_card_label_updates_snapshot(monkeypatch):
+    fake = install_fake_trello(monkeypatch, board_routes({
+        ("DELETE", "/cards/c1/idLabels/lab1"): {"_value": None},
+    }))
+    texts = call(
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+        ("remove_card_label", {"card_id": "c1", "label_id": "lab1"}),
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+    )
+    assert texts[2] == "Cards with label Bug:\n(No cards found)"
+    assert fake.paths() == ["/batch", "/cards/c1/idLabels/lab1"]
+
+
+def test_other_card_changes_drop_the_snapshot(monkeypatch):
+    fake = install_fake_trello(monkeypatch, board_routes({
+        ("PUT", "/cards/c1"): {"id": "c1", "name": "Fix bug", "idBoard": "b1", "url": "https://trello.com/c/c1"},
+    }))
+    call(
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+        ("update_card", {"card_id": "c1", "name": "Fix bug"}),
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+    )
+    assert fake.paths()[-1] == "/boards/b1/cards"
+
+
+def test_snapshot_expires(monkeypatch):
+    install_fake_trello(monkeypatch, board_routes())
+    monkeypatch.setattr(server, "label_index", server.LabelIndex(card_ttl=0.0))
+    texts = call(
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+        ("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"}),
+    )
+    assert texts[1] == "Cards with label Bug:\n- Fix bug (ID: c1, List: l1)"
+    namespace = server._credential_namespace("test-token")
+    assert server.label_index.cards_with_label(namespace, "b1", "lab1") is None
+
+
+def test_projection_without_label_ids_is_not_a_snapshot():
+    index = server.LabelIndex()
+    index.observe("ns", "/boards/b1/cards", [{"id": "c1", "name": "Fix bug", "idList": "l1"}])
+    assert index.stats()["boards"] == 0
+    assert index.cards_with_label("ns", "b1", "lab1") is None
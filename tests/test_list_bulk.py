@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for the list-level bulk tools (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello, make_response
+
+SNAPSHOT = {
+    "id": "b1", "name": "Sprint",
+    "lists": [{"id": "l1", "name": "Doing"}, {"id": "l2", "name": "Done"}],
+    "labels": [], "members": [], "actions": [{"id": "a1"}],
+    "cards": [{"id": "c1", "name": "Ship it", "idList": "l2", "idLabels": [], "idMembers": [],
+               "due": None, "dueComplete": False, "closed": False}],
+}
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def test_archive_all_cards_resyncs_the_board(monkeypatch):
+    snapshots = [SNAPSHOT, {**SNAPSHOT, "cards": [], "actions": [{"id": "a9"}]}]
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): lambda params, json: snapshots.pop(0),
+        ("POST", "/lists/l2/archiveAllCards"): {},
+    }, sync=True)
+    assert "Ship it" in call("list_board_cards", {"board_id": "b1"})
+    assert call("archive_all_cards", {"list_id": "l2"}) == "Archived all cards in list\nList ID: l2\nBoard ID: b1"
+    assert call("list_board_cards", {"board_id": "b1"}) == "Cards on board:\n"
+    # The board is known from its synced copy; the action log is not replayed
+    assert fake.paths() == ["/boards/b1", "/lists/l2/archiveAllCards", "/boards/b1"]
+
+
+def test_archive_all_cards_invalidates_when_the_board_lookup_fails(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): [{"id": "c1", "name": "Ship it", "idList": "l2"}],
+        ("POST", "/lists/l2/archiveAllCards"): {},
+        ("GET", "/lists/l2"): make_response(404, {"message": "not found"}),
+    })
+    assert "Ship it" in call("list_board_cards", {"board_id": "b1"})
+    assert call("archive_all_cards", {"list_id": "l2"}) == "Archived all cards in list\nList ID: l2"
+    call("list_board_cards", {"board_id": "b1"})
+    assert fake.paths() == ["/boards/b1/cards", "/lists/l2/archiveAllCards", "/lists/l2", "/boards/b1/cards"]
+
+
+def test_move_all_cards_looks_up_the_target_board(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/lists/l1"): {"id": "l1", "idBoard": "b1"},
+        ("GET", "/lists/l9"): {"id": "l9", "idBoard": "b9"},
+        ("GET", "/boards/b1/cards"): [],
+        ("POST", "/lists/l1/moveAllCards"): [],
+    })
+    call("list_board_cards", {"board_id": "b1"})
+    text = call("move_all_cards", {"list_id": "l1", "target_list_id": "l9"})
+    assert text == "Moved all cards from list l1 to list l9\nBoard ID: b9"
+    assert fake.calls[-1][3] == {"idBoard": "b9", "idList": "l9"}
+    call("list_board_cards", {"board_id": "b1"})
+    assert fake.paths().count("/boards/b1/cards") == 2
+
+
+def test_archive_list(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("PUT", "/lists/l1/closed"): {"id": "l1", "name": "Doing", "idBoard": "b1", "closed": True},
+    })
+    assert call("archive_list", {"list_id": "l1"}) == "Archived list: Doing\nID: l1\nBoard ID: b1"
+    assert fake.calls[0][3] == {"value": True}
+
+
+def test_reorder_lists_moves_only_what_it_must(monkeypatch):
+    lists = [{"id": "l1", "name": "To Do", "pos": 100}, {"id": "l2", "name": "Doing", "pos": 200},
+             {"id": "l3", "name": "Done", "pos": 300}]
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/lists"): lists,
+        ("PUT", "/lists/l1"): lambda params, body: {"id": "l1", **body},
+    })
+    text = call("reorder_lists", {"board_id": "b1", "list_ids": ["l2", "l3"]})
+    assert text == ("Lists on board in new order:\n- Doing (ID: l2)\n- Done (ID: l3)\n- To Do (ID: l1)\n"
+                    "(1 lists moved)")
+    assert fake.paths("PUT") == ["/lists/l1"]
+    assert fake.calls[-1][3] == {"pos": 300 + server.LIST_POS_STEP}
+    assert call("reorder_lists", {"board_id": "b1", "list_ids": ["l7"]}) == (
+        "Validation Error: Not an open list on this board: l7")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for the member directory (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+ALICE = {"id": "m1", "fullName": "Alice Doe", "username": "alice"}
+
+
+@pytest.fixture(autouse=True)
+def directory(monkeypatch):
+    directory = server.MemberDirectory()
+    monkeypatch.setattr(server, "member_directory", directory)
+    return directory
+
+
+def test_add_board_member_uses_members_from_put_response(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("PUT", "/boards/b1/members/m1"): {"id": "b1", "members": [ALICE]},
+    })
+    result = asyncio.run(server.call_tool("add_board_member", {"board_id": "b1", "member_id": "m1"}))
+    assert result[0].text == "Added member to board: Alice Doe (@alice)\nPermission: normal"
+    assert fake.paths() == ["/boards/b1/members/m1"]
+
+
+def test_update_board_member_uses_earlier_listing(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/members"): [ALICE],
+        ("PUT", "/boards/b1/members/m1"): {"id": "b1"},
+    })
+
+    async def scenario():
+        await server.call_tool("list_board_members", {"board_id": "b1"})
+        return await server.call_tool("update_board_member", {"board_id": "b1", "member_id": "m1", "type": "admin"})
+    result = asyncio.run(scenario())
+
+    assert result[0].text == "Updated member permission: Alice Doe (@alice)\nNew permission: admin"
+    assert fake.paths() == ["/boards/b1/members", "/boards/b1/members/m1"]
+
+
+def test_unknown_member_is_fetched(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("PUT", "/boards/b1/members/m1"): {"id": "b1"},
+        ("GET", "/members/m1"): ALICE,
+    })
+    result = asyncio.run(server.call_tool("add_board_member", {"board_id": "b1", "member_id": "m1"}))
+    assert "Alice Doe (@alice)" in result[0].text
+    assert fake.paths() == ["/boards/b1/members/m1", "/members/m1"]
+
+
+def test_card_payloads_feed_the_directory(directory):
+    directory.observe("ns", [{"id": "c1", "name": "Card", "members": [ALICE]}])
+    assert directory.get("ns", "alice") == ALICE
+    assert directory.get("other", "m1") is None
+
+
+def test_username_change_is_tracked(directory):
+    directory.remember("ns", ALICE)
+    directory.remember("ns", {**ALICE, "username": "alice2"})
+    assert directory.get("ns", "alice") is None
+    assert directory.get("ns", "alice2")["username"] == "alice2"
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for paginated listings and the response size budget (no Trello access needed)."""
+import asyncio
+import os
+import re
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+CARDS = [{"id": f"c{i}", "name": f"Card {i}", "idList": "l1"} for i in range(10)]
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def card_ids(text):
+    return re.findall(r"ID: (c\d+)", text)
+
+
+def next_cursor(text):
+    match = re.search(r"cursor: (\S+)\)$", text)
+    return match.group(1) if match else None
+
+
+def test_small_listing_is_unchanged(monkeypatch):
+    install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): CARDS[:2]})
+    assert call("list_board_cards", {"board_id": "b1"}) == (
+        "Cards on board:\n- Card 0 (ID: c0, List: l1)\n- Card 1 (ID: c1, List: l1)")
+
+
+def test_limit_and_cursor_walk_the_listing(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): CARDS})
+    seen, cursor = [], None
+    while True:
+        arguments = {"board_id": "b1", "limit": 4, **({"cursor": cursor} if cursor else {})}
+        text = call("list_board_cards", arguments)
+        seen += card_ids(text)
+        cursor = next_cursor(text)
+        if cursor is None:
+            break
+    assert seen == [card["id"] for card in CARDS]
+    assert "(Showing 1-4 of 10." in call("list_board_cards", {"board_id": "b1", "limit": 4})
+    # Later pages come from the cached listing
+    assert fake.paths() == ["/boards/b1/cards"]
+
+
+def test_response_budget_truncates_with_cursor(monkeypatch):
+    install_fake_trello(monkeypatch, {("GET", "/organizations/o1/members"): [
+        {"id": f"m{i}", "fullName": f"Member {i}", "username": f"member{i}"} for i in range(50)
+    ]})
+    monkeypatch.setattr(server, "MAX_RESPONSE_CHARS", 200)
+    text = call("list_organization_members", {"org_id": "o1"})
+    assert len(text) < 350
+    assert "(Showing 1-" in text and next_cursor(text)
+    rest = call("list_organization_members", {"org_id": "o1", "cursor": next_cursor(text)})
+    first_on_next_page = re.search(r"ID: (m\d+)", rest).group(1)
+    assert first_on_next_page == f"m{len(re.findall('ID: m', text))}"
+
+
+def test_cursor_follows_its_item_when_the_listing_changes(monkeypatch):
+    listing = list(CARDS)
+    install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): lambda params, json: listing})
+    text = call("list_board_cards", {"board_id": "b1", "limit": 3})
+    server.response_cache.clear()
+    del listing[0]
+    assert card_ids(call("list_board_cards", {"board_id": "b1", "limit": 3, "cursor": next_cursor(text)})) == [
+        "c3", "c4", "c5"]
+
+
+def test_invalid_arguments_are_rejected(monkeypatch):
+    install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): CARDS})
+    assert call("list_board_cards", {"board_id": "b1", "limit": 0}).startswith("Validation Error: Invalid limit")
+    assert call("list_board_cards", {"board_id": "b1", "cursor": "!!"}).startswith("Validation Error: Invalid cursor")
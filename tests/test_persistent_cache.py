@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for the on-disk Trello response cache (no Trello access needed)."""
+import asyncio
+import os
+import sqlite3
+import stat
+import sys
+
+import pytest
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+@pytest.fixture
+def disk(tmp_path, monkeypatch):
+    cache = server.PersistentCache(path=tmp_path / "cache.sqlite3", max_bytes=1024)
+    monkeypatch.setattr(server, "persistent_cache", cache)
+    yield cache
+    cache.close()
+
+
+def key(endpoint, namespace="ns"):
+    return server.ResponseCache.key(namespace, endpoint, {"fields": "name"})
+
+
+def test_round_trip_and_versioning(disk):
+    disk.put(key("/boards/b1"), b'{"name": "A"}', disk.generation)
+    disk.put(key("/boards/b1"), b'{"name": "B"}', disk.generation)
+    body, age = disk.get(key("/boards/b1"))
+    assert body == b'{"name": "B"}'
+    assert age >= 0
+    version = disk._db.execute("SELECT version FROM entries").fetchone()[0]
+    assert version == 2
+
+
+def test_file_is_private(disk):
+    assert stat.S_IMODE(os.stat(disk.path).st_mode) == 0o600
+
+
+def test_namespaces_are_separate(disk):
+    disk.put(key("/boards/b1", "alice"), b"{}", disk.generation)
+    assert disk.get(key("/boards/b1", "bob")) is None
+
+
+def test_size_limit_evicts_least_recently_used(disk):
+    disk.put(key("/boards/b1"), b"x" * 400, disk.generation)
+    disk.put(key("/boards/b2"), b"y" * 400, disk.generation)
+    disk.get(key("/boards/b1"))
+    disk.put(key("/boards/b3"), b"z" * 400, disk.generation)
+    assert disk.get(key("/boards/b2")) is None
+    assert disk.get(key("/boards/b1")) is not None
+
+
+def test_schema_change_discards_entries(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = server.PersistentCache(path=path)
+    cache.put(key("/boards/b1"), b"{}", cache.generation)
+    cache.close()
+    db = sqlite3.connect(str(path))
+    db.execute("PRAGMA user_version = 0")
+    db.commit()
+    db.close()
+    cache = server.PersistentCache(path=path)
+    assert cache.get(key("/boards/b1")) is None
+    cache.close()
+
+
+def test_invalidation_removes_matching_entries(disk):
+    disk.put(key("/boards/b1/lists"), b"[]", disk.generation)
+    disk.put(key("/boards/b2/lists"), b"[]", disk.generation)
+    disk.invalidate("ns", ("/boards/b1",))
+    assert disk.get(key("/boards/b1/lists")) is None
+    assert disk.get(key("/boards/b2/lists")) is not None
+
+
+def test_server_invalidation_hides_entries_and_deletes_off_the_event_loop(disk, monkeypatch):
+    queued = []
+
+    class Executor:
+        def submit(self, fn, *args):
+            queued.append((fn, args))
+    monkeypatch.setattr(server, "_request_executor", Executor())
+    generation = disk.generation
+    disk.put(key("/boards/b1/lists"), b"[]", generation)
+    server._invalidate_namespace("ns", ("/boards/b1",))
+    # Hidden and protected from late puts before the rows are deleted
+    assert disk.get(key("/boards/b1/lists")) is None
+    disk.put(key("/boards/b1/lists"), b"[1]", generation)
+    assert disk.stats()["entries"] == 1
+    assert [fn for fn, _ in queued] == [disk.finish_invalidate]
+    for fn, args in queued:
+        fn(*args)
+    assert disk.stats()["entries"] == 0
+    disk.put(key("/boards/b1/lists"), b"[]", disk.generation)
+    assert disk.get(key("/boards/b1/lists")) is not None
+
+
+def test_restart_answers_from_disk_and_revalidates(disk, monkeypatch):
+    lists = [{"id": "l1", "name": "To Do"}]
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1/lists"): lambda params, json: lists})
+
+    async def first_session():
+        await server.call_tool("list_board_lists", {"board_id": "b1"})
+        await asyncio.sleep(0.05)  # Let the disk write finish
+    asyncio.run(first_session())
+    assert len(fake.calls) == 1
+
+    # Simulate a restart with an entry older than its TTL
+    disk._db.execute("UPDATE entries SET stored_at = stored_at - 3600")
+    monkeypatch.setattr(server, "response_cache", server.ResponseCache())
+    lists = [{"id": "l1", "name": "Doing"}]
+
+    async def second_session():
+        first = await server.call_tool("list_board_lists", {"board_id": "b1"})
+        await asyncio.gather(*server._background_tasks)
+        second = await server.call_tool("list_board_lists", {"board_id": "b1"})
+        return first, second
+    first, second = asyncio.run(second_session())
+
+    assert first[0].text == "Lists on board:\n- To Do (ID: l1)"
+    assert second[0].text == "Lists on board:\n- Doing (ID: l1)"
+    assert len(fake.calls) == 2
+    assert disk.stats()["revalidations"] == 1
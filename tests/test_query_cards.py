@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for the indexed board mirror and the query_cards tool (no Trello access needed)."""
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+NOW = datetime(2026, 10, 14, 12, 0, tzinfo=timezone.utc)  # A Wednesday
+
+
+def card(card_id, name, list_id, labels=(), members=(), due=None, complete=False):
+    return {"id": card_id, "name": name, "idList": list_id, "idLabels": list(labels), "idMembers": list(members),
+            "due": due, "dueComplete": complete, "closed": False}
+
+
+SNAPSHOT = {
+    "id": "b1",
+    "name": "Roadmap",
+    "lists": [{"id": "l1", "name": "To Do"}, {"id": "l2", "name": "Doing"}],
+    "labels": [{"id": "lab1", "name": "Bug", "color": "red"}, {"id": "lab2", "name": "Urgent", "color": "orange"}],
+    "members": [{"id": "m1", "fullName": "Alice Doe", "username": "alice"},
+                {"id": "m2", "fullName": "Bob Roe", "username": "bob"}],
+    "cards": [
+        card("c1", "Fix login bug", "l1", ["lab1", "lab2"], ["m1"], "2026-10-15T17:00:00.000Z"),
+        card("c2", "Fix logout bug", "l2", ["lab1"], ["m1", "m2"], "2026-10-13T09:00:00.000Z"),
+        card("c3", "Write docs", "l1", [], ["m2"], "2026-10-21T09:00:00.000Z"),
+        card("c4", "Old task", "l2", ["lab2"], [], "2026-10-01T09:00:00.000Z", complete=True),
+        card("c5", "Someday", "l1"),
+    ],
+    "actions": [{"id": "a1"}],
+}
+
+
+def model():
+    return server.BoardModel("b1", SNAPSHOT)
+
+
+def ids(cards):
+    return [card["id"] for card in cards]
+
+
+def query(board, **arguments):
+    return ids(board.query(**server._card_query(board, {"board_id": "b1", **arguments}, now=NOW)))
+
+
+def test_combined_filters_intersect_indexes():
+    board = model()
+    assert query(board, labels="Bug", members="alice") == ["c1", "c2"]
+    assert query(board, labels="Bug", members="alice", lists="To Do") == ["c1"]
+    assert query(board, labels="lab1,Urgent") == ["c1"]
+    assert query(board, labels="lab1,Urgent", label_match="any") == ["c1", "c2", "c4"]
+    assert query(board, members="alice,bob") == ["c2"]
+    assert query(board, name_contains="fix", lists="l1,l2") == ["c1", "c2"]
+
+
+def test_due_windows():
+    board = model()
+    assert query(board, due="this_week") == ["c1", "c2"]
+    assert query(board, due="today") == []
+    assert query(board, due="next_week") == ["c3"]
+    assert query(board, due="overdue") == ["c2"]
+    assert query(board, due="none") == ["c5"]
+    assert query(board, due_after="2026-10-14", due_before="2026-10-22") == ["c1", "c3"]
+    assert query(board, due="this_week", labels="Urgent") == ["c1"]
+
+
+def test_indexes_follow_actions():
+    board = model()
+    assert board.apply({"type": "addLabelToCard", "data": {"card": {"id": "c3"}, "label": {"id": "lab1"}}})
+    assert board.apply({"type": "removeMemberFromCard", "data": {"card": {"id": "c2"}, "idMember": "m1"}})
+    assert board.apply({"type": "updateCard", "data": {"card": {"id": "c5", "due": "2026-10-16T09:00:00.000Z"},
+                                                       "old": {"due": None}}})
+    assert board.apply({"type": "updateCard", "data": {"card": {"id": "c1", "idList": "l2"}, "old": {"idList": "l1"}}})
+    assert board.apply({"type": "deleteLabel", "data": {"label": {"id": "lab2"}}})
+    assert query(board, labels="lab1") == ["c1", "c2", "c3"]
+    assert query(board, members="alice") == ["c1"]
+    assert query(board, lists="l2") == ["c1", "c2", "c4"]
+    assert query(board, due="this_week") == ["c1", "c2", "c5"]
+    assert board.by_label.get("lab2", set()) == set()
+
+
+def test_unknown_names_are_rejected():
+    with pytest.raises(ValueError, match="Unknown label"):
+        server._card_query(model(), {"labels": "Nope"})
+    with pytest.raises(ValueError, match="Invalid due window"):
+        server._card_query(model(), {"due": "someday"})
+
+
+def test_ambiguous_names_are_rejected_with_their_ids():
+    board = server.BoardModel("b1", {**SNAPSHOT, "labels": SNAPSHOT["labels"] + [
+        {"id": "lab3", "name": "bug", "color": "yellow"}], "members": SNAPSHOT["members"] + [
+        {"id": "m3", "fullName": "Alice Doe", "username": "alice2"}, {"id": "m4", "fullName": "Bob", "username": "bobby"}]})
+    with pytest.raises(ValueError, match="Ambiguous label on this board: Bug matches IDs lab1, lab3"):
+        server._card_query(board, {"labels": "Bug"})
+    with pytest.raises(ValueError, match="Ambiguous member on this board: alice doe matches IDs m1, m3"):
+        server._card_query(board, {"members": "alice doe"})
+    # A username is matched before full names, and ids always resolve
+    assert server._card_query(board, {"members": "bob", "labels": "lab3"})["members"] == ("m2",)
+
+
+def test_query_cards_tool(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1"): SNAPSHOT}, sync=True)
+    text = asyncio.run(server.call_tool("query_cards", {"board_id": "b1", "labels": "Bug", "lists": "Doing"}))[0].text
+    assert text == "Cards matching query (1):\n- Fix logout bug (ID: c2, List: Doing, Due: 2026-10-13T09:00:00.000Z)"
+    text = asyncio.run(server.call_tool("query_cards", {"board_id": "b1", "members": "carol"}))[0].text
+    assert text == "Validation Error: Unknown member on this board: carol"
+    assert fake.paths() == ["/boards/b1"]
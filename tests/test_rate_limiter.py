@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for the Trello rate limit scheduler (no Trello access needed)."""
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from server import RateLimiter, TokenBucket
+
+
+def test_bucket_queues_requests_in_order():
+    bucket = TokenBucket(capacity=2, interval=1.0)
+    now = bucket.updated
+    assert bucket.reserve(now) == 0
+    assert bucket.reserve(now) == 0
+    assert abs(bucket.reserve(now) - 0.5) < 1e-9
+    assert abs(bucket.reserve(now) - 1.0) < 1e-9
+
+
+def test_limiter_paces_instead_of_failing():
+    limiter = RateLimiter(per_token=5, per_key=100, interval=0.5)
+
+    async def burst():
+        await asyncio.gather(*(limiter.acquire("key", "token") for _ in range(8)))
+
+    started = time.monotonic()
+    asyncio.run(burst())
+    elapsed = time.monotonic() - started
+
+    stats = limiter.stats()
+    assert stats["requests"] == 8
+    assert stats["delayed"] == 3
+    assert 0.25 < elapsed < 0.6  # Three extra slots at 10 slots/s
+
+
+def test_headers_shrink_budget():
+    limiter = RateLimiter(per_token=100, per_key=300)
+    limiter.observe("key", "token", {
+        "x-rate-limit-api-token-max": "100",
+        "x-rate-limit-api-token-interval-ms": "10000",
+        "x-rate-limit-api-token-remaining": "3",
+        "x-rate-limit-api-key-remaining": "250",
+    })
+    stats = limiter.stats()
+    assert stats["token_remaining"] == 3
+    assert stats["key_remaining"] == 250
+
+
+def test_throttle_drains_budget():
+    limiter = RateLimiter(per_token=100, per_key=300)
+    limiter.throttle("key", "token")
+    stats = limiter.stats()
+    assert stats["throttled"] == 1
+    assert stats["token_remaining"] == 0
+
+
+def test_separate_tokens_have_separate_budgets():
+    limiter = RateLimiter(per_token=1, per_key=100, interval=10.0)
+    asyncio.run(limiter.acquire("key", "token-a"))
+    asyncio.run(limiter.acquire("key", "token-b"))
+    assert limiter.stats()["delayed"] == 0
+
+
+def test_burst_from_one_token_does_not_delay_another():
+    limiter = RateLimiter(per_token=5, per_key=10, interval=0.5)
+
+    async def scenario():
+        burst = [asyncio.ensure_future(limiter.acquire("key", "heavy")) for _ in range(20)]
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        await limiter.acquire("key", "light")
+        waited = time.monotonic() - started
+        await asyncio.gather(*burst)
+        return waited
+
+    # Only the heavy token's first five requests reached the shared key bucket
+    assert asyncio.run(scenario()) < 0.05
+
+
+def test_buckets_of_idle_credentials_are_dropped():
+    limiter = RateLimiter(max_buckets=3)
+    for token in ("a", "b", "c"):
+        asyncio.run(limiter.acquire("key", token))
+    assert list(limiter._buckets) == [("token", "b"), ("token", "c"), ("key", "key")]
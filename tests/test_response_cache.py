@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for the Trello GET response cache (no Trello access needed)."""
+import asyncio
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+def test_repeated_reads_are_served_from_cache(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/lists"): [{"id": "l1", "name": "To Do"}],
+    })
+
+    async def ask_three_times():
+        for _ in range(3):
+            result = await server.call_tool("list_board_lists", {"board_id": "b1"})
+        return result
+    result = asyncio.run(ask_three_times())
+
+    assert result[0].text == "Lists on board:\n- To Do (ID: l1)"
+    assert fake.paths() == ["/boards/b1/lists"]
+    stats = server.response_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_hits_return_independent_copies():
+    cache = server.ResponseCache()
+    key = cache.key("ns", "/boards/b1", None)
+    cache.put(key, b'{"name": "Board"}', cache.generation)
+    first = cache.get(key)
+    first["name"] = "changed"
+    assert cache.get(key) == {"name": "Board"}
+
+
+def test_entries_expire():
+    cache = server.ResponseCache(ttls=[(re.compile(r"^/boards/"), 0.05)])
+    key = cache.key("ns", "/boards/b1", None)
+    cache.put(key, b"{}", cache.generation)
+    assert cache.get(key) == {}
+    time.sleep(0.06)
+    assert cache.get(key) is None
+
+
+def test_lru_eviction_respects_byte_limit():
+    cache = server.ResponseCache(max_bytes=10)
+    keys = [cache.key("ns", f"/boards/b{i}", None) for i in range(3)]
+    cache.put(keys[0], b"[1,2]", cache.generation)
+    cache.put(keys[1], b"[3,4]", cache.generation)
+    cache.get(keys[0])  # Mark b0 as recently used
+    cache.put(keys[2], b"[5,6]", cache.generation)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == [1, 2]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_stale_in_flight_response_is_not_stored():
+    cache = server.ResponseCache()
+    key = cache.key("ns", "/boards/b1/cards", None)
+    generation = cache.generation
+    cache.invalidate("ns", ("/boards/b1",))
+    cache.put(key, b"[]", generation)
+    assert cache.get(key) is None
+
+
+def test_create_card_invalidates_board_card_list(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): [],
+        ("POST", "/cards"): {"id": "c1", "name": "New", "url": "u", "idBoard": "b1"},
+    })
+
+    async def scenario():
+        await server.call_tool("list_board_cards", {"board_id": "b1"})
+        await server.call_tool("create_card", {"list_id": "l1", "name": "New"})
+        await server.call_tool("list_board_cards", {"board_id": "b1"})
+    asyncio.run(scenario())
+
+    assert fake.paths() == ["/boards/b1/cards", "/cards", "/boards/b1/cards"]
+
+
+def test_add_card_label_invalidates_card_labels(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/cards/c1/labels"): [],
+        ("POST", "/cards/c1/idLabels"): ["lab1"],
+        ("GET", "/cards/c1"): {"id": "c1", "name": "Card"},
+        ("GET", "/labels/lab1"): {"id": "lab1", "name": "Bug", "color": "red"},
+    })
+
+    async def scenario():
+        await server.call_tool("list_card_labels", {"card_id": "c1"})
+        await server.call_tool("add_card_label", {"card_id": "c1", "label_id": "lab1"})
+        await server.call_tool("list_card_labels", {"card_id": "c1"})
+    asyncio.run(scenario())
+
+    assert fake.paths("GET").count("/cards/c1/labels") == 2
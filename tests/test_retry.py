@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for retrying transient Trello failures (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+import pytest
+import requests
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello, make_response
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    policy = server.RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.02, deadline=5)
+    monkeypatch.setattr(server, "retry_policy", policy)
+    monkeypatch.setattr(server, "rate_limiter", server.RateLimiter())
+    return policy
+
+
+def sequence(*outcomes):
+    """Route handler returning each outcome in turn (raising exceptions)."""
+    remaining = list(outcomes)
+
+    def handler(params, json):
+        outcome = remaining.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return handler
+
+
+def test_get_retries_server_errors(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): sequence(make_response(503), make_response(502), {"id": "b1"}),
+    })
+    assert asyncio.run(server.make_trello_request_async("GET", "/boards/b1")) == {"id": "b1"}
+    assert len(fake.calls) == 3
+    stats = policy.stats()
+    assert stats["retries"] == 2
+    assert stats["recovered"] == 1
+
+
+def test_get_retries_timeouts(monkeypatch, policy):
+    install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): sequence(requests.exceptions.ReadTimeout(), {"id": "b1"}),
+    })
+    assert asyncio.run(server.make_trello_request_async("GET", "/boards/b1")) == {"id": "b1"}
+    assert policy.stats()["reasons"] == {"timeout": 1}
+
+
+def test_post_is_not_retried_after_server_error(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {
+        ("POST", "/cards"): sequence(make_response(500), {"id": "c1"}),
+    })
+    with pytest.raises(requests.exceptions.HTTPError):
+        asyncio.run(server.make_trello_request_async("POST", "/cards", data={"name": "x"}))
+    assert len(fake.calls) == 1
+
+
+def test_post_is_not_retried_after_read_timeout(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {
+        ("POST", "/cards"): sequence(requests.exceptions.ReadTimeout(), {"id": "c1"}),
+    })
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        asyncio.run(server.make_trello_request_async("POST", "/cards", data={"name": "x"}))
+    assert len(fake.calls) == 1
+
+
+def test_post_is_retried_when_rate_limited(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {
+        ("POST", "/cards"): sequence(make_response(429, headers={"Retry-After": "0"}), {"id": "c1"}),
+    })
+    assert asyncio.run(server.make_trello_request_async("POST", "/cards", data={"name": "x"})) == {"id": "c1"}
+    assert len(fake.calls) == 2
+
+
+def test_post_is_retried_when_connection_was_never_made(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {
+        ("POST", "/cards"): sequence(requests.exceptions.ConnectTimeout(), {"id": "c1"}),
+    })
+    assert asyncio.run(server.make_trello_request_async("POST", "/cards", data={"name": "x"})) == {"id": "c1"}
+    assert len(fake.calls) == 2
+
+
+def test_gives_up_after_max_attempts(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1"): lambda params, json: make_response(503)})
+    with pytest.raises(requests.exceptions.HTTPError):
+        asyncio.run(server.make_trello_request_async("GET", "/boards/b1"))
+    assert len(fake.calls) == 3
+    assert policy.stats()["exhausted"] == 1
+
+
+def test_retry_after_beyond_deadline_gives_up(monkeypatch, policy):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1"): lambda params, json: make_response(429, headers={"Retry-After": "30"}),
+    })
+    with pytest.raises(requests.exceptions.HTTPError):
+        asyncio.run(server.make_trello_request_async("GET", "/boards/b1"))
+    assert len(fake.calls) == 1
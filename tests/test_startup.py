@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for what importing the server loads up front (no Trello access needed)."""
+import json
+import os
+import subprocess
+import sys
+
+# Add parent directory to path to import from root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import server
+
+DEFERRED_MODULES = ["requests", "urllib3", "http.server", "webbrowser", "local_server"]
+
+
+def loaded_after_import():
+    script = f"import json, sys; import server; print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_import_defers_http_client_and_oauth_machinery():
+    assert loaded_after_import() == []
+
+
+def test_auth_and_transport_are_built_on_first_use(monkeypatch):
+    monkeypatch.delitem(vars(server), "auth", raising=False)
+    monkeypatch.delitem(vars(server), "transport", raising=False)
+    monkeypatch.setenv("TRELLO_API_KEY", "key")
+    monkeypatch.setenv("TRELLO_TOKEN", "token")
+    assert "auth" not in vars(server)
+    assert server.auth is server.get_auth()
+    assert server.auth.get_credentials() == ("key", "token")
+    transport = server.get_transport()
+    assert server.transport is transport
+    transport.close()
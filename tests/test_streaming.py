@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for streamed decoding of large card listings (no Trello access needed)."""
+import asyncio
+import json
+import os
+import re
+import sys
+
+import pytest
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+CARDS = [{"id": f"c{i}", "name": f"Card {i} ✓", "idList": "l1", "idLabels": ["lab1"] if i % 3 == 0 else [],
+          "pos": i * 16384.5} for i in range(12)]
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+def test_elements_decode_across_chunk_boundaries(size):
+    payload = [1234567, -2.5e10, "a,b]\"✓", None, True, {"nested": [1, {"x": "]"}]}, [], CARDS[0]]
+    body = json.dumps(payload, indent=2, ensure_ascii=False).encode()
+    assert list(server.iter_json_array(chunked(body, size))) == payload
+
+
+def test_empty_and_malformed_arrays():
+    assert list(server.iter_json_array([b" [ ", b" ]"])) == []
+    with pytest.raises(ValueError):
+        list(server.iter_json_array([b'{"id": "c1"}']))
+    with pytest.raises(ValueError):
+        list(server.iter_json_array([b'[{"id": "c1"} {"id": "c2"}]']))
+    with pytest.raises(ValueError):
+        list(server.iter_json_array([b'[{"id": "c1"}, {"id": ']))
+
+
+def test_streamed_pages_match_buffered_pages(monkeypatch):
+    pages = {}
+    for streaming in (False, True):
+        install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): CARDS})
+        monkeypatch.setattr(server, "STREAM_JSON", streaming)
+        text, seen = call("list_board_cards", {"board_id": "b1", "limit": 5}), []
+        while True:
+            seen.append(text)
+            cursor = re.search(r"cursor: (\S+)\)$", text)
+            if not cursor:
+                break
+            text = call("list_board_cards", {"board_id": "b1", "limit": 5, "cursor": cursor.group(1)})
+        pages[streaming] = seen
+    assert len(pages[True]) == 3
+    assert pages[True] == pages[False]
+
+
+def test_streamed_cursor_follows_its_item(monkeypatch):
+    listing = list(CARDS)
+    install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): lambda params, json: listing})
+    monkeypatch.setattr(server, "STREAM_JSON", True)
+    text = call("list_board_cards", {"board_id": "b1", "limit": 3})
+    cursor = re.search(r"cursor: (\S+)\)$", text).group(1)
+    del listing[0]
+    assert re.findall(r"ID: (c\d+)", call("list_board_cards", {"board_id": "b1", "limit": 3, "cursor": cursor})) == [
+        "c3", "c4", "c5"]
+
+
+def test_streamed_filter_is_not_cached(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): CARDS,
+        ("GET", "/boards/b1/labels"): [{"id": "lab1", "name": "Bug"}],
+    })
+    monkeypatch.setattr(server, "STREAM_JSON", True)
+    for _ in range(2):
+        text = call("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"})
+        assert re.findall(r"ID: (c\d+)", text) == ["c0", "c3", "c6", "c9"]
+    assert fake.paths().count("/boards/b1/cards") == 2
+    assert fake.paths().count("/boards/b1/labels") == 1
+
+
+def test_cached_listing_is_not_streamed(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {("GET", "/boards/b1/cards"): CARDS})
+    call("list_board_cards", {"board_id": "b1"})
+    monkeypatch.setattr(server, "STREAM_JSON", True)
+    assert "ID: c11" in call("list_board_cards", {"board_id": "b1"})
+    assert fake.paths() == ["/boards/b1/cards"]
+
+
+def test_streaming_bypasses_board_sync(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/cards"): CARDS,
+        ("GET", "/boards/b1/labels"): [{"id": "lab1", "name": "Bug"}],
+    }, sync=True)
+    monkeypatch.setattr(server, "STREAM_JSON", True)
+    streamed = []
+    request = server._request_with_retries
+
+    async def record(*args, **kwargs):
+        streamed.append(kwargs.get("consume") is not None)
+        return await request(*args, **kwargs)
+    monkeypatch.setattr(server, "_request_with_retries", record)
+    assert "ID: c11" in call("list_board_cards", {"board_id": "b1"})
+    assert re.findall(r"ID: (c\d+)", call("filter_cards_by_label", {"board_id": "b1", "label_id": "lab1"})) == [
+        "c0", "c3", "c6", "c9"]
+    assert fake.paths() == ["/boards/b1/cards", "/boards/b1/cards", "/boards/b1/labels"]
+    assert streamed[:2] == [True, True]
+    assert server.board_sync.stats()["snapshots"] == 0
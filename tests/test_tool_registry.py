@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the tool registry behind list_tools and call_tool (no Trello access needed)."""
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import server
+from fake_trello import install_fake_trello
+
+
+def call(name, arguments):
+    return asyncio.run(server.call_tool(name, arguments))[0].text
+
+
+def test_tool_list_is_built_once():
+    first = asyncio.run(server.list_tools())
+    assert asyncio.run(server.list_tools()) is first
+    assert [tool.name for tool in first] == list(server.TOOL_REGISTRY)
+    assert set(server.TOOL_FIELDS) <= set(server.TOOL_REGISTRY)
+
+
+def test_validators_follow_each_schema():
+    validators = {name: [key for key, _ in spec.validators] for name, spec in server.TOOL_REGISTRY.items()}
+    assert validators["list_board_cards"] == ["board_id", "fields", "limit", "cursor"]
+    assert validators["add_card_label"] == ["card_id", "label_id"]
+    assert validators["get_api_stats"] == []
+
+
+def test_invalid_arguments_are_rejected_before_any_request(monkeypatch):
+    fake = install_fake_trello(monkeypatch)
+    assert call("add_card_label", {"card_id": "c1", "label_id": "../x"}).startswith(
+        "Validation Error: Invalid Label ID format")
+    assert call("list_boards", {"fields": "name;drop"}).startswith("Validation Error: Invalid fields format")
+    assert fake.calls == []
+
+
+def test_unknown_tool(monkeypatch):
+    install_fake_trello(monkeypatch)
+    assert call("no_such_tool", {}) == "Unknown tool: no_such_tool"
+
+
+def test_create_list_invalidates_board_lists(monkeypatch):
+    fake = install_fake_trello(monkeypatch, {
+        ("GET", "/boards/b1/lists"): [{"id": "l1", "name": "To Do"}],
+        ("POST", "/lists"): {"id": "l2", "name": "Done", "idBoard": "b1"},
+    })
+    call("list_board_lists", {"board_id": "b1"})
+    call("create_list", {"board_id": "b1", "name": "Done"})
+    call("list_board_lists", {"board_id": "b1"})
+    assert fake.paths() == ["/boards/b1/lists", "/lists", "/boards/b1/lists"]
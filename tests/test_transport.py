@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for the pooled keep-alive Trello transport (no Trello access needed)."""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path to import from root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from server import TrelloTransport
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_connections_are_reused():
+    server, base = start_local_server()
+    transport = TrelloTransport(pool_maxsize=2, idle_timeout=60)
+    try:
+        for _ in range(5):
+            assert transport.request("GET", f"{base}/boards").json() == {"ok": True}
+        stats = transport.stats()
+        assert stats["requests"] == 5
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 4
+    finally:
+        transport.close()
+        server.shutdown()
+
+
+def test_idle_pool_is_recycled():
+    server, base = start_local_server()
+    transport = TrelloTransport(pool_maxsize=2, idle_timeout=0)
+    try:
+        transport.request("GET", f"{base}/boards")
+        transport._last_used -= 1  # Pretend the pool sat idle
+        transport.request("GET", f"{base}/boards")
+        stats = transport.stats()
+        assert stats["idle_recycles"] == 1
+        assert stats["requests"] == 2
+        assert stats["new_connections"] == 2
+    finally:
+        transport.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_connections_are_reused()
+    test_idle_pool_is_recycled()
+    print("✓ Transport tests passed")
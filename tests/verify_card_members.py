@@ -45,8 +45,20 @@ def verify_implementation():
         "list_card_members": False
     }
     
+    # Handlers are registered with @tool(Tool(name=...)) in TOOL_REGISTRY
+    registered = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.AsyncFunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if (isinstance(decorator, ast.Call) and getattr(decorator.func, "id", None) == "tool"
+                    and decorator.args and isinstance(decorator.args[0], ast.Call)):
+                for keyword in decorator.args[0].keywords:
+                    if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
+                        registered.add(keyword.value.value)
+
     for handler_name in handlers_found.keys():
-        if f'elif name == "{handler_name}":' in content:
+        if handler_name in registered:
             handlers_found[handler_name] = True
             print(f"✅ Handler found: {handler_name}")
         else: